@@ -148,21 +148,23 @@ type weekBucket struct {
 }
 
 func velocityBuckets(nodes []*models.Node, numWeeks int) []weekBucket {
+	const week = 7 * 24 * time.Hour
 	now := time.Now().UTC()
-	buckets := make([]weekBucket, numWeeks)
+	start := now.AddDate(0, 0, -numWeeks*7)
 
+	buckets := make([]weekBucket, numWeeks)
 	for i := range buckets {
-		weekStart := now.AddDate(0, 0, -(numWeeks-i)*7)
-		weekEnd := weekStart.AddDate(0, 0, 7)
-		buckets[i].label = weekStart.Format("2006-01-02")
-		for _, n := range nodes {
-			if n.Status != models.StatusDone {
-				continue
-			}
-			if n.UpdatedAt.After(weekStart) && !n.UpdatedAt.After(weekEnd) {
-				buckets[i].count++
-			}
+		buckets[i].label = start.Add(time.Duration(i) * week).Format("2006-01-02")
+	}
+
+	// Weeks are contiguous (start, start+7d], so each done item lands in at
+	// most one bucket and a single pass over nodes fills them all.
+	for _, n := range nodes {
+		if n.Status != models.StatusDone || !n.UpdatedAt.After(start) || n.UpdatedAt.After(now) {
+			continue
 		}
+		i := int((n.UpdatedAt.Sub(start) - 1) / week)
+		buckets[i].count++
 	}
 	return buckets
 }
@@ -0,0 +1,38 @@
+package main
+
+import (
+	"testing"
+	"time"
+
+	"github.com/shakestzd/htmlgraph/internal/models"
+)
+
+func TestVelocityBuckets_AssignsEachDoneItemToOneWeek(t *testing.T) {
+	now := time.Now().UTC()
+	day := 24 * time.Hour
+	done := func(age time.Duration) *models.Node {
+		return &models.Node{Status: models.StatusDone, UpdatedAt: now.Add(-age)}
+	}
+	nodes := []*models.Node{
+		done(time.Hour), // this week
+		done(6 * day),   // this week
+		done(10 * day),  // one week back
+		done(27 * day),  // oldest week
+		done(30 * day),  // before the window
+		{Status: models.StatusInProgress, UpdatedAt: now.Add(-time.Hour)},
+	}
+
+	got := velocityBuckets(nodes, 4)
+	want := []int{1, 0, 1, 2}
+	if len(got) != len(want) {
+		t.Fatalf("got %d buckets, want %d", len(got), len(want))
+	}
+	for i, w := range want {
+		if got[i].count != w {
+			t.Errorf("bucket %d (%s) count = %d, want %d", i, got[i].label, got[i].count, w)
+		}
+	}
+	if wantLabel := now.AddDate(0, 0, -28).Format("2006-01-02"); got[0].label != wantLabel {
+		t.Errorf("first label = %q, want %q", got[0].label, wantLabel)
+	}
+}
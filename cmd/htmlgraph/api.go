@@ -11,6 +11,7 @@ import (
 	"time"
 
 	dbpkg "github.com/shakestzd/htmlgraph/internal/db"
+	"github.com/shakestzd/htmlgraph/internal/graph"
 	"github.com/shakestzd/htmlgraph/internal/htmlparse"
 	"github.com/shakestzd/htmlgraph/internal/models"
 )
@@ -28,8 +29,9 @@ func respondJSON(w http.ResponseWriter, v any) {
 func initialStatsHandler(database *sql.DB) http.HandlerFunc {
 	return func(w http.ResponseWriter, r *http.Request) {
 		var totalEvents, totalSessions int
-		database.QueryRow(`SELECT COUNT(*) FROM agent_events`).Scan(&totalEvents)
-		database.QueryRow(`SELECT COUNT(*) FROM sessions`).Scan(&totalSessions)
+		database.QueryRow(`
+			SELECT (SELECT COUNT(*) FROM agent_events),
+			       (SELECT COUNT(*) FROM sessions)`).Scan(&totalEvents, &totalSessions)
 
 		rows, err := database.Query(
 			`SELECT DISTINCT agent_id FROM agent_events ORDER BY agent_id`)
@@ -241,94 +243,98 @@ func featuresFromDB(database *sql.DB) []map[string]any {
 // featuresFromHTML scans .htmlgraph/features/*.html, .htmlgraph/bugs/*.html,
 // .htmlgraph/spikes/*.html, .htmlgraph/tracks/*.html and parses each file.
 func featuresFromHTML(projectDir string) []map[string]any {
-	// Build track title lookup from tracks/*.html first.
-	trackTitles := buildTrackTitles(projectDir)
+	nodes, trackTitles := loadWorkItemsFromHTML(projectDir)
 
-	features := make([]map[string]any, 0, 100)
-	for _, subdir := range []string{"features", "bugs", "spikes", "tracks"} {
-		pattern := filepath.Join(projectDir, subdir, "*.html")
-		files, _ := filepath.Glob(pattern)
-		for _, f := range files {
-			node, err := htmlparse.ParseFile(f)
-			if err != nil || node == nil {
-				continue
+	features := make([]map[string]any, 0, max(len(nodes), 100))
+	for _, node := range nodes {
+		completed := 0
+		for _, s := range node.Steps {
+			if s.Completed {
+				completed++
 			}
-			completed := 0
-			for _, s := range node.Steps {
-				if s.Completed {
-					completed++
-				}
-			}
-			edges := node.Edges
-			if edges == nil {
-				edges = map[string][]models.Edge{}
-			}
-			trackTitle := trackTitles[node.TrackID]
-			features = append(features, map[string]any{
-				"id":              node.ID,
-				"type":            node.Type,
-				"title":           node.Title,
-				"status":          string(node.Status),
-				"priority":        string(node.Priority),
-				"track_id":        node.TrackID,
-				"track_title":     trackTitle,
-				"created_at":      node.CreatedAt.Format(time.RFC3339),
-				"steps_total":     len(node.Steps),
-				"steps_completed": completed,
-				"edges":           edges,
-			})
 		}
+		edges := node.Edges
+		if edges == nil {
+			edges = map[string][]models.Edge{}
+		}
+		features = append(features, map[string]any{
+			"id":              node.ID,
+			"type":            node.Type,
+			"title":           node.Title,
+			"status":          string(node.Status),
+			"priority":        string(node.Priority),
+			"track_id":        node.TrackID,
+			"track_title":     trackTitles[node.TrackID],
+			"created_at":      node.CreatedAt.Format(time.RFC3339),
+			"steps_total":     len(node.Steps),
+			"steps_completed": completed,
+			"edges":           edges,
+		})
 	}
 	return features
 }
 
-// buildTrackTitles parses tracks/*.html and returns a map of track ID -> title.
-func buildTrackTitles(projectDir string) map[string]string {
-	titles := make(map[string]string)
-	pattern := filepath.Join(projectDir, "tracks", "*.html")
-	files, _ := filepath.Glob(pattern)
-	for _, f := range files {
-		node, err := htmlparse.ParseFile(f)
-		if err != nil || node == nil {
+// loadWorkItemsFromHTML loads the features, bugs, spikes and tracks of a
+// project from HTML, plus a track ID → title index. Every directory is listed
+// and every file parsed exactly once; track titles come from the track nodes
+// already loaded rather than a second scan.
+func loadWorkItemsFromHTML(projectDir string) ([]*models.Node, map[string]string) {
+	var nodes []*models.Node
+	trackTitles := make(map[string]string)
+	for _, subdir := range []string{"features", "bugs", "spikes", "tracks"} {
+		loaded, err := graph.LoadDir(filepath.Join(projectDir, subdir))
+		if err != nil {
 			continue
 		}
-		if node.ID != "" {
-			titles[node.ID] = node.Title
+		if subdir == "tracks" {
+			for _, node := range loaded {
+				if node.ID != "" {
+					trackTitles[node.ID] = node.Title
+				}
+			}
 		}
+		nodes = append(nodes, loaded...)
 	}
-	return titles
+	return nodes, trackTitles
 }
 
 // statsHandler returns a summary of counts from the database.
 // Falls back to HTML files for feature counts when SQLite features table is empty.
 func statsHandler(database *sql.DB, projectDir string) http.HandlerFunc {
 	return func(w http.ResponseWriter, r *http.Request) {
-		var total, inProgress, done, todo int
+		var total, inProgress, done, todo, doneToday int
 		var activeSessions, totalEvents int
 
-		database.QueryRow(`SELECT COUNT(*) FROM features`).Scan(&total)
+		// One scan of features yields every per-status count plus done-today,
+		// instead of a separate COUNT(*) query per bucket.
+		database.QueryRow(`
+			SELECT COUNT(*),
+			       COALESCE(SUM(status = 'in-progress'), 0),
+			       COALESCE(SUM(status = 'done'), 0),
+			       COALESCE(SUM(status = 'todo'), 0),
+			       COALESCE(SUM(status = 'done' AND updated_at > datetime('now', '-24 hours')), 0)
+			FROM features`).Scan(&total, &inProgress, &done, &todo, &doneToday)
 
 		if total == 0 {
-			items := featuresFromHTML(projectDir)
-			total = len(items)
-			for _, item := range items {
-				switch item["status"] {
-				case "in-progress":
+			// Tally straight from the parsed nodes; building the full
+			// per-item JSON maps only to read back their status is wasted.
+			nodes, _ := loadWorkItemsFromHTML(projectDir)
+			total = len(nodes)
+			for _, n := range nodes {
+				switch n.Status {
+				case models.StatusInProgress:
 					inProgress++
-				case "done":
+				case models.StatusDone:
 					done++
-				case "todo":
+				case models.StatusTodo:
 					todo++
 				}
 			}
-		} else {
-			database.QueryRow(`SELECT COUNT(*) FROM features WHERE status='in-progress'`).Scan(&inProgress)
-			database.QueryRow(`SELECT COUNT(*) FROM features WHERE status='done'`).Scan(&done)
-			database.QueryRow(`SELECT COUNT(*) FROM features WHERE status='todo'`).Scan(&todo)
 		}
 
-		database.QueryRow(`SELECT COUNT(*) FROM sessions WHERE status='active'`).Scan(&activeSessions)
-		database.QueryRow(`SELECT COUNT(*) FROM agent_events`).Scan(&totalEvents)
+		database.QueryRow(`
+			SELECT (SELECT COUNT(*) FROM sessions WHERE status='active'),
+			       (SELECT COUNT(*) FROM agent_events)`).Scan(&activeSessions, &totalEvents)
 
 		// Live sessions: active with event in last 5 minutes
 		var liveSessions int
@@ -339,11 +345,6 @@ func statsHandler(database *sql.DB, projectDir string) http.HandlerFunc {
 			    WHERE ae.session_id = s.session_id
 			      AND ae.timestamp > datetime('now', '-5 minutes'))`).Scan(&liveSessions)
 
-		// Done today
-		var doneToday int
-		database.QueryRow(`SELECT COUNT(*) FROM features WHERE status='done'
-			AND updated_at > datetime('now', '-24 hours')`).Scan(&doneToday)
-
 		// Errors today
 		var errorsToday int
 		database.QueryRow(`SELECT COUNT(*) FROM agent_events
@@ -89,34 +89,23 @@ func graphAPIHandler(database *sql.DB) http.HandlerFunc {
 			edgeCounts[e.Target]++
 		}
 
-		// Annotate nodes with their edge counts.
-		for i := range nodes {
-			nodes[i].Edges = edgeCounts[nodes[i].ID]
-		}
-
-		// Load activity counts per node from agent_events.
+		// Annotate nodes with their edge and activity counts, dropping
+		// orphans in the same pass unless ?all=true.
 		activityCounts := loadActivityCounts(database)
-		for i := range nodes {
-			nodes[i].Activity = activityCounts[nodes[i].ID]
+		kept := nodes[:0]
+		for _, n := range nodes {
+			n.Edges = edgeCounts[n.ID]
+			n.Activity = activityCounts[n.ID]
+			if includeAll || n.Edges > 0 {
+				kept = append(kept, n)
+			}
 		}
+		nodes = kept
 
-		// Filter orphans unless ?all=true.
 		if !includeAll {
-			filtered := make([]graphNode, 0, len(nodes))
-			for _, n := range nodes {
-				if n.Edges > 0 {
-					filtered = append(filtered, n)
-				}
-			}
-			nodes = filtered
-
-			// Rebuild node set after filtering.
-			nodeSet = make(map[string]struct{}, len(nodes))
-			for _, n := range nodes {
-				nodeSet[n.ID] = struct{}{}
-			}
-
-			// Drop edges whose endpoints are no longer present.
+			// Drop edges whose endpoints are not nodes. The orphans removed
+			// above are never edge endpoints (they have no edges), so the
+			// original nodeSet still answers this without a rebuild.
 			filteredEdges := make([]graphEdge, 0, len(edges))
 			for _, e := range edges {
 				if _, ok := nodeSet[e.Source]; !ok {
@@ -489,16 +478,17 @@ func loadGraphEdges(database *sql.DB) ([]graphEdge, error) {
 	return edges, rows.Err()
 }
 
-// deduplicateEdges removes duplicate (source, target, type) triples.
+// deduplicateEdges removes duplicate (source, target, type) triples. The edge
+// struct itself is the map key, so no "src|dst|type" string is built
+// per edge just to be hashed and thrown away.
 func deduplicateEdges(edges []graphEdge) []graphEdge {
-	seen := make(map[string]struct{}, len(edges))
+	seen := make(map[graphEdge]struct{}, len(edges))
 	result := make([]graphEdge, 0, len(edges))
 	for _, e := range edges {
-		key := e.Source + "|" + e.Target + "|" + e.Type
-		if _, exists := seen[key]; exists {
+		if _, exists := seen[e]; exists {
 			continue
 		}
-		seen[key] = struct{}{}
+		seen[e] = struct{}{}
 		result = append(result, e)
 	}
 	return result
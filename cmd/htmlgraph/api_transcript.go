@@ -15,6 +15,36 @@ import (
 	dbpkg "github.com/shakestzd/htmlgraph/internal/db"
 )
 
+// transcriptMessage is one message in the /api/transcript response. A typed
+// struct rather than a map[string]any per message: up to 2000 messages are
+// returned, and each map carried its own hash table and boxed field values.
+type transcriptMessage struct {
+	ID              int                  `json:"id"`
+	Ordinal         int                  `json:"ordinal"`
+	Role            string               `json:"role"`
+	Content         string               `json:"content"`
+	Timestamp       string               `json:"timestamp"`
+	HasThinking     bool                 `json:"has_thinking"`
+	HasToolUse      bool                 `json:"has_tool_use"`
+	ContentLength   int                  `json:"content_length"`
+	Model           string               `json:"model"`
+	InputTokens     int                  `json:"input_tokens"`
+	OutputTokens    int                  `json:"output_tokens"`
+	CacheReadTokens int                  `json:"cache_read_tokens"`
+	StopReason      string               `json:"stop_reason"`
+	ToolCalls       []transcriptToolCall `json:"tool_calls,omitempty"`
+}
+
+// transcriptToolCall is one tool call nested under its transcriptMessage.
+type transcriptToolCall struct {
+	ToolName          string `json:"tool_name"`
+	Category          string `json:"category"`
+	ToolUseID         string `json:"tool_use_id"`
+	InputJSON         string `json:"input_json"`
+	SubagentSessionID string `json:"subagent_session_id"`
+	SubagentAgentID   string `json:"subagent_agent_id,omitempty"` // Agent calls only
+}
+
 // transcriptHandler returns messages and tool calls for a session.
 // Requires ?session=SESSION_ID. Supports ?limit=N (default 500).
 func transcriptHandler(database *sql.DB, htmlgraphDir string) http.HandlerFunc {
@@ -45,45 +75,50 @@ func transcriptHandler(database *sql.DB, htmlgraphDir string) http.HandlerFunc {
 		}
 
 		// Group tool calls by message ID for easy frontend consumption.
-		toolsByMsg := map[int][]map[string]any{}
+		toolsByMsg := map[int][]transcriptToolCall{}
+		// The lookup depends only on the message, so parallel Agent calls in
+		// one message share a single result (including "no match").
+		agentIDByMsg := map[int]string{}
 		for _, tc := range toolCalls {
-			entry := map[string]any{
-				"tool_name":           tc.ToolName,
-				"category":            tc.Category,
-				"tool_use_id":         tc.ToolUseID,
-				"input_json":          tc.InputJSON,
-				"subagent_session_id": tc.SubagentSessionID,
+			entry := transcriptToolCall{
+				ToolName:          tc.ToolName,
+				Category:          tc.Category,
+				ToolUseID:         tc.ToolUseID,
+				InputJSON:         tc.InputJSON,
+				SubagentSessionID: tc.SubagentSessionID,
 			}
 			// For Agent tool calls, find the subagent's agent_id by matching the
 			// Task event nearest in time to this message. The agent_id lets the
 			// frontend query /api/events/subagent?agent_id=... reliably.
 			if tc.ToolName == "Agent" {
-				entry["subagent_agent_id"] = lookupSubagentAgentID(database, tc.MessageID)
+				agentID, ok := agentIDByMsg[tc.MessageID]
+				if !ok {
+					agentID = lookupSubagentAgentID(database, tc.MessageID)
+					agentIDByMsg[tc.MessageID] = agentID
+				}
+				entry.SubagentAgentID = agentID
 			}
 			toolsByMsg[tc.MessageID] = append(toolsByMsg[tc.MessageID], entry)
 		}
 
-		result := make([]map[string]any, 0, len(messages))
+		result := make([]transcriptMessage, 0, len(messages))
 		for _, m := range messages {
-			entry := map[string]any{
-				"id":                m.ID,
-				"ordinal":           m.Ordinal,
-				"role":              m.Role,
-				"content":           m.Content,
-				"timestamp":         m.Timestamp.Format(time.RFC3339),
-				"has_thinking":      m.HasThinking,
-				"has_tool_use":      m.HasToolUse,
-				"content_length":    m.ContentLength,
-				"model":             m.Model,
-				"input_tokens":      m.InputTokens,
-				"output_tokens":     m.OutputTokens,
-				"cache_read_tokens": m.CacheReadTokens,
-				"stop_reason":       m.StopReason,
-			}
-			if tools, ok := toolsByMsg[m.ID]; ok {
-				entry["tool_calls"] = tools
-			}
-			result = append(result, entry)
+			result = append(result, transcriptMessage{
+				ID:              m.ID,
+				Ordinal:         m.Ordinal,
+				Role:            m.Role,
+				Content:         m.Content,
+				Timestamp:       m.Timestamp.Format(time.RFC3339),
+				HasThinking:     m.HasThinking,
+				HasToolUse:      m.HasToolUse,
+				ContentLength:   m.ContentLength,
+				Model:           m.Model,
+				InputTokens:     m.InputTokens,
+				OutputTokens:    m.OutputTokens,
+				CacheReadTokens: m.CacheReadTokens,
+				StopReason:      m.StopReason,
+				ToolCalls:       toolsByMsg[m.ID],
+			})
 		}
 
 		// Look up linked plan for this session (from plan chat).
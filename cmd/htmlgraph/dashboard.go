@@ -1,8 +1,16 @@
 package main
 
 import (
+	"bytes"
+	"compress/gzip"
 	"embed"
 	"io/fs"
+	"mime"
+	"net/http"
+	"path"
+	"strconv"
+	"strings"
+	"sync"
 )
 
 //go:embed dashboard/*
@@ -14,3 +22,96 @@ func dashboardSub() fs.FS {
 	sub, _ := fs.Sub(dashboardFS, "dashboard")
 	return sub
 }
+
+// dashboardHandler serves the embedded dashboard. Clients that accept gzip
+// get each file compressed once and cached for the life of the server, since
+// the embedded files never change; everything else (directories, unknown
+// types, other methods) falls through to http.FileServer.
+func dashboardHandler() http.Handler {
+	sub := dashboardSub()
+	files := http.FileServer(http.FS(sub))
+
+	var (
+		mu      sync.Mutex
+		gzipped = make(map[string][]byte)
+	)
+	compressed := func(name string) []byte {
+		mu.Lock()
+		body, ok := gzipped[name]
+		mu.Unlock()
+		if ok {
+			return body
+		}
+		raw, err := fs.ReadFile(sub, name)
+		if err != nil {
+			return nil // missing or a directory; not cached
+		}
+		var buf bytes.Buffer
+		zw, _ := gzip.NewWriterLevel(&buf, gzip.BestCompression)
+		zw.Write(raw) //nolint:errcheck
+		zw.Close()    //nolint:errcheck
+		body = buf.Bytes()
+		mu.Lock()
+		gzipped[name] = body
+		mu.Unlock()
+		return body
+	}
+
+	return http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		// Every response depends on Accept-Encoding, including the plain ones,
+		// so caches must not hand a gzip body to a client that refused it.
+		w.Header().Add("Vary", "Accept-Encoding")
+		// Range requests go to FileServer, which slices the identity body.
+		// Embedded files have a zero modtime, so FileServer sends no
+		// Last-Modified and the gzip path has no conditional headers to keep.
+		if (r.Method != http.MethodGet && r.Method != http.MethodHead) ||
+			r.Header.Get("Range") != "" || !acceptsGzip(r) {
+			files.ServeHTTP(w, r)
+			return
+		}
+		name := strings.TrimPrefix(path.Clean(r.URL.Path), "/")
+		if name == "" {
+			name = "index.html"
+		}
+		ctype := mime.TypeByExtension(path.Ext(name))
+		if ctype == "" || r.URL.Path == "/index.html" {
+			files.ServeHTTP(w, r) // FileServer redirects /index.html to /
+			return
+		}
+		body := compressed(name)
+		if body == nil {
+			files.ServeHTTP(w, r)
+			return
+		}
+
+		h := w.Header()
+		h.Set("Content-Type", ctype)
+		h.Set("Content-Encoding", "gzip")
+		h.Set("Content-Length", strconv.Itoa(len(body)))
+		if r.Method == http.MethodHead {
+			return
+		}
+		w.Write(body) //nolint:errcheck
+	})
+}
+
+// acceptsGzip reports whether the request's Accept-Encoding lists gzip with a
+// non-zero quality. "gzip;q=0" is an explicit refusal, not an acceptance.
+func acceptsGzip(r *http.Request) bool {
+	for _, coding := range strings.Split(strings.Join(r.Header.Values("Accept-Encoding"), ","), ",") {
+		name, params, _ := strings.Cut(coding, ";")
+		if !strings.EqualFold(strings.TrimSpace(name), "gzip") {
+			continue
+		}
+		for _, param := range strings.Split(params, ";") {
+			k, v, _ := strings.Cut(param, "=")
+			if strings.EqualFold(strings.TrimSpace(k), "q") {
+				if q, err := strconv.ParseFloat(strings.TrimSpace(v), 64); err != nil || q == 0 {
+					return false
+				}
+			}
+		}
+		return true
+	}
+	return false
+}
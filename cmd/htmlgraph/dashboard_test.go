@@ -0,0 +1,112 @@
+package main
+
+import (
+	"bytes"
+	"compress/gzip"
+	"io"
+	"io/fs"
+	"net/http/httptest"
+	"testing"
+)
+
+func TestDashboardHandler_GzipsWhenAccepted(t *testing.T) {
+	want, err := fs.ReadFile(dashboardSub(), "index.html")
+	if err != nil {
+		t.Fatal(err)
+	}
+	h := dashboardHandler()
+
+	for i := 0; i < 2; i++ { // second request is served from the cache
+		req := httptest.NewRequest("GET", "/", nil)
+		req.Header.Set("Accept-Encoding", "gzip, deflate")
+		rec := httptest.NewRecorder()
+		h.ServeHTTP(rec, req)
+
+		if got := rec.Header().Get("Content-Encoding"); got != "gzip" {
+			t.Fatalf("Content-Encoding = %q, want gzip", got)
+		}
+		if got := rec.Header().Values("Vary"); len(got) != 1 || got[0] != "Accept-Encoding" {
+			t.Errorf("Vary = %q, want [Accept-Encoding]", got)
+		}
+		zr, err := gzip.NewReader(rec.Body)
+		if err != nil {
+			t.Fatalf("gzip reader: %v", err)
+		}
+		got, err := io.ReadAll(zr)
+		if err != nil {
+			t.Fatalf("decompress: %v", err)
+		}
+		if !bytes.Equal(got, want) {
+			t.Errorf("decompressed body differs from embedded index.html")
+		}
+	}
+}
+
+func TestDashboardHandler_PlainWithoutAcceptEncoding(t *testing.T) {
+	rec := httptest.NewRecorder()
+	dashboardHandler().ServeHTTP(rec, httptest.NewRequest("GET", "/", nil))
+
+	if got := rec.Header().Get("Content-Encoding"); got != "" {
+		t.Errorf("Content-Encoding = %q, want none", got)
+	}
+	if rec.Code != 200 {
+		t.Errorf("status = %d, want 200", rec.Code)
+	}
+	if got := rec.Header().Get("Vary"); got != "Accept-Encoding" {
+		t.Errorf("Vary = %q, want Accept-Encoding", got)
+	}
+}
+
+func TestDashboardHandler_RangeServedPlain(t *testing.T) {
+	req := httptest.NewRequest("GET", "/", nil)
+	req.Header.Set("Accept-Encoding", "gzip")
+	req.Header.Set("Range", "bytes=0-9")
+	rec := httptest.NewRecorder()
+	dashboardHandler().ServeHTTP(rec, req)
+
+	if rec.Code != 206 {
+		t.Errorf("status = %d, want 206", rec.Code)
+	}
+	if got := rec.Header().Get("Content-Encoding"); got != "" {
+		t.Errorf("Content-Encoding = %q, want none", got)
+	}
+	if rec.Body.Len() != 10 {
+		t.Errorf("body length = %d, want 10", rec.Body.Len())
+	}
+}
+
+func TestDashboardHandler_PlainWhenGzipRefused(t *testing.T) {
+	for _, ae := range []string{"gzip;q=0", "deflate, gzip; q=0.0", "gzip;q=0, br"} {
+		req := httptest.NewRequest("GET", "/", nil)
+		req.Header.Set("Accept-Encoding", ae)
+		rec := httptest.NewRecorder()
+		dashboardHandler().ServeHTTP(rec, req)
+
+		if got := rec.Header().Get("Content-Encoding"); got != "" {
+			t.Errorf("Accept-Encoding %q: Content-Encoding = %q, want none", ae, got)
+		}
+	}
+}
+
+func TestAcceptsGzip(t *testing.T) {
+	for ae, want := range map[string]bool{
+		"":                  false,
+		"gzip":              true,
+		"GZIP":              true,
+		"deflate, gzip":     true,
+		"gzip;q=0.5":        true,
+		"gzip; q=1.0, br":   true,
+		"gzip;q=0":          false,
+		"gzip;q=0.000":      false,
+		"br, deflate":       false,
+		"x-gzip-not-really": false,
+	} {
+		req := httptest.NewRequest("GET", "/", nil)
+		if ae != "" {
+			req.Header.Set("Accept-Encoding", ae)
+		}
+		if got := acceptsGzip(req); got != want {
+			t.Errorf("acceptsGzip(%q) = %v, want %v", ae, got, want)
+		}
+	}
+}
@@ -1,12 +1,15 @@
 package main
 
 import (
-	"bufio"
-	"encoding/json"
+	"bytes"
 	"fmt"
+	"io/fs"
 	"os"
 	"path/filepath"
+	"runtime"
+	"sort"
 	"strings"
+	"sync"
 
 	"github.com/spf13/cobra"
 )
@@ -56,12 +59,14 @@ func healthCmd() *cobra.Command {
 
 func runHealth(path string, goOnly, pythonOnly, jsonOut, failOnWarn bool) error {
 	result := &healthResult{}
+	analyzers := map[string]sourceAnalyzer{}
 	if !pythonOnly {
-		walkFiles(path, ".go", result, analyzeGoFile)
+		analyzers[".go"] = analyzeGoFile
 	}
 	if !goOnly {
-		walkFiles(path, ".py", result, analyzePythonFile)
+		analyzers[".py"] = analyzePythonFile
 	}
+	walkFiles(path, analyzers, result)
 	for _, v := range result.Violations {
 		if v.Level == "FAIL" {
 			result.Failures++
@@ -70,9 +75,7 @@ func runHealth(path string, goOnly, pythonOnly, jsonOut, failOnWarn bool) error
 		}
 	}
 	if jsonOut {
-		enc := json.NewEncoder(os.Stdout)
-		enc.SetIndent("", "  ")
-		return enc.Encode(result)
+		return printJSON(result)
 	}
 	printHealthReport(*result)
 	if result.Failures > 0 {
@@ -103,37 +106,128 @@ func printHealthReport(r healthResult) {
 	fmt.Printf("\nStatus: %d warning(s), %d failure(s)\n", r.Warnings, r.Failures)
 }
 
-func walkFiles(root, ext string, result *healthResult, analyze func(string, *healthResult) error) {
-	_ = filepath.Walk(root, func(path string, info os.FileInfo, err error) error {
-		if err != nil {
-			return nil
-		}
-		if info.IsDir() {
-			switch info.Name() {
-			case "vendor", "testdata", "__pycache__", ".venv", "node_modules", ".git":
-				return filepath.SkipDir
+// sourceAnalyzer records the module and function metrics of one source file.
+type sourceAnalyzer func(string, *healthResult) error
+
+// walkFiles walks root once and hands each file to the analyzer registered
+// for its extension, so scanning Go and Python together costs one traversal.
+// Files are analysed as the walk finds them rather than after it finishes.
+// WalkDir takes the entry type from the directory read itself, so files the
+// scanner skips are never stat-ed.
+func walkFiles(root string, analyzers map[string]sourceAnalyzer, result *healthResult) {
+	jobs := make(chan healthJob)
+	var exts []string // extension of each job, by index; read after the walk
+	go func() {
+		defer close(jobs)
+		index := 0
+		_ = filepath.WalkDir(root, func(path string, d fs.DirEntry, err error) error {
+			if err != nil {
+				return nil
+			}
+			if d.IsDir() {
+				switch d.Name() {
+				case "vendor", "testdata", "__pycache__", ".venv", "node_modules", ".git":
+					return filepath.SkipDir
+				}
+				return nil
+			}
+			if analyze, ok := analyzers[filepath.Ext(path)]; ok {
+				exts = append(exts, filepath.Ext(path))
+				jobs <- healthJob{index: index, path: path, analyze: analyze}
+				index++
 			}
 			return nil
-		}
-		if strings.HasSuffix(path, ext) {
-			_ = analyze(path, result)
-		}
-		return nil
+		})
+	}()
+	results := analyzeFiles(jobs)
+
+	// Report languages in a fixed order (Go, then Python), as the separate
+	// per-language walks did; within a language files stay in walk order.
+	order := make([]int, len(results))
+	for i := range order {
+		order[i] = i
+	}
+	sort.SliceStable(order, func(a, b int) bool {
+		return healthLanguageRank(exts[order[a]]) < healthLanguageRank(exts[order[b]])
 	})
+	for _, i := range order {
+		r := results[i]
+		result.ModulesScanned += r.ModulesScanned
+		result.FunctionsScanned += r.FunctionsScanned
+		result.Violations = append(result.Violations, r.Violations...)
+	}
 }
 
-func readLines(path string) ([]string, error) {
-	f, err := os.Open(path)
-	if err != nil {
-		return nil, err
+// healthLanguageRank orders source extensions in the health report.
+func healthLanguageRank(ext string) int {
+	switch ext {
+	case ".go":
+		return 0
+	case ".py":
+		return 1
 	}
-	defer f.Close()
-	var lines []string
-	sc := bufio.NewScanner(f)
-	for sc.Scan() {
-		lines = append(lines, sc.Text())
+	return 2
+}
+
+// healthJob is one source file paired with the analyzer for its language.
+// index is the file's position in walk order.
+type healthJob struct {
+	index   int
+	path    string
+	analyze sourceAnalyzer
+}
+
+// analyzeFiles drains jobs on GOMAXPROCS goroutines. Each file is read and
+// scanned into its own healthResult, so workers share nothing but the result
+// slot table, and the results come back in walk order so the report matches
+// a serial scan.
+func analyzeFiles(jobs <-chan healthJob) []healthResult {
+	var (
+		mu      sync.Mutex
+		results []healthResult
+		wg      sync.WaitGroup
+	)
+	for w := 0; w < runtime.GOMAXPROCS(0); w++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for job := range jobs {
+				var r healthResult
+				_ = job.analyze(job.path, &r)
+				mu.Lock()
+				if job.index >= len(results) {
+					results = append(results, make([]healthResult, job.index+1-len(results))...)
+				}
+				results[job.index] = r
+				mu.Unlock()
+			}
+		}()
+	}
+	wg.Wait()
+	return results
+}
+
+// countLines returns the number of lines in data, counting a final line that
+// lacks a trailing newline.
+func countLines(data []byte) int {
+	n := bytes.Count(data, []byte("\n"))
+	if len(data) > 0 && data[len(data)-1] != '\n' {
+		n++
 	}
-	return lines, sc.Err()
+	return n
+}
+
+// splitLines splits data the way bufio.ScanLines does: a trailing newline
+// does not start another line and a CR before each LF is dropped.
+func splitLines(data []byte) []string {
+	if len(data) == 0 {
+		return nil
+	}
+	lines := strings.Split(strings.TrimSuffix(string(data), "\n"), "\n")
+	for i, line := range lines {
+		lines[i] = strings.TrimSuffix(line, "\r")
+	}
+	return lines
 }
 
 func addViolation(result *healthResult, kind, path, name string, line, count, warnLim, failLim int) {
@@ -152,11 +246,18 @@ func addViolation(result *healthResult, kind, path, name string, line, count, wa
 }
 
 func analyzeGoFile(path string, result *healthResult) error {
-	lines, err := readLines(path)
+	data, err := os.ReadFile(path)
 	if err != nil {
 		return nil
 	}
 	result.ModulesScanned++
+	// Without "func " the file defines no functions: count its lines and
+	// skip splitting and scanning them.
+	if !bytes.Contains(data, []byte("func ")) {
+		addViolation(result, "module", path, "", 0, countLines(data), moduleLimitWarn, moduleLimitFail)
+		return nil
+	}
+	lines := splitLines(data)
 	addViolation(result, "module", path, "", 0, len(lines), moduleLimitWarn, moduleLimitFail)
 
 	type frame struct{ name string; startLine, depth int }
@@ -181,11 +282,18 @@ func analyzeGoFile(path string, result *healthResult) error {
 }
 
 func analyzePythonFile(path string, result *healthResult) error {
-	lines, err := readLines(path)
+	data, err := os.ReadFile(path)
 	if err != nil {
 		return nil
 	}
 	result.ModulesScanned++
+	// Without "def " the file defines no functions: count its lines and
+	// skip splitting and scanning them.
+	if !bytes.Contains(data, []byte("def ")) {
+		addViolation(result, "module", path, "", 0, countLines(data), moduleLimitWarn, moduleLimitFail)
+		return nil
+	}
+	lines := splitLines(data)
 	addViolation(result, "module", path, "", 0, len(lines), moduleLimitWarn, moduleLimitFail)
 
 	type frame struct{ name string; startLine, indent int }
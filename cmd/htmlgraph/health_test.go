@@ -0,0 +1,149 @@
+package main
+
+import (
+	"fmt"
+	"os"
+	"path/filepath"
+	"strings"
+	"testing"
+)
+
+// writeHealthTree lays out a small mixed Go/Python tree, including a vendor
+// directory that the walk must skip.
+func writeHealthTree(t *testing.T) string {
+	t.Helper()
+	root := t.TempDir()
+	files := map[string]string{
+		"main.go":          "package main\n\nfunc main() {\n}\n",
+		"pkg/util.go":      "package pkg\n\nfunc A() {\n}\n\nfunc B() {\n}\n",
+		"tool.py":          "def run():\n    return 1\n",
+		"notes.txt":        "func not_code() {}\n",
+		"vendor/dep/x.go":  "package dep\n\nfunc X() {\n}\n",
+		"scripts/empty.py": "",
+	}
+	for name, body := range files {
+		path := filepath.Join(root, name)
+		if err := os.MkdirAll(filepath.Dir(path), 0o755); err != nil {
+			t.Fatal(err)
+		}
+		if err := os.WriteFile(path, []byte(body), 0o644); err != nil {
+			t.Fatal(err)
+		}
+	}
+	return root
+}
+
+func TestWalkFiles_ScansEachLanguageInOnePass(t *testing.T) {
+	root := writeHealthTree(t)
+	result := &healthResult{}
+	walkFiles(root, map[string]sourceAnalyzer{
+		".go": analyzeGoFile,
+		".py": analyzePythonFile,
+	}, result)
+
+	if result.ModulesScanned != 4 {
+		t.Errorf("ModulesScanned = %d, want 4 (vendor and .txt skipped)", result.ModulesScanned)
+	}
+	if result.FunctionsScanned != 4 {
+		t.Errorf("FunctionsScanned = %d, want 4", result.FunctionsScanned)
+	}
+}
+
+func TestWalkFiles_OnlyRegisteredExtensions(t *testing.T) {
+	root := writeHealthTree(t)
+	result := &healthResult{}
+	walkFiles(root, map[string]sourceAnalyzer{".py": analyzePythonFile}, result)
+
+	if result.ModulesScanned != 2 {
+		t.Errorf("ModulesScanned = %d, want 2 Python modules", result.ModulesScanned)
+	}
+	if result.FunctionsScanned != 1 {
+		t.Errorf("FunctionsScanned = %d, want 1 Python function", result.FunctionsScanned)
+	}
+}
+
+func TestWalkFiles_ViolationsInWalkOrder(t *testing.T) {
+	root := t.TempDir()
+	long := strings.Repeat("x = 1\n", moduleLimitWarn+1)
+	for i := 0; i < 20; i++ {
+		name := filepath.Join(root, fmt.Sprintf("mod_%02d.py", i))
+		if err := os.WriteFile(name, []byte(long), 0o644); err != nil {
+			t.Fatal(err)
+		}
+	}
+	result := &healthResult{}
+	walkFiles(root, map[string]sourceAnalyzer{".py": analyzePythonFile}, result)
+
+	if len(result.Violations) != 20 {
+		t.Fatalf("got %d violations, want 20", len(result.Violations))
+	}
+	for i, v := range result.Violations {
+		if want := filepath.Join(root, fmt.Sprintf("mod_%02d.py", i)); v.File != want {
+			t.Errorf("violation %d is for %s, want %s", i, v.File, want)
+		}
+	}
+}
+
+func TestWalkFiles_GoViolationsBeforePython(t *testing.T) {
+	root := t.TempDir()
+	files := map[string]string{
+		"a/first.py":  strings.Repeat("x = 1\n", moduleLimitWarn+1),
+		"b/second.go": "package b\n" + strings.Repeat("// x\n", moduleLimitWarn+1),
+		"c/third.py":  strings.Repeat("x = 1\n", moduleLimitWarn+1),
+	}
+	for name, body := range files {
+		path := filepath.Join(root, name)
+		if err := os.MkdirAll(filepath.Dir(path), 0o755); err != nil {
+			t.Fatal(err)
+		}
+		if err := os.WriteFile(path, []byte(body), 0o644); err != nil {
+			t.Fatal(err)
+		}
+	}
+	result := &healthResult{}
+	walkFiles(root, map[string]sourceAnalyzer{
+		".go": analyzeGoFile,
+		".py": analyzePythonFile,
+	}, result)
+
+	var got []string
+	for _, v := range result.Violations {
+		rel, _ := filepath.Rel(root, v.File)
+		got = append(got, filepath.ToSlash(rel))
+	}
+	want := []string{"b/second.go", "a/first.py", "c/third.py"}
+	if strings.Join(got, ",") != strings.Join(want, ",") {
+		t.Errorf("violation order = %v, want %v", got, want)
+	}
+}
+
+func TestCountLines_MatchesSplitLines(t *testing.T) {
+	for _, in := range []string{"", "\n", "a", "a\n", "a\n\n", "a\r\nb", "a\nb\n", "\n\nx"} {
+		lines := splitLines([]byte(in))
+		if got := countLines([]byte(in)); got != len(lines) {
+			t.Errorf("countLines(%q) = %d, splitLines gives %d lines", in, got, len(lines))
+		}
+		for _, l := range lines {
+			if strings.Contains(l, "\r") {
+				t.Errorf("splitLines(%q) kept a CR: %q", in, l)
+			}
+		}
+	}
+}
+
+func TestAnalyzeGoFile_NoFunctionsStillChecksModuleSize(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "consts.go")
+	body := "package consts\n\n" + strings.Repeat("const _ = 1\n", moduleLimitFail)
+	if err := os.WriteFile(path, []byte(body), 0o644); err != nil {
+		t.Fatal(err)
+	}
+	result := &healthResult{}
+	_ = analyzeGoFile(path, result)
+
+	if result.ModulesScanned != 1 || result.FunctionsScanned != 0 {
+		t.Errorf("scanned modules=%d functions=%d, want 1 and 0", result.ModulesScanned, result.FunctionsScanned)
+	}
+	if len(result.Violations) != 1 || result.Violations[0].Level != "FAIL" || result.Violations[0].Count != moduleLimitFail+2 {
+		t.Errorf("violations = %+v, want one FAIL for %d lines", result.Violations, moduleLimitFail+2)
+	}
+}
@@ -53,17 +53,17 @@ Usage in hooks.json:
 		hookSubcmd("user-prompt", "Handle UserPromptSubmit event", emptyResult, hooks.UserPrompt),
 		hookSubcmd("pretooluse", "Handle PreToolUse event", allowResult, hooks.PreToolUse),
 		hookSubcmd("posttooluse", "Handle PostToolUse event", continueResult, hooks.PostToolUse),
-		hookSubcmd("subagent-start", "Handle SubagentStart event", continueResult, hooks.SubagentStart),
-		hookSubcmd("subagent-stop", "Handle SubagentStop event", continueResult, hooks.SubagentStop),
+		hookSubcmdRequiringSession("subagent-start", "Handle SubagentStart event", continueResult, hooks.SubagentStart),
+		hookSubcmdRequiringSession("subagent-stop", "Handle SubagentStop event", continueResult, hooks.SubagentStop),
 		hookSubcmd("stop", "Handle Stop event", continueResult, hooks.Stop),
-		hookSubcmd("posttooluse-failure", "Handle PostToolUseFailure event", continueResult, hooks.PostToolUseFailure),
+		hookSubcmdRequiringSession("posttooluse-failure", "Handle PostToolUseFailure event", continueResult, hooks.PostToolUseFailure),
 		hookSubcmd("pre-compact", "Handle PreCompact event", continueResult, hooks.PreCompact),
 		hookSubcmd("post-compact", "Handle PostCompact event", continueResult, hooks.PostCompact),
 		hookSubcmd("worktree-create", "Handle WorktreeCreate event", continueResult, hooks.WorktreeCreate),
 		hookSubcmd("worktree-remove", "Handle WorktreeRemove event", continueResult, hooks.WorktreeRemove),
 		hookSubcmd("teammate-idle", "Handle TeammateIdle event", continueResult, hooks.TeammateIdle),
-		hookSubcmd("task-completed", "Handle TaskCompleted event", continueResult, hooks.TaskCompleted),
-		hookSubcmd("task-created", "Handle TaskCreated event", continueResult, hooks.TaskCreated),
+		hookSubcmdRequiringSession("task-completed", "Handle TaskCompleted event", continueResult, hooks.TaskCompleted),
+		hookSubcmdRequiringSession("task-created", "Handle TaskCreated event", continueResult, hooks.TaskCreated),
 		hookSubcmd("instructions-loaded", "Handle InstructionsLoaded event", continueResult, hooks.InstructionsLoaded),
 		hookSubcmd("permission-request", "Handle PermissionRequest event", continueResult, hooks.PermissionRequest),
 		hookSubcmd("config-change", "Handle ConfigChange event — persist permission_mode to session metadata", continueResult, hooks.ConfigChange),
@@ -82,12 +82,35 @@ func hookSubcmd(
 	use, short string,
 	fallback *hooks.HookResult,
 	handler func(*hooks.CloudEvent, *sql.DB) (*hooks.HookResult, error),
+) *cobra.Command {
+	return newHookSubcmd(use, short, fallback, false, handler)
+}
+
+// hookSubcmdRequiringSession is hookSubcmd for handlers that do nothing
+// without a session ID. The session check runs before the DB is opened, so
+// session-less events return fallback without touching SQLite.
+func hookSubcmdRequiringSession(
+	use, short string,
+	fallback *hooks.HookResult,
+	handler func(*hooks.CloudEvent, *sql.DB) (*hooks.HookResult, error),
+) *cobra.Command {
+	return newHookSubcmd(use, short, fallback, true, handler)
+}
+
+func newHookSubcmd(
+	use, short string,
+	fallback *hooks.HookResult,
+	requireSession bool,
+	handler func(*hooks.CloudEvent, *sql.DB) (*hooks.HookResult, error),
 ) *cobra.Command {
 	return &cobra.Command{
 		Use:   use,
 		Short: short,
 		RunE: func(_ *cobra.Command, _ []string) error {
 			return runHook(func(event *hooks.CloudEvent) (*hooks.HookResult, error) {
+				if requireSession && hooks.EnvSessionID(event.SessionID) == "" {
+					return fallback, nil
+				}
 				projectDir := hooks.ResolveProjectDir(event.CWD, event.SessionID)
 				if !hooks.IsHtmlGraphProject(projectDir) {
 					return fallback, nil
@@ -97,6 +120,8 @@ func hookSubcmd(
 					return fallback, nil
 				}
 				defer database.Close()
+				// Runs before Close: commit best-effort writes queued by the handler.
+				defer hooks.FlushWrites()
 				return handler(event, database)
 			})
 		},
@@ -124,6 +149,8 @@ func hookSubcmdWithProject(
 					return fallback, nil
 				}
 				defer database.Close()
+				// Runs before Close: commit best-effort writes queued by the handler.
+				defer hooks.FlushWrites()
 				return handler(event, database, projectDir)
 			})
 		},
@@ -143,6 +170,10 @@ func hookTrackEventCmd(fallback *hooks.HookResult) *cobra.Command {
 				toolName = args[0]
 			}
 			return runHook(func(event *hooks.CloudEvent) (*hooks.HookResult, error) {
+				// TrackEvent records nothing without a session; skip the DB open.
+				if hooks.EnvSessionID(event.SessionID) == "" {
+					return fallback, nil
+				}
 				projectDir := hooks.ResolveProjectDir(event.CWD, event.SessionID)
 				if !hooks.IsHtmlGraphProject(projectDir) {
 					return fallback, nil
@@ -152,6 +183,8 @@ func hookTrackEventCmd(fallback *hooks.HookResult) *cobra.Command {
 					return fallback, nil
 				}
 				defer database.Close()
+				// Runs before Close: commit best-effort writes queued by the handler.
+				defer hooks.FlushWrites()
 				return hooks.TrackEvent(toolName, event, database)
 			})
 		},
@@ -196,10 +229,16 @@ func runHook(handler func(*hooks.CloudEvent) (*hooks.HookResult, error)) error {
 	if len(os.Args) >= 3 {
 		hookName = os.Args[2]
 	}
-	hooks.LogTimed(projectDir, "runHook", map[string]string{
+	fields := map[string]string{
 		"hook":    hookName,
 		"session": event.SessionID[:hooks.MinSessionLen(event.SessionID)],
-	}, start, "completed")
+	}
+	// Phase timings (e.g. resolve-context) ride on this line; keep the tool
+	// they were measured for.
+	if event.ToolName != "" {
+		fields["tool"] = event.ToolName
+	}
+	hooks.LogTimed(projectDir, "runHook", fields, start, "completed")
 
 	return hooks.WriteResult(result)
 }
@@ -228,7 +228,35 @@ func ingestSubagents(database *sql.DB, parent ingest.SessionFile, force bool) (i
 	return ingested, skipped, errCount
 }
 
+// storeParseResult writes a parsed transcript's messages, tool calls and
+// derived agent_events in one transaction.
 func storeParseResult(database *sql.DB, sessionID, agentID string, result *ingest.ParseResult) (int, int) {
+	return runIngestTransaction(database, func(tx *sql.Tx) (int, int) {
+		return storeParseResultTx(tx, sessionID, agentID, result)
+	})
+}
+
+// runIngestTransaction runs store inside a single transaction so a session's
+// rows commit with one sync instead of one per INSERT. Row-level failures are
+// reported by store and do not abort the batch; a failed begin or commit
+// stores nothing and reports zero counts.
+func runIngestTransaction(database *sql.DB, store func(tx *sql.Tx) (int, int)) (int, int) {
+	tx, err := database.Begin()
+	if err != nil {
+		fmt.Fprintf(os.Stderr, "    warn: begin ingest transaction: %v\n", err)
+		return 0, 0
+	}
+	defer tx.Rollback() //nolint:errcheck
+
+	msgCount, toolCount := store(tx)
+	if err := tx.Commit(); err != nil {
+		fmt.Fprintf(os.Stderr, "    warn: commit ingest transaction: %v\n", err)
+		return 0, 0
+	}
+	return msgCount, toolCount
+}
+
+func storeParseResultTx(tx *sql.Tx, sessionID, agentID string, result *ingest.ParseResult) (int, int) {
 	var msgCount, toolCount int
 
 	// Map ordinal → message DB ID for linking tool calls.
@@ -237,7 +265,7 @@ func storeParseResult(database *sql.DB, sessionID, agentID string, result *inges
 	for _, m := range result.Messages {
 		m.SessionID = sessionID
 		m.AgentID = agentID
-		id, err := dbpkg.InsertMessage(database, &m)
+		id, err := dbpkg.InsertMessage(tx, &m)
 		if err != nil {
 			fmt.Fprintf(os.Stderr, "    warn: msg ord %d: %v\n", m.Ordinal, err)
 			continue
@@ -247,7 +275,7 @@ func storeParseResult(database *sql.DB, sessionID, agentID string, result *inges
 	}
 
 	// Fetch the session's active_feature_id to tag each tool call and file tracking.
-	activeFeatureID := sessionActiveFeature(database, sessionID)
+	activeFeatureID := sessionActiveFeature(tx, sessionID)
 	featureID := activeFeatureID
 
 	for _, tc := range result.ToolCalls {
@@ -258,7 +286,7 @@ func storeParseResult(database *sql.DB, sessionID, agentID string, result *inges
 		if activeFeatureID != "" {
 			tc.FeatureID = activeFeatureID
 		}
-		if err := dbpkg.InsertToolCall(database, &tc); err != nil {
+		if err := dbpkg.InsertToolCall(tx, &tc); err != nil {
 			fmt.Fprintf(os.Stderr, "    warn: tool %s: %v\n", tc.ToolName, err)
 			continue
 		}
@@ -275,7 +303,7 @@ func storeParseResult(database *sql.DB, sessionID, agentID string, result *inges
 						Operation: op,
 						SessionID: sessionID,
 					}
-					_ = dbpkg.UpsertFeatureFile(database, ff)
+					_ = dbpkg.UpsertFeatureFile(tx, ff)
 				}
 			}
 		}
@@ -303,7 +331,7 @@ func storeParseResult(database *sql.DB, sessionID, agentID string, result *inges
 		// Hooks produce canonical IDs; ingest-derived duplicates would create a
 		// second row with a different event_id for the same logical event.
 		tsStr := ts.UTC().Format(time.RFC3339)
-		if exists, _ := dbpkg.HasHookEventAt(database, sessionID, tc.ToolName, tsStr); exists {
+		if exists, _ := dbpkg.HasHookEventAt(tx, sessionID, tc.ToolName, tsStr); exists {
 			continue
 		}
 
@@ -322,12 +350,12 @@ func storeParseResult(database *sql.DB, sessionID, agentID string, result *inges
 			CreatedAt:    now,
 			UpdatedAt:    now,
 		}
-		_ = dbpkg.UpsertEvent(database, ev)
+		_ = dbpkg.UpsertEvent(tx, ev)
 	}
 
 	// Update session model if we detected one.
 	if result.Model != "" {
-		database.Exec(`UPDATE sessions SET model = ? WHERE session_id = ? AND (model IS NULL OR model = '')`,
+		tx.Exec(`UPDATE sessions SET model = ? WHERE session_id = ? AND (model IS NULL OR model = '')`,
 			result.Model, sessionID)
 	}
 
@@ -397,7 +425,7 @@ func nullStrVal(s string) interface{} {
 }
 
 // sessionActiveFeature returns the active_feature_id for a session, or "".
-func sessionActiveFeature(database *sql.DB, sessionID string) string {
+func sessionActiveFeature(database dbpkg.Queryer, sessionID string) string {
 	var featureID string
 	database.QueryRow(
 		`SELECT COALESCE(active_feature_id, '') FROM sessions WHERE session_id = ?`,
@@ -568,22 +596,24 @@ func ingestCommitsFromRepo(database *sql.DB, repoDir, since string, limit int) (
 	return inserted, attributed, nil
 }
 
-// ingestCommitClosingRe matches closing keywords followed by a work item ID.
-var ingestCommitClosingRe = regexp.MustCompile(`(?:completes?|closes?|fix(?:es)?|resolves?)\s+((?:feat|bug|spk)-[0-9a-f]{8})`)
-
-// ingestCommitParenRe matches parenthetical work item references, e.g. "(feat-abc12345)".
-var ingestCommitParenRe = regexp.MustCompile(`\(\s*((?:feat|bug|spk)-[0-9a-f]{8})\s*\)`)
+// ingestCommitRefRe matches a work item ID named either after a closing
+// keyword (group 1) or in parentheses, e.g. "(feat-abc12345)" (group 2).
+var ingestCommitRefRe = regexp.MustCompile(`(?:completes?|closes?|fix(?:es)?|resolves?)\s+((?:feat|bug|spk)-[0-9a-f]{8})` +
+	`|\(\s*((?:feat|bug|spk)-[0-9a-f]{8})\s*\)`)
 
 // extractFeatureIDFromCommitMsg returns the first work-item ID found in a
-// commit message. Checks closing-keyword pattern first, then parenthetical.
+// commit message. A closing-keyword match wins over a parenthetical one
+// anywhere in the message; both are found in a single scan.
 // Returns "" when no ID is found. Matching is case-insensitive.
 func extractFeatureIDFromCommitMsg(msg string) string {
-	lower := strings.ToLower(msg)
-	if m := ingestCommitClosingRe.FindStringSubmatch(lower); len(m) == 2 {
-		return m[1]
-	}
-	if m := ingestCommitParenRe.FindStringSubmatch(lower); len(m) == 2 {
-		return m[1]
+	paren := ""
+	for _, m := range ingestCommitRefRe.FindAllStringSubmatch(strings.ToLower(msg), -1) {
+		if m[1] != "" {
+			return m[1]
+		}
+		if paren == "" {
+			paren = m[2]
+		}
 	}
-	return ""
+	return paren
 }
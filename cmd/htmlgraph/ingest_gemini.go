@@ -157,13 +157,20 @@ func ensureGeminiSession(database *sql.DB, sessionID string, result *ingest.Pars
 	)
 }
 
+// storeGeminiParseResult writes a parsed Gemini session in one transaction.
 func storeGeminiParseResult(database *sql.DB, sessionID string, result *ingest.ParseResult) (int, int) {
+	return runIngestTransaction(database, func(tx *sql.Tx) (int, int) {
+		return storeGeminiParseResultTx(tx, sessionID, result)
+	})
+}
+
+func storeGeminiParseResultTx(tx *sql.Tx, sessionID string, result *ingest.ParseResult) (int, int) {
 	var msgCount, toolCount int
 
 	msgIDs := map[int]int64{}
 	for _, m := range result.Messages {
 		m.SessionID = sessionID
-		id, err := dbpkg.InsertMessage(database, &m)
+		id, err := dbpkg.InsertMessage(tx, &m)
 		if err != nil {
 			fmt.Fprintf(os.Stderr, "    warn: msg ord %d: %v\n", m.Ordinal, err)
 			continue
@@ -172,7 +179,7 @@ func storeGeminiParseResult(database *sql.DB, sessionID string, result *ingest.P
 		msgCount++
 	}
 
-	activeFeatureID := sessionActiveFeature(database, sessionID)
+	activeFeatureID := sessionActiveFeature(tx, sessionID)
 
 	msgTimestamps := make(map[int]time.Time, len(result.Messages))
 	for _, m := range result.Messages {
@@ -188,7 +195,7 @@ func storeGeminiParseResult(database *sql.DB, sessionID string, result *ingest.P
 		if activeFeatureID != "" {
 			tc.FeatureID = activeFeatureID
 		}
-		if err := dbpkg.InsertToolCall(database, &tc); err != nil {
+		if err := dbpkg.InsertToolCall(tx, &tc); err != nil {
 			fmt.Fprintf(os.Stderr, "    warn: tool %s: %v\n", tc.ToolName, err)
 			continue
 		}
@@ -200,7 +207,7 @@ func storeGeminiParseResult(database *sql.DB, sessionID string, result *ingest.P
 			ts = t
 		}
 		tsStr := ts.UTC().Format(time.RFC3339)
-		if exists, _ := dbpkg.HasHookEventAt(database, sessionID, tc.ToolName, tsStr); exists {
+		if exists, _ := dbpkg.HasHookEventAt(tx, sessionID, tc.ToolName, tsStr); exists {
 			continue
 		}
 
@@ -219,11 +226,11 @@ func storeGeminiParseResult(database *sql.DB, sessionID string, result *ingest.P
 			CreatedAt:    now,
 			UpdatedAt:    now,
 		}
-		_ = dbpkg.UpsertEvent(database, ev)
+		_ = dbpkg.UpsertEvent(tx, ev)
 	}
 
 	if result.Model != "" {
-		database.Exec(`UPDATE sessions SET model = ? WHERE session_id = ? AND (model IS NULL OR model = '')`,
+		tx.Exec(`UPDATE sessions SET model = ? WHERE session_id = ? AND (model IS NULL OR model = '')`,
 			result.Model, sessionID)
 	}
 
@@ -1,6 +1,7 @@
 package main
 
 import (
+	_ "embed"
 	"fmt"
 	"os"
 	"path/filepath"
@@ -100,95 +101,9 @@ func writeFileIfAbsent(path string, content []byte) error {
 	return nil
 }
 
-// defaultStylesCSS is a minimal stylesheet for HtmlGraph HTML nodes.
-var defaultStylesCSS = []byte(`/**
- * HtmlGraph Default Stylesheet
- *
- * Provides sensible defaults for HtmlGraph nodes.
- * Customize as needed for your project.
- */
-
-:root {
-    --color-primary: #2563eb;
-    --color-success: #16a34a;
-    --color-warning: #d97706;
-    --color-danger:  #dc2626;
-
-    --status-todo:        #6b7280;
-    --status-in-progress: #2563eb;
-    --status-blocked:     #dc2626;
-    --status-done:        #16a34a;
-
-    --priority-low:      #9ca3af;
-    --priority-medium:   #3b82f6;
-    --priority-high:     #f59e0b;
-    --priority-critical: #dc2626;
-
-    --color-bg:           #ffffff;
-    --color-bg-secondary: #f9fafb;
-    --color-border:       #e5e7eb;
-    --color-text:         #1f2937;
-    --color-text-secondary: #6b7280;
-
-    --space-xs: 0.25rem;
-    --space-sm: 0.5rem;
-    --space-md: 1rem;
-    --space-lg: 1.5rem;
-
-    --font-sans: system-ui, -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-    --font-mono: ui-monospace, SFMono-Regular, 'SF Mono', Menlo, monospace;
-}
-
-@media (prefers-color-scheme: dark) {
-    :root {
-        --color-bg:           #111827;
-        --color-bg-secondary: #1f2937;
-        --color-border:       #374151;
-        --color-text:         #f9fafb;
-        --color-text-secondary: #9ca3af;
-    }
-}
-
-*, *::before, *::after { box-sizing: border-box; }
-
-body {
-    font-family: var(--font-sans);
-    font-size: 16px;
-    line-height: 1.6;
-    color: var(--color-text);
-    background: var(--color-bg);
-    margin: 0;
-    padding: var(--space-lg);
-    max-width: 800px;
-    margin-inline: auto;
-}
-
-article {
-    background: var(--color-bg);
-    border: 1px solid var(--color-border);
-    border-radius: 8px;
-    padding: var(--space-lg);
-    margin-bottom: var(--space-lg);
-}
-
-.badge {
-    display: inline-flex;
-    align-items: center;
-    padding: var(--space-xs) var(--space-sm);
-    font-size: 0.75rem;
-    font-weight: 500;
-    border-radius: 9999px;
-    text-transform: uppercase;
-    letter-spacing: 0.025em;
-}
-
-.status-todo        { background: color-mix(in srgb, var(--status-todo) 15%, transparent);        color: var(--status-todo); }
-.status-in-progress { background: color-mix(in srgb, var(--status-in-progress) 15%, transparent); color: var(--status-in-progress); }
-.status-blocked     { background: color-mix(in srgb, var(--status-blocked) 15%, transparent);     color: var(--status-blocked); }
-.status-done        { background: color-mix(in srgb, var(--status-done) 15%, transparent);        color: var(--status-done); }
-
-.priority-low      { background: color-mix(in srgb, var(--priority-low) 15%, transparent);      color: var(--priority-low); }
-.priority-medium   { background: color-mix(in srgb, var(--priority-medium) 15%, transparent);   color: var(--priority-medium); }
-.priority-high     { background: color-mix(in srgb, var(--priority-high) 15%, transparent);     color: var(--priority-high); }
-.priority-critical { background: color-mix(in srgb, var(--priority-critical) 15%, transparent); color: var(--priority-critical); }
-`)
+// defaultStylesCSS is a minimal stylesheet for HtmlGraph HTML nodes. It is
+// embedded as a file rather than held in a []byte literal, which the runtime
+// would copy onto the heap at startup for every command, not just init.
+//
+//go:embed templates/styles.css
+var defaultStylesCSS []byte
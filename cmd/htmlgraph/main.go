@@ -2,6 +2,7 @@
 package main
 
 import (
+	"encoding/json"
 	"fmt"
 	"os"
 	"path/filepath"
@@ -241,3 +242,12 @@ func truncate(s string, maxLen int) string {
 	}
 	return string(runes[:maxLen-1]) + "…"
 }
+
+// printJSON writes v to stdout as two-space-indented JSON plus a newline.
+// The encoder writes its buffer to stdout directly, rather than marshalling
+// to a []byte and copying that again into a string for fmt.Println.
+func printJSON(v any) error {
+	enc := json.NewEncoder(os.Stdout)
+	enc.SetIndent("", "  ")
+	return enc.Encode(v)
+}
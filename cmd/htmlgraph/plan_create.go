@@ -7,6 +7,7 @@ import (
 	"log"
 	"os"
 	"path/filepath"
+	"strconv"
 	"strings"
 	"time"
 
@@ -232,13 +233,11 @@ func enrichPageFromYAML(htmlgraphDir, planID string, page *plantmpl.PlanPage) {
 		page.Slices = nil
 		page.Graph = &plantmpl.DependencyGraph{}
 		for _, s := range plan.Slices {
-			depsStr := ""
+			deps := make([]string, len(s.Deps))
 			for i, d := range s.Deps {
-				if i > 0 {
-					depsStr += ","
-				}
-				depsStr += fmt.Sprintf("%d", d)
+				deps[i] = strconv.Itoa(d)
 			}
+			depsStr := strings.Join(deps, ",")
 			filesStr := strings.Join(s.Files, ", ")
 			page.Slices = append(page.Slices, plantmpl.SliceCard{
 				Num:      s.Num,
@@ -183,7 +183,5 @@ func parseFeedbackFromHTML(planID, planPath string) (planFeedbackOutput, error)
 
 // printFeedbackJSON marshals the output struct and writes it to stdout.
 func printFeedbackJSON(out planFeedbackOutput) error {
-	enc := json.NewEncoder(os.Stdout)
-	enc.SetIndent("", "  ")
-	return enc.Encode(out)
+	return printJSON(out)
 }
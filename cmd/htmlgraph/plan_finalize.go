@@ -110,8 +110,13 @@ func executePlanFinalize(p *workitem.Project, htmlgraphDir, planID string) (*fin
 		return nil, fmt.Errorf("create track: %w", err)
 	}
 
-	// Create features for each slice.
+	// Create features for each slice. Each feature gets both of its edges in
+	// one update, and the track's contains edges are collected and written in
+	// a single update after the loop instead of one track rewrite per feature.
+	now := time.Now().UTC()
 	var featureIDs []string
+	var contains []models.Edge
+	var sliceErr error
 	for _, s := range slices {
 		opts := []workitem.FeatureOption{
 			workitem.FeatWithTrack(trackNode.ID),
@@ -122,24 +127,38 @@ func executePlanFinalize(p *workitem.Project, htmlgraphDir, planID string) (*fin
 
 		featNode, err := p.Features.Create(s.title, opts...)
 		if err != nil {
-			return nil, fmt.Errorf("create feature for slice %d: %w", s.num, err)
+			sliceErr = fmt.Errorf("create feature for slice %d: %w", s.num, err)
+			break
 		}
 
 		featureIDs = append(featureIDs, featNode.ID)
 
-		// Wire bidirectional track <-> feature edges.
-		if err := wireTrackEdges(p, featNode.ID, trackNode.ID, s.title); err != nil {
-			return nil, fmt.Errorf("wire track edges for %s: %w", featNode.ID, err)
-		}
-
-		// Link feature back to source plan (planned_in).
+		// Wire feature -> track (part_of) and link the feature back to its
+		// source plan (planned_in).
+		partOf, containsEdge := trackEdges(featNode.ID, trackNode.ID, s.title, now)
 		plannedIn := models.Edge{
 			TargetID:     planID,
 			Relationship: models.RelPlannedIn,
 			Title:        planID,
-			Since:        time.Now().UTC(),
+			Since:        now,
+		}
+		if _, err := p.Features.AddEdges(featNode.ID, partOf, plannedIn); err != nil {
+			sliceErr = fmt.Errorf("wire track edges for %s: %w", featNode.ID, err)
+			break
 		}
-		_, _ = p.Features.AddEdge(featNode.ID, plannedIn)
+		contains = append(contains, containsEdge)
+	}
+
+	// Wire track -> features (contains). This runs even when a slice failed,
+	// so every feature that already points at the track via part_of is
+	// linked back from it, as the per-feature wiring guaranteed.
+	if len(contains) > 0 {
+		if _, err := p.Tracks.AddEdges(trackNode.ID, contains...); err != nil && sliceErr == nil {
+			return nil, fmt.Errorf("wire track edges for %s: %w", trackNode.ID, err)
+		}
+	}
+	if sliceErr != nil {
+		return nil, sliceErr
 	}
 
 	// Link plan to track: plan implemented_in track.
@@ -147,7 +166,7 @@ func executePlanFinalize(p *workitem.Project, htmlgraphDir, planID string) (*fin
 		TargetID:     trackNode.ID,
 		Relationship: models.RelImplementedIn,
 		Title:        trackNode.ID,
-		Since:        time.Now().UTC(),
+		Since:        now,
 	}
 	_, _ = p.Plans.AddEdge(planNode.ID, edge)
 
@@ -197,26 +216,14 @@ func parsePlanSlicesFromYAML(htmlgraphDir, planID string) []planSlice {
 // wireTrackEdges creates bidirectional part_of/contains edges between a
 // feature and its track.
 func wireTrackEdges(p *workitem.Project, featureID, trackID, featureTitle string) error {
-	now := time.Now().UTC()
+	partOf, contains := trackEdges(featureID, trackID, featureTitle, time.Now().UTC())
 
 	// feature -> track (part_of)
-	partOf := models.Edge{
-		TargetID:     trackID,
-		Relationship: models.RelPartOf,
-		Title:        trackID,
-		Since:        now,
-	}
 	if _, err := p.Features.AddEdge(featureID, partOf); err != nil {
 		return fmt.Errorf("part_of: %w", err)
 	}
 
 	// track -> feature (contains)
-	contains := models.Edge{
-		TargetID:     featureID,
-		Relationship: models.RelContains,
-		Title:        featureTitle,
-		Since:        now,
-	}
 	if _, err := p.Tracks.AddEdge(trackID, contains); err != nil {
 		return fmt.Errorf("contains: %w", err)
 	}
@@ -224,6 +231,24 @@ func wireTrackEdges(p *workitem.Project, featureID, trackID, featureTitle string
 	return nil
 }
 
+// trackEdges returns the part_of edge from a feature to its track and the
+// matching contains edge from the track back to the feature.
+func trackEdges(featureID, trackID, featureTitle string, now time.Time) (partOf, contains models.Edge) {
+	partOf = models.Edge{
+		TargetID:     trackID,
+		Relationship: models.RelPartOf,
+		Title:        trackID,
+		Since:        now,
+	}
+	contains = models.Edge{
+		TargetID:     featureID,
+		Relationship: models.RelContains,
+		Title:        featureTitle,
+		Since:        now,
+	}
+	return partOf, contains
+}
+
 // buildExecuteCmd returns the CLI command to start working on a finalized track.
 func buildExecuteCmd(trackID string) string {
 	if trackID == "" {
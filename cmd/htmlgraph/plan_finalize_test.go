@@ -6,6 +6,7 @@ import (
 	"strings"
 	"testing"
 
+	"github.com/shakestzd/htmlgraph/internal/models"
 	"github.com/shakestzd/htmlgraph/internal/workitem"
 )
 
@@ -56,6 +57,22 @@ func TestPlanFinalize_CreatesTrackAndFeatures(t *testing.T) {
 		if !strings.HasPrefix(fid, "feat-") {
 			t.Errorf("feature ID %q missing feat- prefix", fid)
 		}
+		feat, err := p.Features.Get(fid)
+		if err != nil {
+			t.Fatalf("get %s: %v", fid, err)
+		}
+		if n := len(feat.Edges[string(models.RelPartOf)]); n != 1 {
+			t.Errorf("%s part_of edges = %d, want 1", fid, n)
+		}
+		if n := len(feat.Edges[string(models.RelPlannedIn)]); n != 1 {
+			t.Errorf("%s planned_in edges = %d, want 1", fid, n)
+		}
+	}
+
+	// The track's contains edges are written in one batch after the loop.
+	contained := findFeaturesForTrack(p, result.TrackID)
+	if strings.Join(contained, ",") != strings.Join(result.FeatureIDs, ",") {
+		t.Errorf("track contains %v, want %v", contained, result.FeatureIDs)
 	}
 }
 
@@ -148,3 +165,40 @@ func TestPlanFinalize_EmptyPlan(t *testing.T) {
 		t.Errorf("features = %d, want 0", len(result.FeatureIDs))
 	}
 }
+
+func TestPlanFinalize_SliceFailureKeepsContainsEdges(t *testing.T) {
+	p, dir := setupFinalizeProject(t)
+
+	// The second step has no description, so creating its feature fails
+	// after the first feature is already wired to the track.
+	node, err := p.Plans.Create("Partial Plan")
+	if err != nil {
+		t.Fatal(err)
+	}
+	if err := p.Plans.Edit(node.ID).AddStep("Error handling").AddStep("").Save(); err != nil {
+		t.Fatal(err)
+	}
+
+	if _, err := executePlanFinalize(p, dir, node.ID); err == nil {
+		t.Fatal("finalize should fail on the empty slice")
+	}
+
+	tracks, err := p.Tracks.List()
+	if err != nil {
+		t.Fatal(err)
+	}
+	if len(tracks) != 1 {
+		t.Fatalf("tracks = %d, want 1", len(tracks))
+	}
+	contained := findFeaturesForTrack(p, tracks[0].ID)
+	if len(contained) != 1 {
+		t.Fatalf("track contains %v, want the one created feature", contained)
+	}
+	feat, err := p.Features.Get(contained[0])
+	if err != nil {
+		t.Fatal(err)
+	}
+	if n := len(feat.Edges[string(models.RelPartOf)]); n != 1 {
+		t.Errorf("%s part_of edges = %d, want 1", feat.ID, n)
+	}
+}
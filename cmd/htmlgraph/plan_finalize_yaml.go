@@ -179,6 +179,8 @@ func finalizeYAML(htmlgraphDir, planID string) error {
 	}
 	numToFeat := map[int]createdFeat{}
 	var rejectedTitles []string
+	var contains []models.Edge
+	now := time.Now().UTC()
 	for _, s := range plan.Slices {
 		approved := approvals[fmt.Sprintf("slice-%d", s.Num)]
 		if !approved {
@@ -196,16 +198,20 @@ func finalizeYAML(htmlgraphDir, planID string) error {
 		}
 		numToFeat[s.Num] = createdFeat{id: feat.ID, title: feat.Title}
 
-		// Link feature back to source plan (planned_in).
-		p.Features.AddEdge(feat.ID, models.Edge{
+		// Link feature back to source plan (planned_in) and wire part_of
+		// (feature→track) in one update; the track's contains edges are
+		// written together after the loop.
+		partOf, containsEdge := trackEdges(feat.ID, track.ID, feat.Title, now)
+		p.Features.AddEdges(feat.ID, models.Edge{ //nolint:errcheck
 			TargetID:     planID,
 			Relationship: models.RelPlannedIn,
 			Title:        planID,
-			Since:        time.Now().UTC(),
-		})
-
-		// Wire part_of (feature→track) and contains (track→feature) edges.
-		wireTrackEdges(p, feat.ID, track.ID, feat.Title) //nolint:errcheck
+			Since:        now,
+		}, partOf)
+		contains = append(contains, containsEdge)
+	}
+	if len(contains) > 0 {
+		p.Tracks.AddEdges(track.ID, contains...) //nolint:errcheck
 	}
 
 	// Link plan to track: plan implemented_in track.
@@ -213,7 +219,7 @@ func finalizeYAML(htmlgraphDir, planID string) error {
 		TargetID:     track.ID,
 		Relationship: models.RelImplementedIn,
 		Title:        track.ID,
-		Since:        time.Now().UTC(),
+		Since:        now,
 	})
 
 	// Wire blocked_by edges from slice deps.
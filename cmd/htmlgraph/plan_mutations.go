@@ -155,15 +155,17 @@ func runPlanSetSlice(planID, sliceNum, tests, deps, files string) error {
 			if spanStart >= 0 && spanEnd >= 0 {
 				absStart := sliceIdx + metaIdx + spanStart + len("<span>")
 				absEnd := sliceIdx + metaIdx + spanEnd
-				fileHTML := "Files: "
+				var fileHTML strings.Builder
+				fileHTML.WriteString("Files: ")
 				for i, f := range strings.Split(files, ",") {
-					f = strings.TrimSpace(f)
 					if i > 0 {
-						fileHTML += ", "
+						fileHTML.WriteString(", ")
 					}
-					fileHTML += "<code>" + html.EscapeString(f) + "</code>"
+					fileHTML.WriteString("<code>")
+					fileHTML.WriteString(html.EscapeString(strings.TrimSpace(f)))
+					fileHTML.WriteString("</code>")
 				}
-				content = content[:absStart] + fileHTML + content[absEnd:]
+				content = content[:absStart] + fileHTML.String() + content[absEnd:]
 			}
 		}
 	}
@@ -663,7 +663,5 @@ func runReadFeedbackYAML(planID string) error {
 	if err := rows.Err(); err != nil {
 		return fmt.Errorf("iterate feedback rows: %w", err)
 	}
-	enc := json.NewEncoder(os.Stdout)
-	enc.SetIndent("", "  ")
-	return enc.Encode(result)
+	return printJSON(result)
 }
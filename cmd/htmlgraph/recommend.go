@@ -2,7 +2,6 @@
 package main
 
 import (
-	"encoding/json"
 	"fmt"
 	"strings"
 	"time"
@@ -82,21 +81,18 @@ func runRecommend(topN int, jsonOut bool) error {
 
 	health := buildHealthCounts(nodes)
 	wipItems := collectWIPItems(nodes)
-	bottlenecks, err := workitem.FindBottlenecks(dir)
+	// Bottlenecks, recommendations and parallel sets all read the same work
+	// items; load them once rather than once per report.
+	analysis, err := workitem.Analyze(dir)
 	if err != nil {
-		return fmt.Errorf("find bottlenecks: %w", err)
-	}
-	recs, err := workitem.RecommendNextWork(dir)
-	if err != nil {
-		return fmt.Errorf("recommend next work: %w", err)
+		return err
 	}
+	bottlenecks := analysis.Bottlenecks()
+	recs := analysis.Recommendations()
 	if len(recs) > topN {
 		recs = recs[:topN]
 	}
-	parallelSets, err := workitem.GetParallelWork(dir)
-	if err != nil {
-		return fmt.Errorf("get parallel work: %w", err)
-	}
+	parallelSets := analysis.ParallelWork()
 
 	if jsonOut {
 		return printRecommendJSON(health, wipItems, bottlenecks, recs, parallelSets)
@@ -225,10 +221,5 @@ func printRecommendJSON(
 		Parallel:    parallel,
 	}
 
-	data, err := json.MarshalIndent(out, "", "  ")
-	if err != nil {
-		return fmt.Errorf("marshal json: %w", err)
-	}
-	fmt.Println(string(data))
-	return nil
+	return printJSON(out)
 }
@@ -3,9 +3,11 @@ package main
 import (
 	"database/sql"
 	"fmt"
+	"os"
 	"os/exec"
 	"path/filepath"
 	"strings"
+	"time"
 
 	dbpkg "github.com/shakestzd/htmlgraph/internal/db"
 	"github.com/shakestzd/htmlgraph/internal/htmlparse"
@@ -14,6 +16,11 @@ import (
 
 const metaKeyLastIndexedCommit = "last_indexed_commit"
 
+// metaKeyLastIndexedAt records when the last clean reindex started. Untracked
+// HTML files not modified since then are already indexed and are skipped by
+// the incremental path.
+const metaKeyLastIndexedAt = "last_indexed_at"
+
 func reindexCmd() *cobra.Command {
 	cmd := &cobra.Command{
 		Use:   "reindex",
@@ -45,6 +52,7 @@ func runReindex(cmd *cobra.Command, _ []string) error {
 	defer database.Close()
 
 	projectDir := filepath.Dir(htmlgraphDir)
+	startedAt := time.Now().UTC()
 	currentCommit := gitHeadCommit(projectDir)
 
 	lastCommit, _ := dbpkg.GetMetadata(database, metaKeyLastIndexedCommit)
@@ -60,7 +68,9 @@ func runReindex(cmd *cobra.Command, _ []string) error {
 	}
 
 	if useIncremental {
-		total, upserted, errCount = runIncrementalReindex(database, htmlgraphDir, projectDir, lastCommit, validIDs, verboseFlag)
+		lastIndexedAt, _ := dbpkg.GetMetadata(database, metaKeyLastIndexedAt)
+		untrackedSince, _ := time.Parse(time.RFC3339Nano, lastIndexedAt)
+		total, upserted, errCount = runIncrementalReindex(database, htmlgraphDir, projectDir, lastCommit, untrackedSince, validIDs, verboseFlag)
 		fmt.Printf("Reindexed (incremental): %d upserted, %d errors (of %d changed HTML files)\n",
 			upserted, errCount, total)
 	} else {
@@ -85,10 +95,16 @@ func runReindex(cmd *cobra.Command, _ []string) error {
 	}
 
 	// Rebuild agent_events from session HTML activity logs. projectDir is
-	// passed through so parseSessionHTML can attribute sessions whose HTML
-	// files predate the data-project-dir attribute (bug-a52d5bf9).
+	// passed through so upsertSessionDoc can attribute sessions whose HTML
+	// files predate the data-project-dir attribute (bug-a52d5bf9). Without
+	// --full, session files unchanged since their events were last reindexed
+	// are not reparsed.
 	sessDir := filepath.Join(htmlgraphDir, "sessions")
-	sessTotal, sessUpserted, sessErrs := reindexSessions(database, sessDir, projectDir)
+	reindexSess := reindexChangedSessions
+	if fullFlag {
+		reindexSess = reindexSessions
+	}
+	sessTotal, sessUpserted, sessErrs := reindexSess(database, sessDir, projectDir)
 	if sessUpserted > 0 || sessErrs > 0 {
 		fmt.Printf("  sessions: %d events upserted, %d errors (of %d session files)\n",
 			sessUpserted, sessErrs, sessTotal)
@@ -112,19 +128,26 @@ func runReindex(cmd *cobra.Command, _ []string) error {
 
 	if currentCommit != "" && errCount == 0 {
 		_ = dbpkg.SetMetadata(database, metaKeyLastIndexedCommit, currentCommit)
+		_ = dbpkg.SetMetadata(database, metaKeyLastIndexedAt, startedAt.Format(time.RFC3339Nano))
 	}
 
 	return nil
 }
 
-// runIncrementalReindex parses only files changed between lastCommit and HEAD.
+// runIncrementalReindex parses only files changed between lastCommit and HEAD,
+// plus untracked files modified since untrackedSince or not yet in the DB.
 func runIncrementalReindex(
 	database *sql.DB,
 	htmlgraphDir, projectDir, lastCommit string,
+	untrackedSince time.Time,
 	validIDs map[string]bool,
 	verbose bool,
 ) (int, int, int) {
-	added, deleted := gitChangedFiles(projectDir, lastCommit, htmlgraphDir)
+	var indexed map[string]bool
+	if !untrackedSince.IsZero() {
+		indexed = indexedNodeIDs(database)
+	}
+	added, deleted := gitChangedFiles(projectDir, lastCommit, htmlgraphDir, untrackedSince, indexed)
 
 	for _, path := range deleted {
 		id := idFromHTMLPath(path)
@@ -224,12 +247,50 @@ func gitCommitExists(projectDir, commit string) bool {
 	return err == nil
 }
 
-func gitChangedFiles(projectDir, fromCommit, htmlgraphDir string) (added []string, deleted []string) {
+// indexedNodeIDs returns the IDs of every feature and track row in the DB.
+func indexedNodeIDs(database *sql.DB) map[string]bool {
+	ids := make(map[string]bool)
+	rows, err := database.Query(`SELECT id FROM features UNION SELECT id FROM tracks`)
+	if err != nil {
+		return ids
+	}
+	defer rows.Close()
+	for rows.Next() {
+		var id string
+		if rows.Scan(&id) == nil {
+			ids[id] = true
+		}
+	}
+	return ids
+}
+
+// gitChangedFiles lists .html files under htmlgraphDir added, modified or
+// deleted since fromCommit, plus untracked ones. An untracked file is left out
+// only when its mtime is before untrackedSince and its ID is in indexed, i.e.
+// an earlier run already stored it. Files copied in with an old mtime
+// (cp -p, rsync -a, tar) are therefore still picked up. A zero untrackedSince
+// keeps them all.
+func gitChangedFiles(projectDir, fromCommit, htmlgraphDir string, untrackedSince time.Time, indexed map[string]bool) (added []string, deleted []string) {
 	relHg, err := filepath.Rel(projectDir, htmlgraphDir)
 	if err != nil {
 		return nil, nil
 	}
 
+	// The untracked listing does not depend on the diff, so run both git
+	// processes at once. The channel is buffered so an early return below
+	// never strands the goroutine.
+	untracked := make(chan []byte, 1)
+	go func() {
+		out, err := exec.Command(
+			"git", "-C", projectDir,
+			"ls-files", "--others", "--exclude-standard", "--", relHg,
+		).Output()
+		if err != nil {
+			out = nil
+		}
+		untracked <- out
+	}()
+
 	out, err := exec.Command(
 		"git", "-C", projectDir,
 		"diff", "--name-status", fromCommit, "HEAD", "--", relHg,
@@ -270,20 +331,20 @@ func gitChangedFiles(projectDir, fromCommit, htmlgraphDir string) (added []strin
 		}
 	}
 
-	untrackedOut, err := exec.Command(
-		"git", "-C", projectDir,
-		"ls-files", "--others", "--exclude-standard", "--", relHg,
-	).Output()
-	if err == nil {
-		for _, rel := range strings.Split(strings.TrimSpace(string(untrackedOut)), "\n") {
-			if rel == "" {
+	for _, rel := range strings.Split(strings.TrimSpace(string(<-untracked)), "\n") {
+		if rel == "" {
+			continue
+		}
+		path := filepath.Join(projectDir, rel)
+		if !strings.HasSuffix(path, ".html") {
+			continue
+		}
+		if !untrackedSince.IsZero() && indexed[idFromHTMLPath(path)] {
+			if info, err := os.Stat(path); err == nil && info.ModTime().Before(untrackedSince) {
 				continue
 			}
-			path := filepath.Join(projectDir, rel)
-			if strings.HasSuffix(path, ".html") {
-				added = append(added, path)
-			}
 		}
+		added = append(added, path)
 	}
 
 	return added, deleted
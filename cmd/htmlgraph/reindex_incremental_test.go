@@ -2,6 +2,7 @@ package main
 
 import (
 	"database/sql"
+	"os"
 	"path/filepath"
 	"testing"
 	"time"
@@ -145,6 +146,39 @@ func TestIncrementalReindex_DeletesRemovedFiles(t *testing.T) {
 	}
 }
 
+func TestGitChangedFiles_SkipsUntrackedIndexedSinceLastRun(t *testing.T) {
+	projectDir := setupAgentGitRepo(t)
+	hgDir := filepath.Join(projectDir, ".htmlgraph")
+	featDir := filepath.Join(hgDir, "features")
+	if err := os.MkdirAll(featDir, 0o755); err != nil {
+		t.Fatal(err)
+	}
+	oldPath := writeMinimalFeatureHTML(t, featDir, "feat-old.html", "feat-old", "Old")
+	newPath := writeMinimalFeatureHTML(t, featDir, "feat-new.html", "feat-new", "New")
+
+	lastRun := time.Now().Add(-time.Minute)
+	before := lastRun.Add(-time.Hour)
+	if err := os.Chtimes(oldPath, before, before); err != nil {
+		t.Fatal(err)
+	}
+	head := gitHeadCommit(projectDir)
+
+	indexed := map[string]bool{"feat-old": true}
+	added, _ := gitChangedFiles(projectDir, head, hgDir, lastRun, indexed)
+	if len(added) != 1 || added[0] != newPath {
+		t.Errorf("added = %v, want only %s", added, newPath)
+	}
+	added, _ = gitChangedFiles(projectDir, head, hgDir, time.Time{}, indexed)
+	if len(added) != 2 {
+		t.Errorf("added with zero cutoff = %v, want both untracked files", added)
+	}
+	// An old mtime alone (cp -p, rsync -a) must not hide a file the DB lacks.
+	added, _ = gitChangedFiles(projectDir, head, hgDir, lastRun, nil)
+	if len(added) != 2 {
+		t.Errorf("added without indexed IDs = %v, want both untracked files", added)
+	}
+}
+
 // reindexFromFileLists is a testable shim for the incremental upsert logic that
 // accepts explicit file lists instead of invoking git.
 func reindexFromFileLists(
@@ -1,16 +1,19 @@
 package main
 
 import (
+	"bufio"
 	"database/sql"
 	"fmt"
+	"io"
 	"os"
 	"path/filepath"
+	"runtime"
 	"strings"
 	"time"
 
-	"github.com/PuerkitoBio/goquery"
 	dbpkg "github.com/shakestzd/htmlgraph/internal/db"
 	"github.com/shakestzd/htmlgraph/internal/models"
+	"golang.org/x/net/html"
 )
 
 const maxInputSummaryLen = 200
@@ -23,53 +26,164 @@ const maxInputSummaryLen = 200
 // sessionDir; it is used as the fallback project_dir attribution when the
 // parsed HTML predates the data-project-dir attribute (bug-a52d5bf9).
 func reindexSessions(database *sql.DB, sessionDir, projectDir string) (int, int, int) {
-	pattern := filepath.Join(sessionDir, "*.html")
-	files, _ := filepath.Glob(pattern)
+	files, _ := filepath.Glob(filepath.Join(sessionDir, "*.html"))
+	return reindexSessionFiles(database, files, projectDir)
+}
 
-	var total, upserted, errCount int
+// reindexChangedSessions is reindexSessions restricted to session files that
+// changed since reindex last read them. The agent_events rows written by a
+// previous reindex already hold everything the activity log would yield, so a
+// file whose mtime predates those rows is skipped without being read or
+// tokenized. Files with no reindex-sourced rows (new sessions, or a wiped
+// agent_events table) are always parsed.
+func reindexChangedSessions(database *sql.DB, sessionDir, projectDir string) (int, int, int) {
+	files, _ := filepath.Glob(filepath.Join(sessionDir, "*.html"))
+	indexedAt := sessionsIndexedAt(database)
+
+	changed := files[:0]
 	for _, f := range files {
-		total++
-		n, err := parseSessionHTML(database, f, projectDir)
-		if err != nil {
-			errCount++
+		at, ok := indexedAt[strings.TrimSuffix(filepath.Base(f), ".html")]
+		if ok {
+			if info, err := os.Stat(f); err == nil && info.ModTime().Before(at) {
+				continue
+			}
+		}
+		changed = append(changed, f)
+	}
+	return reindexSessionFiles(database, changed, projectDir)
+}
+
+// sessionsIndexedAt returns, per session, when reindex last upserted its
+// events. updated_at is stored with second precision, so the time is rounded
+// down and a file touched within that same second still counts as changed.
+func sessionsIndexedAt(database *sql.DB) map[string]time.Time {
+	rows, err := database.Query(`
+		SELECT session_id, MAX(updated_at) FROM agent_events
+		WHERE source = 'reindex'
+		GROUP BY session_id`)
+	if err != nil {
+		return nil
+	}
+	defer rows.Close()
+
+	indexedAt := make(map[string]time.Time)
+	for rows.Next() {
+		var sessionID, updatedAt string
+		if rows.Scan(&sessionID, &updatedAt) != nil {
 			continue
 		}
-		upserted += n
+		if t, err := time.Parse(time.RFC3339, updatedAt); err == nil {
+			indexedAt[sessionID] = t
+		}
 	}
+	return indexedAt
+}
+
+// reindexSessionFiles parses files and upserts their sessions and events.
+func reindexSessionFiles(database *sql.DB, files []string, projectDir string) (int, int, int) {
+	var total, upserted, errCount int
+	readSessionFiles(files, func(r sessionFileResult) {
+		total++
+		if r.err != nil {
+			errCount++
+			return
+		}
+		upserted += upsertSessionDoc(database, r.doc, projectDir)
+	})
 	return total, upserted, errCount
 }
 
-// parseSessionHTML reads a single session HTML file, extracts the article
-// metadata (session ID, agent, project_dir) and each <li> in the activity
-// log, then upserts an AgentEvent per entry. Returns the number of events
-// upserted.
-//
-// fallbackProjectDir is used when the HTML file predates the
-// data-project-dir attribute. It should be the filesystem path of the
-// project that owns the sessionDir being walked (typically the parent of
-// .htmlgraph/). This prevents bug-a52d5bf9, where sessions were written
-// without any project_dir and polluted every project's dashboard.
-func parseSessionHTML(database *sql.DB, path, fallbackProjectDir string) (int, error) {
+// sessionFileResult is the outcome of reading one session file.
+type sessionFileResult struct {
+	doc sessionDoc
+	err error
+}
+
+// readSessionFiles reads and scans files on up to GOMAXPROCS goroutines and
+// passes each result to consume in input order, so the (single-writer)
+// SQLite upserts stay sequential and deterministic. A file is only handed to
+// a worker once the file GOMAXPROCS places before it has been taken for
+// consumption, so only about GOMAXPROCS parsed files are held at once rather
+// than the whole directory.
+func readSessionFiles(files []string, consume func(sessionFileResult)) {
+	window := min(runtime.GOMAXPROCS(0), len(files))
+	if window == 0 {
+		return
+	}
+
+	// One single-slot channel per file: workers never block on delivery and
+	// the consumer picks results up strictly in order.
+	results := make([]chan sessionFileResult, len(files))
+	for i := range results {
+		results[i] = make(chan sessionFileResult, 1)
+	}
+	next := make(chan int)
+	slots := make(chan struct{}, window)
+
+	for w := 0; w < window; w++ {
+		go func() {
+			for i := range next {
+				doc, err := readSessionHTML(files[i])
+				results[i] <- sessionFileResult{doc: doc, err: err}
+			}
+		}()
+	}
+	go func() {
+		defer close(next)
+		for i := range files {
+			slots <- struct{}{}
+			next <- i
+		}
+	}()
+
+	for i := range files {
+		r := <-results[i]
+		results[i] = nil
+		<-slots
+		consume(r)
+	}
+}
+
+// readSessionHTML reads a single session HTML file and extracts the article
+// metadata and each <li> in the activity log. It fails when the file has no
+// <article id=...> or the id is empty.
+func readSessionHTML(path string) (sessionDoc, error) {
 	f, err := os.Open(path)
 	if err != nil {
-		return 0, fmt.Errorf("open %s: %w", path, err)
+		return sessionDoc{}, fmt.Errorf("open %s: %w", path, err)
 	}
 	defer f.Close()
 
-	doc, err := goquery.NewDocumentFromReader(f)
+	// Stream the file through the tokenizer rather than reading it whole: the
+	// tokenizer only buffers the token in progress, so a long activity log
+	// costs its kept entries, not its size on disk, while readSessionFiles
+	// has GOMAXPROCS files open at once. The bufio layer keeps the underlying
+	// reads large.
+	doc, err := scanSessionHTML(bufio.NewReaderSize(f, 64<<10))
 	if err != nil {
-		return 0, fmt.Errorf("parse HTML %s: %w", path, err)
+		return sessionDoc{}, fmt.Errorf("parse HTML %s: %w", path, err)
 	}
-
-	article := doc.Find("article[id]").First()
-	if article.Length() == 0 {
-		return 0, fmt.Errorf("no <article id=...> in %s", path)
+	if !doc.found {
+		return sessionDoc{}, fmt.Errorf("no <article id=...> in %s", path)
 	}
-
-	sessionID, _ := article.Attr("id")
-	if sessionID == "" {
-		return 0, fmt.Errorf("empty article id in %s", path)
+	if attrOrDefault(doc.article, "id", "") == "" {
+		return sessionDoc{}, fmt.Errorf("empty article id in %s", path)
 	}
+	return doc, nil
+}
+
+// upsertSessionDoc writes the session row for doc (session ID, agent,
+// project_dir) and upserts an AgentEvent per activity-log entry. Returns the
+// number of events upserted.
+//
+// fallbackProjectDir is used when the HTML file predates the
+// data-project-dir attribute. It should be the filesystem path of the
+// project that owns the sessionDir being walked (typically the parent of
+// .htmlgraph/). This prevents bug-a52d5bf9, where sessions were written
+// without any project_dir and polluted every project's dashboard.
+func upsertSessionDoc(database *sql.DB, doc sessionDoc, fallbackProjectDir string) int {
+	article := doc.article
+	sessionID := attrOrDefault(article, "id", "")
 
 	agentID := attrOrDefault(article, "data-agent", "unknown")
 	statusAttr := attrOrDefault(article, "data-status", "completed")
@@ -122,46 +236,37 @@ func parseSessionHTML(database *sql.DB, path, fallbackProjectDir string) (int, e
 
 	var count int
 
-	article.Find("section[data-activity-log] ol li").Each(func(_ int, li *goquery.Selection) {
-		eventID := attrOrDefault(li, "data-event-id", "")
-		if eventID == "" {
-			return // skip entries without an event ID
+	for _, entry := range doc.entries {
+		if entry.eventID == "" {
+			continue // skip entries without an event ID
 		}
 
-		tsStr := attrOrDefault(li, "data-ts", "")
-		ts := parseSessionTimestamp(tsStr)
-
-		toolName := attrOrDefault(li, "data-tool", "")
-		featureID := attrOrDefault(li, "data-feature", "")
-		parentEventID := attrOrDefault(li, "data-parent", "")
-
-		successStr := attrOrDefault(li, "data-success", "true")
 		status := "completed"
-		if successStr == "false" {
+		if entry.success == "false" {
 			status = "failed"
 		}
 		// An explicit data-status attribute on the <li> (e.g. "aborted" from
 		// the orphan sweep) takes precedence over the success→status mapping
 		// so round-trip reindex rebuilds aborted events as aborted.
-		if explicit := attrOrDefault(li, "data-status", ""); explicit != "" {
-			status = explicit
+		if entry.status != "" {
+			status = entry.status
 		}
 
-		summary := strings.TrimSpace(li.Text())
+		summary := strings.TrimSpace(entry.text)
 		if len([]rune(summary)) > maxInputSummaryLen {
 			summary = string([]rune(summary)[:maxInputSummaryLen-1]) + "\u2026"
 		}
 
 		evt := &models.AgentEvent{
-			EventID:       eventID,
+			EventID:       entry.eventID,
 			AgentID:       agentID,
 			EventType:     models.EventToolCall,
-			Timestamp:     ts,
-			ToolName:      toolName,
+			Timestamp:     parseSessionTimestamp(entry.ts),
+			ToolName:      entry.tool,
 			InputSummary:  summary,
 			SessionID:     sessionID,
-			FeatureID:     featureID,
-			ParentEventID: parentEventID,
+			FeatureID:     entry.feature,
+			ParentEventID: entry.parent,
 			Status:        status,
 			Source:        "reindex",
 			CreatedAt:     now,
@@ -170,36 +275,212 @@ func parseSessionHTML(database *sql.DB, path, fallbackProjectDir string) (int, e
 
 		if upsertErr := dbpkg.UpsertEvent(database, evt); upsertErr != nil {
 			_ = upsertErr // skip on upsert failure
-			return
+			continue
 		}
 		count++
-	})
+	}
+
+	return count
+}
 
-	return count, nil
+// sessionDoc is the part of a session HTML file that reindex reads: the
+// first <article id> and the <li> entries of its activity log.
+type sessionDoc struct {
+	found   bool
+	article []html.Attribute
+	entries []sessionEntry
 }
 
-// attrOrDefault returns the named attribute value from a goquery selection,
-// or the fallback if the attribute is absent or empty.
-func attrOrDefault(sel *goquery.Selection, name, fallback string) string {
-	if v, ok := sel.Attr(name); ok && v != "" {
-		return v
+// sessionEntry is one activity-log <li>. Only the data-* attributes reindex
+// maps onto an AgentEvent are kept, as plain fields rather than an attribute
+// list that would be searched once per field.
+type sessionEntry struct {
+	eventID string // data-event-id
+	ts      string // data-ts
+	tool    string // data-tool
+	feature string // data-feature
+	parent  string // data-parent
+	success string // data-success; anything but "false" counts as success
+	status  string // data-status, overrides the success mapping when set
+	text    string
+}
+
+// scanSessionHTML walks the token stream of a session file and keeps only the
+// article attributes and the entries matched by
+// "article section[data-activity-log] ol li". No DOM is built, so the
+// <head>, header badges and edge <nav> cost a tokenizer pass and nothing else.
+func scanSessionHTML(r io.Reader) (sessionDoc, error) {
+	var (
+		doc     sessionDoc
+		inLog   bool // inside <section data-activity-log>
+		olDepth int  // open <ol> elements inside the activity log
+		item    *sessionEntry
+		text    strings.Builder
+	)
+	closeItem := func() {
+		if item != nil {
+			item.text = text.String()
+			doc.entries = append(doc.entries, *item)
+			item = nil
+			text.Reset()
+		}
+	}
+
+	z := html.NewTokenizer(r)
+	for {
+		switch z.Next() {
+		case html.ErrorToken:
+			if err := z.Err(); err != io.EOF {
+				return doc, err
+			}
+			closeItem()
+			return doc, nil
+
+		case html.StartTagToken:
+			// TagName/TagAttr read straight from the tokenizer buffer, so
+			// tags outside the article and activity log never have their
+			// attributes copied out.
+			name, more := z.TagName()
+			switch {
+			case !doc.found:
+				if string(name) == "article" {
+					if attrs := tagAttrs(z, more); hasAttr(attrs, "id") {
+						doc.found = true
+						doc.article = attrs
+					}
+				}
+			case string(name) == "section":
+				if hasAttr(tagAttrs(z, more), "data-activity-log") {
+					inLog = true
+				}
+			case inLog && string(name) == "ol":
+				olDepth++
+			case olDepth > 0 && string(name) == "li":
+				closeItem()
+				item = readSessionEntry(z, more)
+			}
+
+		case html.EndTagToken:
+			if !doc.found {
+				continue
+			}
+			name, _ := z.TagName()
+			switch string(name) {
+			case "li":
+				closeItem()
+			case "ol":
+				if olDepth > 0 {
+					closeItem()
+					olDepth--
+				}
+			case "section":
+				closeItem()
+				inLog, olDepth = false, 0
+			case "article":
+				closeItem()
+				return doc, nil
+			}
+
+		case html.TextToken:
+			if item != nil {
+				text.Write(z.Text())
+			}
+		}
+	}
+}
+
+// tagAttrs copies the attributes of the current start tag out of the
+// tokenizer. more is the second result of z.TagName.
+func tagAttrs(z *html.Tokenizer, more bool) []html.Attribute {
+	var attrs []html.Attribute
+	for more {
+		var key, val []byte
+		key, val, more = z.TagAttr()
+		attrs = append(attrs, html.Attribute{Key: string(key), Val: string(val)})
+	}
+	return attrs
+}
+
+// readSessionEntry decodes the attributes of the current <li> start tag into
+// a sessionEntry, copying only the values it has a field for.
+func readSessionEntry(z *html.Tokenizer, more bool) *sessionEntry {
+	e := &sessionEntry{}
+	for more {
+		var key, val []byte
+		key, val, more = z.TagAttr()
+		var field *string
+		switch string(key) {
+		case "data-event-id":
+			field = &e.eventID
+		case "data-ts":
+			field = &e.ts
+		case "data-tool":
+			field = &e.tool
+		case "data-feature":
+			field = &e.feature
+		case "data-parent":
+			field = &e.parent
+		case "data-success":
+			field = &e.success
+		case "data-status":
+			field = &e.status
+		default:
+			continue
+		}
+		*field = string(val)
+	}
+	return e
+}
+
+// hasAttr reports whether attrs contains an attribute with the given key.
+func hasAttr(attrs []html.Attribute, key string) bool {
+	for _, a := range attrs {
+		if a.Key == key {
+			return true
+		}
+	}
+	return false
+}
+
+// attrOrDefault returns the named attribute value from attrs, or the fallback
+// if the attribute is absent or empty.
+func attrOrDefault(attrs []html.Attribute, name, fallback string) string {
+	for _, a := range attrs {
+		if a.Key == name {
+			if a.Val != "" {
+				return a.Val
+			}
+			break
+		}
 	}
 	return fallback
 }
 
+// sessionTimestampLayouts are the ISO 8601 layouts found in session HTML,
+// covering both timezone-aware and timezone-naive values.
+var sessionTimestampLayouts = []string{
+	time.RFC3339Nano,
+	time.RFC3339,
+	"2006-01-02T15:04:05.999999",
+	"2006-01-02T15:04:05",
+}
+
 // parseSessionTimestamp parses ISO 8601 timestamps found in session HTML.
-// Tries multiple layouts to handle both timezone-naive and timezone-aware values.
+// Hooks write RFC 3339 with a zone and older files are timezone-naive, so the
+// suffix decides which single layout to try first; the full layout list is
+// the fallback for anything else.
 func parseSessionTimestamp(s string) time.Time {
 	if s == "" {
 		return time.Time{}
 	}
-	layouts := []string{
-		time.RFC3339Nano,
-		time.RFC3339,
-		"2006-01-02T15:04:05.999999",
-		"2006-01-02T15:04:05",
+	layout := "2006-01-02T15:04:05"
+	if n := len(s); s[n-1] == 'Z' || n > 6 && (s[n-6] == '+' || s[n-6] == '-') && s[n-3] == ':' {
+		layout = time.RFC3339
+	}
+	if t, err := time.Parse(layout, s); err == nil {
+		return t
 	}
-	for _, layout := range layouts {
+	for _, layout := range sessionTimestampLayouts {
 		if t, err := time.Parse(layout, s); err == nil {
 			return t
 		}
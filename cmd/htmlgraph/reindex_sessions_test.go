@@ -5,6 +5,8 @@ import (
 	"fmt"
 	"os"
 	"path/filepath"
+	"runtime"
+	"strings"
 	"testing"
 	"time"
 
@@ -349,6 +351,42 @@ func TestReindexSessions_MultipleFiles(t *testing.T) {
 	}
 }
 
+func TestReadSessionFiles_ConsumesInInputOrder(t *testing.T) {
+	dir := t.TempDir()
+	var files []string
+	for i := 0; i < 4*runtime.GOMAXPROCS(0)+3; i++ {
+		if i%5 == 4 {
+			// Unreadable entries must keep their place in the sequence too.
+			files = append(files, filepath.Join(dir, fmt.Sprintf("missing-%03d.html", i)))
+			continue
+		}
+		files = append(files, writeSessionHTML(t, dir, fmt.Sprintf("sess-order-%03d", i),
+			"claude-code", "2026-03-10T14:00:00.000000", nil))
+	}
+
+	var got int
+	readSessionFiles(files, func(r sessionFileResult) {
+		i := got
+		got++
+		if i%5 == 4 {
+			if r.err == nil {
+				t.Errorf("result %d: expected an error for the missing file", i)
+			}
+			return
+		}
+		if r.err != nil {
+			t.Errorf("result %d: %v", i, r.err)
+			return
+		}
+		if id, want := attrOrDefault(r.doc.article, "id", ""), fmt.Sprintf("sess-order-%03d", i); id != want {
+			t.Errorf("result %d is %s, want %s", i, id, want)
+		}
+	})
+	if got != len(files) {
+		t.Errorf("consumed %d results, want %d", got, len(files))
+	}
+}
+
 func TestReindexSessions_SourceIsReindex(t *testing.T) {
 	dir := t.TempDir()
 	database := setupSessionTestDB(t)
@@ -450,3 +488,72 @@ func TestReindexSessions_MalformedHTML(t *testing.T) {
 		t.Errorf("errCount: got %d, want 1", errCount)
 	}
 }
+
+func TestScanSessionHTML_KeepsOnlyActivityLogEntries(t *testing.T) {
+	page := `<html><head><title>x</title></head><body>
+<ul><li data-event-id="outside">not in an article</li></ul>
+<article id="sess-1" data-agent="claude-code">
+  <header><ul><li data-event-id="badge">header list</li></ul></header>
+  <section data-activity-log>
+    <h3>Activity Log</h3>
+    <ol reversed>
+      <li data-event-id="evt-1" data-tool="Bash">echo &amp; <code>ls</code></li>
+      <li data-event-id="evt-2" data-tool="Read">unclosed
+      <li data-event-id="evt-3" data-tool="Edit">last</li>
+    </ol>
+  </section>
+</article></body></html>`
+
+	doc, err := scanSessionHTML(strings.NewReader(page))
+	if err != nil {
+		t.Fatalf("scanSessionHTML: %v", err)
+	}
+	if !doc.found || attrOrDefault(doc.article, "id", "") != "sess-1" {
+		t.Fatalf("article not found: %+v", doc)
+	}
+	want := []struct{ id, text string }{
+		{"evt-1", "echo & ls"},
+		{"evt-2", "unclosed"},
+		{"evt-3", "last"},
+	}
+	if len(doc.entries) != len(want) {
+		t.Fatalf("got %d entries, want %d: %+v", len(doc.entries), len(want), doc.entries)
+	}
+	for i, w := range want {
+		e := doc.entries[i]
+		if id := e.eventID; id != w.id {
+			t.Errorf("entry %d id = %q, want %q", i, id, w.id)
+		}
+		if text := strings.TrimSpace(e.text); text != w.text {
+			t.Errorf("entry %d text = %q, want %q", i, text, w.text)
+		}
+	}
+}
+
+func TestReindexChangedSessions_SkipsFilesIndexedSinceLastWrite(t *testing.T) {
+	dir := t.TempDir()
+	database := setupSessionTestDB(t)
+
+	path := writeSessionHTML(t, dir, "sess-changed-1", "claude-code", "2026-03-10T14:00:00", []sessionEventSpec{
+		{eventID: "evt-changed-1", ts: "2026-03-10T15:00:00", tool: "Bash", success: "true", text: "ls"},
+	})
+	past := time.Now().Add(-time.Hour)
+	if err := os.Chtimes(path, past, past); err != nil {
+		t.Fatal(err)
+	}
+
+	if total, upserted, _ := reindexChangedSessions(database, dir, "/test/project"); total != 1 || upserted != 1 {
+		t.Fatalf("first run: total=%d upserted=%d, want 1 1", total, upserted)
+	}
+	if total, _, _ := reindexChangedSessions(database, dir, "/test/project"); total != 0 {
+		t.Errorf("unchanged file reparsed: total=%d, want 0", total)
+	}
+
+	future := time.Now().Add(time.Hour)
+	if err := os.Chtimes(path, future, future); err != nil {
+		t.Fatal(err)
+	}
+	if total, _, _ := reindexChangedSessions(database, dir, "/test/project"); total != 1 {
+		t.Errorf("modified file skipped: total=%d, want 1", total)
+	}
+}
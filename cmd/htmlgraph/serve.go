@@ -52,7 +52,7 @@ func runServer(port int) error {
 //   - runServeChild (the hidden _serve-child subcommand the parent spawns
 //     for per-project process isolation in multi-project mode)
 //
-// dashboardFS is accessed via the package-level dashboardSub() helper and
+// dashboardFS is accessed via the package-level dashboardHandler() helper and
 // is intentionally not a parameter.
 func buildSingleProjectMux(database *sql.DB, htmlgraphDir string) *http.ServeMux {
 	mux := http.NewServeMux()
@@ -98,7 +98,7 @@ func buildSingleProjectMux(database *sql.DB, htmlgraphDir string) *http.ServeMux
 	))
 
 	// Serve embedded dashboard (index.html, css/, js/, components/)
-	mux.Handle("/", corsMiddleware(http.FileServer(http.FS(dashboardSub()))))
+	mux.Handle("/", corsMiddleware(dashboardHandler()))
 
 	return mux
 }
@@ -59,7 +59,7 @@ func buildGlobalMux() *http.ServeMux {
 	// Serve the embedded dashboard SPA (index.html, css/, js/,
 	// components/). The frontend calls /api/mode on startup to detect
 	// global mode and render the projects landing.
-	mux.Handle("/", corsMiddleware(http.FileServer(http.FS(dashboardSub()))))
+	mux.Handle("/", corsMiddleware(dashboardHandler()))
 
 	return mux
 }
@@ -107,7 +107,14 @@ func topoSortFeatures(features []*models.Node) []*models.Node {
 		inDegree[f.ID] = 0
 	}
 
-	for _, f := range features {
+	// Stable ordering for nodes at the same level: walking the features in
+	// ID order once means the initial queue and every dependents list are
+	// built already sorted, instead of sorting each list as it is visited.
+	byID := make([]*models.Node, len(features))
+	copy(byID, features)
+	sort.Slice(byID, func(i, j int) bool { return byID[i].ID < byID[j].ID })
+
+	for _, f := range byID {
 		for _, e := range f.Edges[string(models.RelBlockedBy)] {
 			if _, ok := nodeMap[e.TargetID]; ok {
 				inDegree[f.ID]++
@@ -117,22 +124,18 @@ func topoSortFeatures(features []*models.Node) []*models.Node {
 	}
 
 	var queue []string
-	for _, f := range features {
+	for _, f := range byID {
 		if inDegree[f.ID] == 0 {
 			queue = append(queue, f.ID)
 		}
 	}
-	// Stable ordering for nodes at the same level.
-	sort.Strings(queue)
 
 	var sorted []*models.Node
 	for len(queue) > 0 {
 		id := queue[0]
 		queue = queue[1:]
 		sorted = append(sorted, nodeMap[id])
-		deps := dependents[id]
-		sort.Strings(deps)
-		for _, dep := range deps {
+		for _, dep := range dependents[id] {
 			inDegree[dep]--
 			if inDegree[dep] == 0 {
 				queue = append(queue, dep)
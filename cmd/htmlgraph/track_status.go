@@ -22,14 +22,14 @@ type featureGroup struct {
 	Commits   []commitInfo
 }
 
+// commitFeaturePrefixRe matches "feat-XXXX:" or "(feat-XXXX)" in a commit subject.
+var commitFeaturePrefixRe = regexp.MustCompile(`\b(feat-[a-f0-9]+)[:\)]`)
+
 // groupByPrefix parses git log lines and groups them by feat-xxx: or (feat-xxx) prefix.
 // Lines without a recognized prefix go into a "" (unattributed) group.
 func groupByPrefix(logLines []string) []featureGroup {
 	groups := make(map[string][]commitInfo)
 
-	// Regex: match "feat-XXXX:" or "(feat-XXXX)" in subject
-	re := regexp.MustCompile(`\b(feat-[a-f0-9]+)[:\)]`)
-
 	for _, line := range logLines {
 		parts := strings.SplitN(strings.TrimSpace(line), " ", 2)
 		if len(parts) < 2 {
@@ -39,7 +39,7 @@ func groupByPrefix(logLines []string) []featureGroup {
 		subject := parts[1]
 		ci := commitInfo{Hash: hash, Subject: subject}
 
-		if m := re.FindStringSubmatch(subject); m != nil {
+		if m := commitFeaturePrefixRe.FindStringSubmatch(subject); m != nil {
 			groups[m[1]] = append(groups[m[1]], ci)
 		} else {
 			groups[""] = append(groups[""], ci)
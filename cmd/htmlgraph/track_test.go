@@ -0,0 +1,36 @@
+package main
+
+import (
+	"slices"
+	"testing"
+
+	"github.com/shakestzd/htmlgraph/internal/models"
+)
+
+func TestTopoSortFeatures_OrdersLevelsByID(t *testing.T) {
+	node := func(id string, blockedBy ...string) *models.Node {
+		n := &models.Node{ID: id}
+		for _, b := range blockedBy {
+			n.AddEdge(models.Edge{TargetID: b, Relationship: models.RelBlockedBy})
+		}
+		return n
+	}
+	features := []*models.Node{
+		node("feat-d", "feat-b"),
+		node("feat-c", "feat-a"),
+		node("feat-b"),
+		node("feat-e", "feat-a", "feat-b"),
+		node("feat-a"),
+		node("feat-x", "feat-y"), // cycle: appended in input order
+		node("feat-y", "feat-x"),
+	}
+
+	var got []string
+	for _, n := range topoSortFeatures(features) {
+		got = append(got, n.ID)
+	}
+	want := []string{"feat-a", "feat-b", "feat-c", "feat-d", "feat-e", "feat-x", "feat-y"}
+	if !slices.Equal(got, want) {
+		t.Errorf("topoSortFeatures = %v, want %v", got, want)
+	}
+}
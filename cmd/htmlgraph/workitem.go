@@ -1,6 +1,7 @@
 package main
 
 import (
+	"bufio"
 	"fmt"
 	"os"
 	"path/filepath"
@@ -8,7 +9,6 @@ import (
 	"strings"
 	"time"
 
-	"github.com/google/uuid"
 	dbpkg "github.com/shakestzd/htmlgraph/internal/db"
 	"github.com/shakestzd/htmlgraph/internal/graph"
 	"github.com/shakestzd/htmlgraph/internal/hooks"
@@ -80,18 +80,21 @@ func runWiList(dirName, statusFilter string) error {
 		return nil
 	}
 
-	fmt.Printf("%-22s  %-11s  %-8s  %s\n", "ID", "STATUS", "PRIORITY", "TITLE")
-	fmt.Println(strings.Repeat("-", 80))
+	// Buffer the table so a long listing is one write to stdout rather than
+	// one per row.
+	w := bufio.NewWriter(os.Stdout)
+	fmt.Fprintf(w, "%-22s  %-11s  %-8s  %s\n", "ID", "STATUS", "PRIORITY", "TITLE")
+	fmt.Fprintln(w, strings.Repeat("-", 80))
 	for _, n := range filtered {
 		marker := "  "
 		if n.Status == models.StatusInProgress {
 			marker = "* "
 		}
-		fmt.Printf("%s%-20s  %-11s  %-8s  %s\n",
+		fmt.Fprintf(w, "%s%-20s  %-11s  %-8s  %s\n",
 			marker, n.ID, n.Status, n.Priority, truncate(n.Title, 44))
 	}
-	fmt.Printf("\n%d %s\n", len(filtered), dirName)
-	return nil
+	fmt.Fprintf(w, "\n%d %s\n", len(filtered), dirName)
+	return w.Flush()
 }
 
 func wiShowCmd(typeName string) *cobra.Command {
@@ -208,7 +211,7 @@ func wiSetStatusWithAgent(typeName, id, status, sessionID, agentID string) error
 					// consumers read from active_work_items.
 					_ = hooks.UpdateActiveFeature(p.DB, sessionID, id)
 					claim := &models.Claim{
-						ClaimID:          "clm-" + uuid.NewString()[:8],
+						ClaimID:          workitem.NewClaimID(),
 						WorkItemID:       id,
 						OwnerSessionID:   sessionID,
 						OwnerAgent:       agentForClaim(),
@@ -373,19 +376,22 @@ func resolveNodePath(htmlgraphDir, id string) string {
 }
 
 func printNodeDetail(n *models.Node) {
+	w := bufio.NewWriter(os.Stdout)
+	defer w.Flush()
+
 	sep := strings.Repeat("─", 60)
-	fmt.Println(sep)
-	fmt.Printf("  %s\n", n.Title)
-	fmt.Println(sep)
-	fmt.Printf("  ID        %s\n", n.ID)
-	fmt.Printf("  Type      %s\n", n.Type)
-	fmt.Printf("  Status    %s\n", n.Status)
-	fmt.Printf("  Priority  %s\n", n.Priority)
+	fmt.Fprintln(w, sep)
+	fmt.Fprintf(w, "  %s\n", n.Title)
+	fmt.Fprintln(w, sep)
+	fmt.Fprintf(w, "  ID        %s\n", n.ID)
+	fmt.Fprintf(w, "  Type      %s\n", n.Type)
+	fmt.Fprintf(w, "  Status    %s\n", n.Status)
+	fmt.Fprintf(w, "  Priority  %s\n", n.Priority)
 	if n.TrackID != "" {
-		fmt.Printf("  Track     %s\n", n.TrackID)
+		fmt.Fprintf(w, "  Track     %s\n", n.TrackID)
 	}
 	if !n.CreatedAt.IsZero() {
-		fmt.Printf("  Created   %s\n", n.CreatedAt.Format("2006-01-02"))
+		fmt.Fprintf(w, "  Created   %s\n", n.CreatedAt.Format("2006-01-02"))
 	}
 
 	if len(n.Steps) > 0 {
@@ -395,35 +401,35 @@ func printNodeDetail(n *models.Node) {
 				done++
 			}
 		}
-		fmt.Printf("\nSteps: %d/%d complete\n", done, len(n.Steps))
+		fmt.Fprintf(w, "\nSteps: %d/%d complete\n", done, len(n.Steps))
 		for _, s := range n.Steps {
 			tick := "[ ]"
 			if s.Completed {
 				tick = "[x]"
 			}
-			fmt.Printf("  %s  %s\n", tick, s.Description)
+			fmt.Fprintf(w, "  %s  %s\n", tick, s.Description)
 		}
 	}
 
 	if len(n.Edges) > 0 {
-		fmt.Println("\nEdges:")
+		fmt.Fprintln(w, "\nEdges:")
 		for rel, edges := range n.Edges {
 			for _, e := range edges {
-				fmt.Printf("  %-15s → %s\n", rel, e.TargetID)
+				fmt.Fprintf(w, "  %-15s → %s\n", rel, e.TargetID)
 			}
 		}
 	}
 
 	if n.Content != "" {
-		fmt.Println("\nContent:")
+		fmt.Fprintln(w, "\nContent:")
 		for _, line := range strings.Split(n.Content, "\n") {
-			fmt.Printf("  %s\n", line)
+			fmt.Fprintf(w, "  %s\n", line)
 		}
 	}
 
 	// Hint for finalized plans: surface the idempotent dispatch command.
 	if n.Type == "plan" && string(n.Status) == "finalized" {
-		fmt.Printf("\nNext: htmlgraph plan finalize-yaml %s   (idempotent — creates features, embeds decisions, prints dispatch summary)\n", n.ID)
+		fmt.Fprintf(w, "\nNext: htmlgraph plan finalize-yaml %s   (idempotent — creates features, embeds decisions, prints dispatch summary)\n", n.ID)
 	}
 }
 
@@ -308,9 +308,11 @@ func resolveTrackForFeature(featureID, projectRoot string) string {
 	return node.TrackID
 }
 
-// buildWorkItemPromptPrefix returns the work item header to prepend to the yolo prompt.
-func buildWorkItemPromptPrefix(id, kind string) string {
+// buildWorkItemPromptSection returns the work item section appended to the
+// yolo prompt.
+func buildWorkItemPromptSection(id, kind string) string {
 	return strings.Join([]string{
+		"",
 		"## Active Work Item",
 		fmt.Sprintf("You are working on: %s", id),
 		"All work in this session must be attributed to this item.",
@@ -318,13 +320,16 @@ func buildWorkItemPromptPrefix(id, kind string) string {
 	}, "\n")
 }
 
-// buildYoloSystemPrompt prepends the work item header to the embedded yolo prompt.
+// buildYoloSystemPrompt appends the work item section to the embedded yolo
+// prompt. The per-session part goes last so the yolo prompt itself is a
+// byte-identical prefix across sessions and stays in the API prompt cache;
+// a leading work item header changed the prefix on every launch.
 func buildYoloSystemPrompt(id, kind string) string {
 	var sb strings.Builder
+	sb.WriteString(yoloPromptContent)
 	if id != "" {
-		sb.WriteString(buildWorkItemPromptPrefix(id, kind))
+		sb.WriteString(buildWorkItemPromptSection(id, kind))
 	}
-	sb.WriteString(yoloPromptContent)
 	return sb.String()
 }
 
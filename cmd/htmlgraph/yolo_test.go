@@ -4,6 +4,7 @@ import (
 	"os"
 	"os/exec"
 	"path/filepath"
+	"strings"
 	"testing"
 )
 
@@ -181,3 +182,16 @@ func gitCommitInDir(dir, msg string) error {
 func contains(haystack, needle string) bool {
 	return len(haystack) > 0 && len(needle) > 0 && (haystack == needle || len(haystack) >= len(needle))
 }
+
+func TestBuildYoloSystemPrompt_WorkItemComesAfterStaticPrompt(t *testing.T) {
+	got := buildYoloSystemPrompt("feat-12345678", "feature")
+	if !strings.HasPrefix(got, yoloPromptContent) {
+		t.Fatal("yolo prompt should start with the embedded prompt unchanged")
+	}
+	if !strings.Contains(got[len(yoloPromptContent):], "You are working on: feat-12345678") {
+		t.Errorf("work item section missing after the static prompt:\n%s", got[len(yoloPromptContent):])
+	}
+	if buildYoloSystemPrompt("", "") != yoloPromptContent {
+		t.Error("without a work item the prompt should be the embedded prompt alone")
+	}
+}
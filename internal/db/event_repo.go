@@ -8,10 +8,52 @@ import (
 	"github.com/shakestzd/htmlgraph/internal/models"
 )
 
+// Queryer is satisfied by both *sql.DB and *sql.Tx, enabling helpers that read
+// and write within the same transaction.
+type Queryer interface {
+	Execer
+	QueryRow(query string, args ...any) *sql.Row
+}
+
+// agentEventValues is the column list and placeholders shared by
+// insertEventSQL and upsertEventSQL; eventInsertArgs supplies values in the
+// same order. Keeping one statement text per operation lets every hook and
+// ingest write reuse identical SQL.
+const agentEventValues = `(
+			event_id, agent_id, event_type, timestamp, tool_name,
+			input_summary, tool_input, output_summary, session_id, feature_id,
+			parent_agent_id, parent_event_id, subagent_type,
+			cost_tokens, execution_duration_seconds, status,
+			model, claude_task_id, source, step_id,
+			created_at, updated_at
+		) VALUES (?,?,?,?,?, ?,?,?,?,?, ?,?,?,?,?, ?,?,?,?,?, ?,?)`
+
+const (
+	insertEventSQL = `INSERT INTO agent_events ` + agentEventValues
+	upsertEventSQL = `INSERT OR REPLACE INTO agent_events ` + agentEventValues
+)
+
+// eventInsertArgs returns e's column values in agentEventValues order.
+func eventInsertArgs(e *models.AgentEvent) []any {
+	return []any{
+		e.EventID, e.AgentID, string(e.EventType),
+		e.Timestamp.UTC().Format(time.RFC3339), nullStr(e.ToolName),
+		nullStr(e.InputSummary), nullStr(e.ToolInput), nullStr(e.OutputSummary),
+		e.SessionID, nullStr(e.FeatureID),
+		nullStr(e.ParentAgentID), nullStr(e.ParentEventID),
+		nullStr(e.SubagentType),
+		e.CostTokens, e.ExecDuration, e.Status,
+		nullStr(e.Model), nullStr(e.ClaudeTaskID),
+		e.Source, nullStr(e.StepID),
+		e.CreatedAt.UTC().Format(time.RFC3339),
+		e.UpdatedAt.UTC().Format(time.RFC3339),
+	}
+}
+
 // lookupAgentIDByEvent returns the agent_id of an existing event, or "" if the
 // event does not exist. Used to materialise parent_agent_id at insert time
 // without failing when the parent row hasn't been written yet (race condition).
-func lookupAgentIDByEvent(database *sql.DB, eventID string) string {
+func lookupAgentIDByEvent(database Queryer, eventID string) string {
 	if eventID == "" {
 		return ""
 	}
@@ -32,30 +74,21 @@ func lookupAgentIDByEvent(database *sql.DB, eventID string) string {
 // agent-to-agent lineage edge in a single hop. Only new rows written after this
 // change will have parent_agent_id populated; no historical backfill is performed.
 func InsertEvent(db *sql.DB, e *models.AgentEvent) error {
+	return insertEvent(db, e)
+}
+
+// InsertEventTx writes an agent event row within an existing transaction, so
+// callers can batch the parent lookup, the insert, and follow-up writes into a
+// single commit.
+func InsertEventTx(tx *sql.Tx, e *models.AgentEvent) error {
+	return insertEvent(tx, e)
+}
+
+func insertEvent(q Queryer, e *models.AgentEvent) error {
 	if e.ParentEventID != "" && e.ParentAgentID == "" {
-		e.ParentAgentID = lookupAgentIDByEvent(db, e.ParentEventID)
+		e.ParentAgentID = lookupAgentIDByEvent(q, e.ParentEventID)
 	}
-	_, err := db.Exec(`
-		INSERT INTO agent_events (
-			event_id, agent_id, event_type, timestamp, tool_name,
-			input_summary, tool_input, output_summary, session_id, feature_id,
-			parent_agent_id, parent_event_id, subagent_type,
-			cost_tokens, execution_duration_seconds, status,
-			model, claude_task_id, source, step_id,
-			created_at, updated_at
-		) VALUES (?,?,?,?,?, ?,?,?,?,?, ?,?,?,?,?, ?,?,?,?,?, ?,?)`,
-		e.EventID, e.AgentID, string(e.EventType),
-		e.Timestamp.UTC().Format(time.RFC3339), nullStr(e.ToolName),
-		nullStr(e.InputSummary), nullStr(e.ToolInput), nullStr(e.OutputSummary),
-		e.SessionID, nullStr(e.FeatureID),
-		nullStr(e.ParentAgentID), nullStr(e.ParentEventID),
-		nullStr(e.SubagentType),
-		e.CostTokens, e.ExecDuration, e.Status,
-		nullStr(e.Model), nullStr(e.ClaudeTaskID),
-		e.Source, nullStr(e.StepID),
-		e.CreatedAt.UTC().Format(time.RFC3339),
-		e.UpdatedAt.UTC().Format(time.RFC3339),
-	)
+	_, err := q.Exec(insertEventSQL, eventInsertArgs(e)...)
 	if err != nil {
 		return fmt.Errorf("insert event %s: %w", e.EventID, err)
 	}
@@ -204,28 +237,8 @@ func MostRecentSession(db *sql.DB) (string, error) {
 
 // UpsertEvent performs an INSERT OR REPLACE for idempotent event writes.
 // This is useful when a hook may fire multiple times for the same logical event.
-func UpsertEvent(db *sql.DB, e *models.AgentEvent) error {
-	_, err := db.Exec(`
-		INSERT OR REPLACE INTO agent_events (
-			event_id, agent_id, event_type, timestamp, tool_name,
-			input_summary, tool_input, output_summary, session_id, feature_id,
-			parent_agent_id, parent_event_id, subagent_type,
-			cost_tokens, execution_duration_seconds, status,
-			model, claude_task_id, source, step_id,
-			created_at, updated_at
-		) VALUES (?,?,?,?,?, ?,?,?,?,?, ?,?,?,?,?, ?,?,?,?,?, ?,?)`,
-		e.EventID, e.AgentID, string(e.EventType),
-		e.Timestamp.UTC().Format(time.RFC3339), nullStr(e.ToolName),
-		nullStr(e.InputSummary), nullStr(e.ToolInput), nullStr(e.OutputSummary),
-		e.SessionID, nullStr(e.FeatureID),
-		nullStr(e.ParentAgentID), nullStr(e.ParentEventID),
-		nullStr(e.SubagentType),
-		e.CostTokens, e.ExecDuration, e.Status,
-		nullStr(e.Model), nullStr(e.ClaudeTaskID),
-		e.Source, nullStr(e.StepID),
-		e.CreatedAt.UTC().Format(time.RFC3339),
-		e.UpdatedAt.UTC().Format(time.RFC3339),
-	)
+func UpsertEvent(db Execer, e *models.AgentEvent) error {
+	_, err := db.Exec(upsertEventSQL, eventInsertArgs(e)...)
 	if err != nil {
 		return fmt.Errorf("upsert event %s: %w", e.EventID, err)
 	}
@@ -233,8 +246,9 @@ func UpsertEvent(db *sql.DB, e *models.AgentEvent) error {
 }
 
 // UpdateEventFields performs a partial UPDATE on an event, setting status,
-// output_summary, and updated_at.
-func UpdateEventFields(db *sql.DB, eventID, status, outputSummary string) error {
+// output_summary, and updated_at. Accepts a *sql.Tx so hooks can batch it with
+// other best-effort writes.
+func UpdateEventFields(db Execer, eventID, status, outputSummary string) error {
 	now := time.Now().UTC().Format(time.RFC3339)
 	_, err := db.Exec(`
 		UPDATE agent_events
@@ -358,21 +372,6 @@ func FindStartedEventByAgent(db *sql.DB, sessionID, toolName, agentID string) (s
 	return eventID, err
 }
 
-// FindStartedDelegation returns the event_id of the most recent started
-// task_delegation in the session. Returns ("", sql.ErrNoRows) when not found.
-func FindStartedDelegation(db *sql.DB, sessionID string) (string, error) {
-	var eventID string
-	err := db.QueryRow(`
-		SELECT event_id FROM agent_events
-		WHERE session_id = ?
-		  AND event_type IN ('task_delegation', 'delegation')
-		  AND status = 'started'
-		ORDER BY timestamp DESC
-		LIMIT 1`, sessionID,
-	).Scan(&eventID)
-	return eventID, err
-}
-
 // FindDelegationByAgent returns the most recent delegation event for the agent
 // (any status). Returns ("", sql.ErrNoRows) when not found.
 func FindDelegationByAgent(db *sql.DB, sessionID, agentID string) (string, error) {
@@ -388,25 +387,42 @@ func FindDelegationByAgent(db *sql.DB, sessionID, agentID string) (string, error
 	return eventID, err
 }
 
-// FindStartedDelegationByAgent returns the most recent started delegation for
-// the agent. Returns ("", sql.ErrNoRows) when not found.
-func FindStartedDelegationByAgent(db *sql.DB, sessionID, agentID string) (string, error) {
-	var eventID string
-	err := db.QueryRow(`
-		SELECT event_id FROM agent_events
-		WHERE session_id = ?
-		  AND event_type IN ('task_delegation', 'delegation')
-		  AND agent_id = ?
-		  AND status = 'started'
-		ORDER BY timestamp DESC
-		LIMIT 1`, sessionID, agentID,
-	).Scan(&eventID)
-	return eventID, err
+// CompleteStartedDelegation marks the most recent started delegation in the
+// session as completed in a single UPDATE. The agent-scoped match is preferred
+// when agentID is set; otherwise (or when it finds nothing) the latest started
+// delegation in the session is used. Returns the number of rows updated (0 or 1).
+func CompleteStartedDelegation(db Execer, sessionID, agentID, outputSummary string) (int64, error) {
+	now := time.Now().UTC().Format(time.RFC3339)
+	res, err := db.Exec(`
+		UPDATE agent_events
+		SET status = 'completed', output_summary = ?, updated_at = ?
+		WHERE event_id = COALESCE(
+			(SELECT event_id FROM agent_events
+			 WHERE ? != ''
+			   AND session_id = ?
+			   AND event_type IN ('task_delegation', 'delegation')
+			   AND agent_id = ?
+			   AND status = 'started'
+			 ORDER BY timestamp DESC
+			 LIMIT 1),
+			(SELECT event_id FROM agent_events
+			 WHERE session_id = ?
+			   AND event_type IN ('task_delegation', 'delegation')
+			   AND status = 'started'
+			 ORDER BY timestamp DESC
+			 LIMIT 1))`,
+		nullStr(outputSummary), now, agentID, sessionID, agentID, sessionID,
+	)
+	if err != nil {
+		return 0, err
+	}
+	return res.RowsAffected()
 }
 
 // LatestEventByTool returns the event_id of the most recent event for the given
 // session and tool_name, regardless of status. Returns ("", sql.ErrNoRows) when not found.
-func LatestEventByTool(db *sql.DB, sessionID, toolName string) (string, error) {
+// Accepts a *sql.Tx so the lookup can share a transaction with the insert that uses it.
+func LatestEventByTool(db Queryer, sessionID, toolName string) (string, error) {
 	var eventID string
 	err := db.QueryRow(`
 		SELECT event_id FROM agent_events
@@ -468,7 +484,7 @@ func DistinctFeatureIDs(db *sql.DB, sessionID string) ([]string, error) {
 // already exists for the given session, tool_name, and timestamp (compared at
 // second precision). Used by the ingest path to avoid creating duplicate events
 // when hooks already recorded the same logical event with a different ID.
-func HasHookEventAt(db *sql.DB, sessionID, toolName, timestamp string) (bool, error) {
+func HasHookEventAt(db Queryer, sessionID, toolName, timestamp string) (bool, error) {
 	var count int
 	err := db.QueryRow(
 		`SELECT COUNT(*) FROM agent_events
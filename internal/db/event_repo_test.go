@@ -295,88 +295,71 @@ func TestFindStartedEventByAgent(t *testing.T) {
 	}
 }
 
-func TestFindStartedDelegation(t *testing.T) {
+func TestCompleteStartedDelegation(t *testing.T) {
 	database := setupTestDB(t)
 	defer database.Close()
 
 	now := time.Now().UTC()
-	ev := &models.AgentEvent{
-		EventID:   "evt-deleg-1",
-		AgentID:   "subagent-abc",
-		EventType: models.EventTaskDelegation,
-		Timestamp: now,
-		ToolName:  "Task",
-		SessionID: "sess-test",
-		Status:    "started",
-		Source:    "hook",
-		CreatedAt: now,
-		UpdatedAt: now,
+	for i, agentID := range []string{"agent-abc", "agent-def"} {
+		ts := now.Add(time.Duration(i) * time.Second)
+		ev := &models.AgentEvent{
+			EventID:   "evt-csd-" + agentID,
+			AgentID:   agentID,
+			EventType: models.EventTaskDelegation,
+			Timestamp: ts,
+			ToolName:  "Task",
+			SessionID: "sess-test",
+			Status:    "started",
+			Source:    "hook",
+			CreatedAt: ts,
+			UpdatedAt: ts,
+		}
+		if err := db.InsertEvent(database, ev); err != nil {
+			t.Fatalf("InsertEvent: %v", err)
+		}
 	}
-	if err := db.InsertEvent(database, ev); err != nil {
-		t.Fatalf("InsertEvent: %v", err)
+
+	statusOf := func(eventID string) string {
+		t.Helper()
+		var status string
+		if err := database.QueryRow(
+			`SELECT status FROM agent_events WHERE event_id = ?`, eventID,
+		).Scan(&status); err != nil {
+			t.Fatalf("query status: %v", err)
+		}
+		return status
 	}
 
-	id, err := db.FindStartedDelegation(database, "sess-test")
+	// Agent-scoped match wins over the more recent agent-def delegation.
+	n, err := db.CompleteStartedDelegation(database, "sess-test", "agent-abc", "done")
 	if err != nil {
-		t.Fatalf("FindStartedDelegation: %v", err)
+		t.Fatalf("CompleteStartedDelegation: %v", err)
 	}
-	if id != "evt-deleg-1" {
-		t.Errorf("got %q, want %q", id, "evt-deleg-1")
+	if n != 1 {
+		t.Errorf("rows updated = %d, want 1", n)
 	}
-}
-
-func TestFindStartedDelegationByAgent(t *testing.T) {
-	database := setupTestDB(t)
-	defer database.Close()
-
-	now := time.Now().UTC()
-
-	// A started delegation for agent-abc.
-	ev1 := &models.AgentEvent{
-		EventID:   "evt-sdba-1",
-		AgentID:   "agent-abc",
-		EventType: models.EventTaskDelegation,
-		Timestamp: now,
-		ToolName:  "Task",
-		SessionID: "sess-test",
-		Status:    "started",
-		Source:    "hook",
-		CreatedAt: now,
-		UpdatedAt: now,
+	if got := statusOf("evt-csd-agent-abc"); got != "completed" {
+		t.Errorf("agent-abc status = %q, want completed", got)
 	}
-	if err := db.InsertEvent(database, ev1); err != nil {
-		t.Fatalf("InsertEvent: %v", err)
+	if got := statusOf("evt-csd-agent-def"); got != "started" {
+		t.Errorf("agent-def status = %q, want started", got)
 	}
 
-	// A completed delegation for agent-abc (should not match).
-	ev2 := &models.AgentEvent{
-		EventID:   "evt-sdba-2",
-		AgentID:   "agent-abc",
-		EventType: models.EventTaskDelegation,
-		Timestamp: now.Add(time.Second),
-		ToolName:  "Task",
-		SessionID: "sess-test",
-		Status:    "completed",
-		Source:    "hook",
-		CreatedAt: now.Add(time.Second),
-		UpdatedAt: now.Add(time.Second),
+	// Unknown agent falls back to the latest started delegation.
+	if _, err := db.CompleteStartedDelegation(database, "sess-test", "other-agent", ""); err != nil {
+		t.Fatalf("CompleteStartedDelegation fallback: %v", err)
 	}
-	if err := db.InsertEvent(database, ev2); err != nil {
-		t.Fatalf("InsertEvent: %v", err)
+	if got := statusOf("evt-csd-agent-def"); got != "completed" {
+		t.Errorf("agent-def status = %q, want completed", got)
 	}
 
-	id, err := db.FindStartedDelegationByAgent(database, "sess-test", "agent-abc")
+	// Nothing left to complete.
+	n, err = db.CompleteStartedDelegation(database, "sess-test", "", "")
 	if err != nil {
-		t.Fatalf("FindStartedDelegationByAgent: %v", err)
-	}
-	if id != "evt-sdba-1" {
-		t.Errorf("got %q, want %q", id, "evt-sdba-1")
+		t.Fatalf("CompleteStartedDelegation empty: %v", err)
 	}
-
-	// Different agent -> ErrNoRows.
-	_, err = db.FindStartedDelegationByAgent(database, "sess-test", "other-agent")
-	if err != sql.ErrNoRows {
-		t.Errorf("expected ErrNoRows for other-agent, got %v", err)
+	if n != 0 {
+		t.Errorf("rows updated = %d, want 0", n)
 	}
 }
 
@@ -508,6 +491,73 @@ func TestAgentEvent_PopulatesParentAgentID(t *testing.T) {
 	}
 }
 
+func TestInsertEventTx_ResolvesParentWithinTransaction(t *testing.T) {
+	database := setupTestDB(t)
+	defer database.Close()
+
+	now := time.Now().UTC()
+
+	tx, err := database.Begin()
+	if err != nil {
+		t.Fatalf("Begin: %v", err)
+	}
+	defer tx.Rollback() //nolint:errcheck
+
+	// Parent and child are written in the same transaction; the child's
+	// parent_agent_id lookup must see the uncommitted parent row.
+	parent := &models.AgentEvent{
+		EventID:   "evt-tx-parent",
+		AgentID:   "agent-tx-parent",
+		EventType: models.EventToolCall,
+		Timestamp: now,
+		ToolName:  "UserQuery",
+		SessionID: "sess-test",
+		Status:    "recorded",
+		Source:    "hook",
+		CreatedAt: now,
+		UpdatedAt: now,
+	}
+	if err := db.InsertEventTx(tx, parent); err != nil {
+		t.Fatalf("InsertEventTx parent: %v", err)
+	}
+
+	parentID, err := db.LatestEventByTool(tx, "sess-test", "UserQuery")
+	if err != nil {
+		t.Fatalf("LatestEventByTool in tx: %v", err)
+	}
+
+	child := &models.AgentEvent{
+		EventID:       "evt-tx-child",
+		AgentID:       "agent-tx-child",
+		EventType:     models.EventTaskDelegation,
+		Timestamp:     now.Add(time.Second),
+		ToolName:      "Task",
+		SessionID:     "sess-test",
+		ParentEventID: parentID,
+		Status:        "started",
+		Source:        "hook",
+		CreatedAt:     now.Add(time.Second),
+		UpdatedAt:     now.Add(time.Second),
+	}
+	if err := db.InsertEventTx(tx, child); err != nil {
+		t.Fatalf("InsertEventTx child: %v", err)
+	}
+	if err := tx.Commit(); err != nil {
+		t.Fatalf("Commit: %v", err)
+	}
+
+	got, err := db.GetEvent(database, "evt-tx-child")
+	if err != nil {
+		t.Fatalf("GetEvent: %v", err)
+	}
+	if got.ParentEventID != "evt-tx-parent" {
+		t.Errorf("parent_event_id: got %q, want %q", got.ParentEventID, "evt-tx-parent")
+	}
+	if got.ParentAgentID != "agent-tx-parent" {
+		t.Errorf("parent_agent_id: got %q, want %q", got.ParentAgentID, "agent-tx-parent")
+	}
+}
+
 func TestAgentEvent_NilParentAgentID_NoParent(t *testing.T) {
 	database := setupTestDB(t)
 	defer database.Close()
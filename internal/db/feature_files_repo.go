@@ -11,7 +11,7 @@ import (
 // UpsertFeatureFile inserts a feature_file row or updates last_seen on conflict.
 // The UNIQUE constraint is (feature_id, file_path), so re-touching the same file
 // within the same feature just refreshes the timestamp and operation.
-func UpsertFeatureFile(db *sql.DB, ff *models.FeatureFile) error {
+func UpsertFeatureFile(db Execer, ff *models.FeatureFile) error {
 	_, err := db.Exec(`
 		INSERT INTO feature_files
 			(id, feature_id, file_path, operation, session_id,
@@ -256,9 +256,11 @@ func TraceCommit(database *sql.DB, sha string) ([]TraceResult, error) {
 }
 
 // CommitAttributionRate returns (total commits, commits with non-empty feature_id).
+// Both counts come from one pass over git_commits.
 func CommitAttributionRate(database *sql.DB) (total, attributed int) {
-	database.QueryRow(`SELECT COUNT(*) FROM git_commits`).Scan(&total)
-	database.QueryRow(`SELECT COUNT(*) FROM git_commits WHERE feature_id IS NOT NULL AND feature_id != ''`).Scan(&attributed)
+	database.QueryRow(`
+		SELECT COUNT(*), COALESCE(SUM(feature_id IS NOT NULL AND feature_id != ''), 0)
+		FROM git_commits`).Scan(&total, &attributed)
 	return
 }
 
@@ -9,7 +9,7 @@ import (
 )
 
 // InsertMessage stores a transcript message. Returns the auto-generated ID.
-func InsertMessage(db *sql.DB, m *models.Message) (int64, error) {
+func InsertMessage(db Execer, m *models.Message) (int64, error) {
 	res, err := db.Exec(`
 		INSERT OR IGNORE INTO messages
 			(session_id, agent_id, ordinal, role, content, timestamp,
@@ -30,7 +30,7 @@ func InsertMessage(db *sql.DB, m *models.Message) (int64, error) {
 }
 
 // InsertToolCall stores a tool call extracted from a message.
-func InsertToolCall(db *sql.DB, tc *models.ToolCall) error {
+func InsertToolCall(db Execer, tc *models.ToolCall) error {
 	_, err := db.Exec(`
 		INSERT INTO tool_calls
 			(message_id, session_id, tool_name, category, tool_use_id,
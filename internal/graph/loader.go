@@ -5,7 +5,9 @@ import (
 	"fmt"
 	"os"
 	"path/filepath"
+	"runtime"
 	"strings"
+	"sync"
 
 	"github.com/shakestzd/htmlgraph/internal/htmlparse"
 	"github.com/shakestzd/htmlgraph/internal/models"
@@ -20,7 +22,7 @@ func LoadDir(dir string) ([]*models.Node, error) {
 		return nil, fmt.Errorf("read dir %s: %w", dir, err)
 	}
 
-	var nodes []*models.Node
+	var paths []string
 	for _, entry := range entries {
 		var path string
 		if entry.IsDir() {
@@ -36,15 +38,48 @@ func LoadDir(dir string) ([]*models.Node, error) {
 			// Flat format: id.html
 			path = filepath.Join(dir, entry.Name())
 		}
+		paths = append(paths, path)
+	}
+	return parseFiles(paths), nil
+}
 
-		node, err := htmlparse.ParseFile(path)
-		if err != nil {
-			// Skip unparseable files (matches Python's lenient behaviour).
-			continue
+// parseFiles parses paths on up to GOMAXPROCS goroutines, so the open/read
+// syscalls and HTML parsing of many small work item files overlap instead of
+// running one file at a time. Nodes come back in path order; unparseable
+// files are skipped (matches Python's lenient behaviour).
+func parseFiles(paths []string) []*models.Node {
+	parsed := make([]*models.Node, len(paths))
+	workers := min(runtime.GOMAXPROCS(0), len(paths))
+
+	next := make(chan int)
+	var wg sync.WaitGroup
+	for w := 0; w < workers; w++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for i := range next {
+				if node, err := htmlparse.ParseFile(paths[i]); err == nil {
+					parsed[i] = node
+				}
+			}
+		}()
+	}
+	for i := range paths {
+		next <- i
+	}
+	close(next)
+	wg.Wait()
+
+	nodes := parsed[:0]
+	for _, n := range parsed {
+		if n != nil {
+			nodes = append(nodes, n)
 		}
-		nodes = append(nodes, node)
 	}
-	return nodes, nil
+	if len(nodes) == 0 {
+		return nil
+	}
+	return nodes
 }
 
 // LoadAll reads features, bugs, spikes, tracks, plans, and specs from a .htmlgraph root.
@@ -0,0 +1,41 @@
+package graph
+
+import (
+	"fmt"
+	"os"
+	"path/filepath"
+	"slices"
+	"testing"
+)
+
+func TestLoadDir_KeepsDirectoryOrderAndSkipsBadFiles(t *testing.T) {
+	dir := t.TempDir()
+	write := func(name, content string) {
+		t.Helper()
+		path := filepath.Join(dir, name)
+		if err := os.MkdirAll(filepath.Dir(path), 0o755); err != nil {
+			t.Fatal(err)
+		}
+		if err := os.WriteFile(path, []byte(content), 0o644); err != nil {
+			t.Fatal(err)
+		}
+	}
+	var want []string
+	for i := 0; i < 20; i++ {
+		id := fmt.Sprintf("feat-%02d", i)
+		want = append(want, id)
+		write(id+".html", `<article id="`+id+`"><header><h1>`+id+`</h1></header></article>`)
+	}
+	write("feat-99/index.html", `<article id="feat-99"></article>`)
+	want = append(want, "feat-99")
+	write("broken.html", `<p>no article</p>`)
+	write("notes.txt", `ignored`)
+
+	nodes, err := LoadDir(dir)
+	if err != nil {
+		t.Fatalf("LoadDir: %v", err)
+	}
+	if got := nodeIDs(nodes); !slices.Equal(got, want) {
+		t.Errorf("LoadDir IDs = %v, want %v", got, want)
+	}
+}
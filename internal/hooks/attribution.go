@@ -1,13 +1,13 @@
 package hooks
 
 import (
+	"crypto/rand"
 	"encoding/json"
 	"fmt"
 	"os"
 	"path/filepath"
 	"time"
 
-	"github.com/google/uuid"
 	"github.com/shakestzd/htmlgraph/internal/paths"
 )
 
@@ -60,7 +60,9 @@ func writeTraceparent(parentSessionID, parentEventID string) {
 		return
 	}
 
-	filename := fmt.Sprintf("tp-%s.json", uuid.New().String()[:8])
+	suffix := make([]byte, 4)
+	_, _ = rand.Read(suffix)
+	filename := fmt.Sprintf("tp-%x.json", suffix)
 	path := filepath.Join(queueDir, filename)
 	_ = os.WriteFile(path, data, 0o644)
 }
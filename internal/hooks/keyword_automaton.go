@@ -0,0 +1,121 @@
+package hooks
+
+// keywordAutomaton is an Aho-Corasick matcher over a fixed set of keyword
+// lists. A single pass over the text reports, for every list, how many
+// distinct keywords from it occur as substrings — the same answer as one
+// strings.Contains scan per keyword, without rescanning the prompt ~50 times.
+//
+// The goto/fail structure is flattened into a full DFA over a compact
+// alphabet (only bytes that appear in some keyword get their own class), so
+// the scan is one table lookup per input byte.
+type keywordAutomaton struct {
+	class   [256]uint16 // input byte → alphabet class; 0 means "in no keyword"
+	classes int
+	delta   []int32   // delta[state*classes+class] → next state
+	out     [][]int32 // keywords recognised on entering each state
+	kwList  []int     // keyword index → index of the list it came from
+	lists   int
+}
+
+// newKeywordAutomaton compiles the given keyword lists. Keywords must be
+// non-empty and lowercase; ASCII letters in the text match regardless of case,
+// so callers can scan the prompt as-is instead of lowercasing a copy.
+func newKeywordAutomaton(lists ...[]string) *keywordAutomaton {
+	a := &keywordAutomaton{lists: len(lists), classes: 1}
+	for _, kws := range lists {
+		for _, kw := range kws {
+			for i := 0; i < len(kw); i++ {
+				c := kw[i]
+				if a.class[c] != 0 {
+					continue
+				}
+				a.class[c] = uint16(a.classes)
+				if 'a' <= c && c <= 'z' {
+					a.class[c-'a'+'A'] = uint16(a.classes)
+				}
+				a.classes++
+			}
+		}
+	}
+
+	// Build the trie. State 0 is the root; a zero transition means "no edge"
+	// until the BFS below fills it in with the fail target.
+	a.delta = make([]int32, a.classes)
+	a.out = [][]int32{nil}
+	for li, kws := range lists {
+		for _, kw := range kws {
+			k := int32(len(a.kwList))
+			a.kwList = append(a.kwList, li)
+			state := 0
+			for i := 0; i < len(kw); i++ {
+				idx := state*a.classes + int(a.class[kw[i]])
+				if a.delta[idx] == 0 {
+					a.delta[idx] = int32(len(a.out))
+					a.out = append(a.out, nil)
+					a.delta = append(a.delta, make([]int32, a.classes)...)
+				}
+				state = int(a.delta[idx])
+			}
+			a.out[state] = append(a.out[state], k)
+		}
+	}
+
+	// Breadth-first pass: compute fail links, inherit their outputs, and
+	// replace missing edges with the fail state's transition.
+	fail := make([]int32, len(a.out))
+	queue := make([]int32, 0, len(a.out))
+	for c := 1; c < a.classes; c++ {
+		if next := a.delta[c]; next != 0 {
+			queue = append(queue, next)
+		}
+	}
+	for len(queue) > 0 {
+		state := int(queue[0])
+		queue = queue[1:]
+		a.out[state] = append(a.out[state], a.out[fail[state]]...)
+		for c := 1; c < a.classes; c++ {
+			idx := state*a.classes + c
+			failNext := a.delta[int(fail[state])*a.classes+c]
+			if next := a.delta[idx]; next != 0 {
+				fail[next] = failNext
+				queue = append(queue, next)
+			} else {
+				a.delta[idx] = failNext
+			}
+		}
+	}
+	return a
+}
+
+// counts returns, per keyword list, how many distinct keywords from that list
+// appear in text. When caps is non-nil it holds one positive cap per list and
+// the scan stops as soon as every list has reached its cap, so counts beyond a
+// cap are a lower bound rather than exact.
+func (a *keywordAutomaton) counts(text string, caps []int) []int {
+	counts := make([]int, a.lists)
+	seen := make([]uint64, (len(a.kwList)+63)/64) // bitset of matched keywords
+	open := a.lists                               // lists still below their cap
+	if caps == nil {
+		open = -1 // never reaches zero
+	}
+	state := 0
+	for i := 0; i < len(text); i++ {
+		state = int(a.delta[state*a.classes+int(a.class[text[i]])])
+		for _, k := range a.out[state] {
+			bit := uint64(1) << (k % 64)
+			if seen[k/64]&bit != 0 {
+				continue
+			}
+			seen[k/64] |= bit
+			li := a.kwList[k]
+			counts[li]++
+			if caps != nil && counts[li] == caps[li] {
+				open--
+				if open == 0 {
+					return counts
+				}
+			}
+		}
+	}
+	return counts
+}
@@ -0,0 +1,66 @@
+package hooks
+
+import (
+	"strings"
+	"testing"
+)
+
+func TestKeywordAutomaton_MatchesContainsPerList(t *testing.T) {
+	lists := [][]string{
+		explorationKeywords,
+		codeChangeKeywords,
+		gitKeywords,
+		{"a", "aa", "aaa", "ab", "bab", "b"}, // overlapping suffixes
+	}
+	a := newKeywordAutomaton(lists...)
+
+	texts := []string{
+		"",
+		"ok",
+		"git commit and push the branch",
+		"please review and fix the grep output, then git add it",
+		"find where is the refactor — show me what files changed",
+		"aaab bab",
+		"ba",
+	}
+	for _, text := range texts {
+		got := a.counts(text, nil)
+		for li, kws := range lists {
+			want := 0
+			for _, kw := range kws {
+				if strings.Contains(text, kw) {
+					want++
+				}
+			}
+			if got[li] != want {
+				t.Errorf("counts(%q)[%d] = %d, want %d", text, li, got[li], want)
+			}
+		}
+	}
+}
+
+func TestKeywordAutomaton_CountsDistinctKeywords(t *testing.T) {
+	a := newKeywordAutomaton([]string{"fix", "add"})
+	if got := a.counts("fix fix fix", nil)[0]; got != 1 {
+		t.Errorf("repeated keyword counted %d times, want 1", got)
+	}
+}
+
+func TestKeywordAutomaton_IgnoresASCIICase(t *testing.T) {
+	a := newKeywordAutomaton([]string{"git commit", "push"})
+	if got := a.counts("Please GIT Commit and Push", nil)[0]; got != 2 {
+		t.Errorf("mixed-case text matched %d keywords, want 2", got)
+	}
+}
+
+func TestKeywordAutomaton_StopsOnceEveryCapIsReached(t *testing.T) {
+	a := newKeywordAutomaton([]string{"fix", "add"}, []string{"push"})
+	got := a.counts("fix push add", []int{1, 1})
+	if got[0] != 1 || got[1] != 1 {
+		t.Errorf("counts = %v, want [1 1] (scan should stop before \"add\")", got)
+	}
+	got = a.counts("fix add", []int{1, 1})
+	if got[0] != 2 {
+		t.Errorf("counts[0] = %d, want 2 while list 1 is still below its cap", got[0])
+	}
+}
@@ -70,6 +70,7 @@ func debugLogFields(projectDir, handler string, fields map[string]string, msg st
 // LogError logs a handler error with structured context (handler name, session ID).
 // It resolves the project dir from env/CWD so it can be called from cmd/htmlgraph
 // where projectDir is not yet known. Silently no-ops if the project cannot be found.
+// Pending RecordPhase timings are attached, so a failed hook still reports them.
 func LogError(handler, sessionID, msg string) {
 	projectDir := resolveLogDir()
 	if projectDir == "" {
@@ -79,20 +80,44 @@ func LogError(handler, sessionID, msg string) {
 	if sessionID != "" {
 		fields["session"] = sessionID[:minSessionLen(sessionID)]
 	}
+	takePhases(fields)
 	debugLogFields(projectDir, handler, fields, "[error] "+msg)
 }
 
 // LogTimed writes a structured log line including elapsed duration since start.
 // Convenience wrapper for timing call sites — adds a "duration" field automatically.
 // fields may be nil; a new map is allocated internally if so.
+// Phase timings noted with RecordPhase since the last log line are attached as
+// a "phases" field.
 func LogTimed(projectDir, handler string, fields map[string]string, start time.Time, msg string) {
 	if fields == nil {
 		fields = map[string]string{}
 	}
 	fields["duration"] = time.Since(start).String()
+	takePhases(fields)
 	debugLogFields(projectDir, handler, fields, msg)
 }
 
+// pendingPhases holds phase timings for the current hook invocation until the
+// next LogTimed or LogError line carries them, so each phase doesn't cost its own
+// debug.log open+append. No sync needed — hook handlers run in a single goroutine.
+var pendingPhases []string
+
+// RecordPhase notes how long phase took since start. The timing is written
+// with the next LogTimed or LogError line (normally runHook's completion or
+// error line) as phases=<phase>:<duration>,...
+func RecordPhase(phase string, start time.Time) {
+	pendingPhases = append(pendingPhases, phase+":"+time.Since(start).String())
+}
+
+// takePhases moves pending phase timings into fields["phases"].
+func takePhases(fields map[string]string) {
+	if len(pendingPhases) > 0 {
+		fields["phases"] = strings.Join(pendingPhases, ",")
+		pendingPhases = nil
+	}
+}
+
 // resolveLogDir finds the project directory for logging by checking env then CWD walk-up.
 func resolveLogDir() string {
 	cwd, _ := os.Getwd()
@@ -0,0 +1,61 @@
+package hooks
+
+import (
+	"os"
+	"path/filepath"
+	"strings"
+	"testing"
+	"time"
+)
+
+func TestLogTimed_AttachesRecordedPhases(t *testing.T) {
+	projectDir := t.TempDir()
+	if err := os.MkdirAll(filepath.Join(projectDir, ".htmlgraph"), 0o755); err != nil {
+		t.Fatal(err)
+	}
+	pendingPhases = nil
+
+	start := time.Now()
+	RecordPhase("resolve-context", start)
+	RecordPhase("db-tx", start)
+	LogTimed(projectDir, "runHook", nil, start, "completed")
+	LogTimed(projectDir, "runHook", nil, start, "again")
+
+	data, err := os.ReadFile(filepath.Join(projectDir, ".htmlgraph", "debug.log"))
+	if err != nil {
+		t.Fatalf("read debug.log: %v", err)
+	}
+	lines := strings.Split(strings.TrimSpace(string(data)), "\n")
+	if len(lines) != 2 {
+		t.Fatalf("got %d log lines, want 2:\n%s", len(lines), data)
+	}
+	if !strings.Contains(lines[0], "phases=resolve-context:") || !strings.Contains(lines[0], ",db-tx:") {
+		t.Errorf("first line missing phases field: %q", lines[0])
+	}
+	if strings.Contains(lines[1], "phases=") {
+		t.Errorf("phases should be consumed by the first LogTimed: %q", lines[1])
+	}
+}
+
+func TestLogError_AttachesRecordedPhases(t *testing.T) {
+	projectDir := t.TempDir()
+	if err := os.MkdirAll(filepath.Join(projectDir, ".htmlgraph"), 0o755); err != nil {
+		t.Fatal(err)
+	}
+	t.Setenv("HTMLGRAPH_PROJECT_DIR", projectDir)
+	pendingPhases = nil
+
+	RecordPhase("resolve-context", time.Now())
+	LogError("runHook", "sess-12345678", "handler error: boom")
+
+	data, err := os.ReadFile(filepath.Join(projectDir, ".htmlgraph", "debug.log"))
+	if err != nil {
+		t.Fatalf("read debug.log: %v", err)
+	}
+	if !strings.Contains(string(data), "phases=resolve-context:") {
+		t.Errorf("error line missing phases field: %q", data)
+	}
+	if len(pendingPhases) != 0 {
+		t.Errorf("pending phases not consumed: %v", pendingPhases)
+	}
+}
@@ -75,6 +75,17 @@ func TestSummariseInputNonRead(t *testing.T) {
 	}
 }
 
+func TestSummariseInputReusesInputJSON(t *testing.T) {
+	// Fallback summaries use the caller's JSON instead of re-marshalling.
+	input := map[string]any{"todos": []any{"a"}}
+	if got, want := SummariseInput("TodoWrite", input), `{"todos":["a"]}`; got != want {
+		t.Errorf("SummariseInput(TodoWrite) = %q, want %q", got, want)
+	}
+	if got, want := summariseInput("TodoWrite", input, `{"todos": ["a"]}`), `{"todos": ["a"]}`; got != want {
+		t.Errorf("summariseInput(TodoWrite, json) = %q, want %q", got, want)
+	}
+}
+
 func TestToInt(t *testing.T) {
 	tests := []struct {
 		name string
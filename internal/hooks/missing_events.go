@@ -58,10 +58,7 @@ func recordSimpleEvent(
 func Stop(event *CloudEvent, database *sql.DB) (*HookResult, error) {
 	summary := "Agent stopped"
 	if event.LastAssistantMessage != "" {
-		msg := event.LastAssistantMessage
-		if len(msg) > debugMsgMaxLen {
-			msg = msg[:debugMsgMaxLen] + "…"
-		}
+		msg := truncateSummary(event.LastAssistantMessage, debugMsgMaxLen)
 		summary = fmt.Sprintf("Agent stopped: %s", msg)
 	}
 	return recordSimpleEvent(models.EventEnd, "Stop", summary, "recorded", event, database)
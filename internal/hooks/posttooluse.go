@@ -170,42 +170,43 @@ func PostToolUse(event *CloudEvent, database *sql.DB) (*HookResult, error) {
 }
 
 
-// commitClosingRe matches closing keywords followed by a work item ID in commit messages.
-// Supports: "completes feat-abc123", "closes bug-def456", "fixes spk-789abc",
-// "resolves feat-abc123", and parenthetical form "(feat-abc123)".
-// Case-insensitive matching is applied at call site via strings.ToLower.
-var commitClosingRe = regexp.MustCompile(`(?:completes?|closes?|fix(?:es)?|resolves?)\s+((?:feat|bug|spk)-[0-9a-f]{8})`)
-
-// commitParenRe matches parenthetical work item references at the end of commit
-// messages, e.g. "(feat-abc12345)". This is the existing HtmlGraph convention.
-var commitParenRe = regexp.MustCompile(`\(\s*((?:feat|bug|spk)-[0-9a-f]{8})\s*\)`)
+// commitRefRe matches the two ways a commit message names a work item:
+//   - group 1: closing keywords, e.g. "completes feat-abc12345", "closes bug-def45678",
+//     "fixes spk-789abcde", "resolves feat-abc12345";
+//   - group 2: parenthetical refs, e.g. "(feat-abc12345)" — the existing HtmlGraph
+//     convention.
+//
+// The alternatives cannot claim the same ID, so one scan finds exactly what a
+// scan per pattern would. Case-insensitive matching is applied at call site via
+// strings.ToLower.
+var commitRefRe = regexp.MustCompile(`(?:completes?|closes?|fix(?:es)?|resolves?)\s+((?:feat|bug|spk)-[0-9a-f]{8})` +
+	`|\(\s*((?:feat|bug|spk)-[0-9a-f]{8})\s*\)`)
 
 // extractClosingIDs parses a commit message for work item IDs that should be
 // auto-completed. It recognises two patterns:
 //  1. Closing keywords: "completes feat-abc123", "fixes bug-def456"
 //  2. Parenthetical refs: "(feat-abc123)" — the existing HtmlGraph convention
 //
-// Returns a deduplicated slice of work item IDs.
+// Returns a deduplicated slice of work item IDs, keyword matches first.
 func extractClosingIDs(commitMsg string) []string {
 	seen := map[string]bool{}
-	var ids []string
+	var ids, parenIDs []string
 
-	lower := strings.ToLower(commitMsg)
-	for _, m := range commitClosingRe.FindAllStringSubmatch(lower, -1) {
-		id := m[1]
-		if !seen[id] {
-			seen[id] = true
-			ids = append(ids, id)
+	for _, m := range commitRefRe.FindAllStringSubmatch(strings.ToLower(commitMsg), -1) {
+		if m[1] != "" {
+			ids = append(ids, m[1])
+		} else {
+			parenIDs = append(parenIDs, m[2])
 		}
 	}
-	for _, m := range commitParenRe.FindAllStringSubmatch(lower, -1) {
-		id := m[1]
+	var out []string
+	for _, id := range append(ids, parenIDs...) {
 		if !seen[id] {
 			seen[id] = true
-			ids = append(ids, id)
+			out = append(out, id)
 		}
 	}
-	return ids
+	return out
 }
 
 // autoCompleteFromCommit auto-completes work items referenced in a git commit
@@ -330,12 +331,30 @@ func extractMergeBranch(cmd string) string {
 	return ""
 }
 
-// workItemBranchRe matches a branch name that is itself a work item ID:
+// isWorkItemBranch reports whether a branch name is itself a work item ID:
 // feat-xxxxxxxx, bug-xxxxxxxx, spk-xxxxxxxx (8 hex chars).
-var workItemBranchRe = regexp.MustCompile(`^((?:feat|bug|spk)-[0-9a-f]{8})$`)
+func isWorkItemBranch(branch string) bool {
+	return isShortID(branch, "feat-") || isShortID(branch, "bug-") || isShortID(branch, "spk-")
+}
 
-// trackBranchRe matches a branch that is a track ID: trk-xxxxxxxx.
-var trackBranchRe = regexp.MustCompile(`^(trk-[0-9a-f]{8})$`)
+// isTrackBranch reports whether a branch is a track ID: trk-xxxxxxxx.
+func isTrackBranch(branch string) bool {
+	return isShortID(branch, "trk-")
+}
+
+// isShortID reports whether s is prefix followed by exactly 8 lowercase hex
+// characters. A length check and byte loop, since the IDs have a fixed shape.
+func isShortID(s, prefix string) bool {
+	if len(s) != len(prefix)+8 || !strings.HasPrefix(s, prefix) {
+		return false
+	}
+	for i := len(prefix); i < len(s); i++ {
+		if c := s[i]; (c < '0' || c > '9') && (c < 'a' || c > 'f') {
+			return false
+		}
+	}
+	return true
+}
 
 // autoCompleteByBranch completes in-progress work items based on a branch name.
 // When the branch is a track ID (trk-xxxxxxxx), all in-progress features/bugs/spikes
@@ -343,7 +362,7 @@ var trackBranchRe = regexp.MustCompile(`^(trk-[0-9a-f]{8})$`)
 // is completed. Returns the IDs of completed items.
 func autoCompleteByBranch(branch string, database *sql.DB) []string {
 	// Direct work item branch: feat-xxxxxxxx, bug-xxxxxxxx, spk-xxxxxxxx
-	if workItemBranchRe.MatchString(branch) {
+	if isWorkItemBranch(branch) {
 		if completeIfInProgress(branch, database) {
 			return []string{branch}
 		}
@@ -351,9 +370,8 @@ func autoCompleteByBranch(branch string, database *sql.DB) []string {
 	}
 
 	// Track branch: trk-xxxxxxxx — complete all in-progress items on this track
-	if m := trackBranchRe.FindStringSubmatch(branch); len(m) == 2 {
-		trackID := m[1]
-		return completeInProgressByTrack(trackID, database)
+	if isTrackBranch(branch) {
+		return completeInProgressByTrack(branch, database)
 	}
 
 	return nil
@@ -453,9 +471,7 @@ func summariseOutput(result map[string]any) string {
 	}
 	for _, key := range []string{"output", "content", "result", "error"} {
 		if v, ok := result[key].(string); ok && v != "" {
-			if len(v) > 200 {
-				v = v[:200] + "…"
-			}
+			v = truncateSummary(v, 200)
 			return v
 		}
 	}
@@ -63,6 +63,11 @@ func TestExtractClosingIDs(t *testing.T) {
 			msg:     "fixes feat-aabbccdd (feat-aabbccdd)",
 			wantIDs: []string{"feat-aabbccdd"},
 		},
+		{
+			name:    "keyword IDs listed before parenthetical ones",
+			msg:     "(bug-22222222) closes feat-11111111",
+			wantIDs: []string{"feat-11111111", "bug-22222222"},
+		},
 		{
 			name:    "mixed types",
 			msg:     "closes feat-11111111 and fixes bug-22222222",
@@ -117,7 +117,11 @@ func PreToolUse(event *CloudEvent, database *sql.DB) (*HookResult, error) {
 			}, nil
 		}
 		// Research-first: require at least one Read/Grep/Glob before writing.
-		hasResearch := hasRecentResearch(database, ctx.SessionID)
+		// Only file writes can trip these guards, so skip the lookup otherwise.
+		hasResearch := true
+		if writesFiles(event) {
+			hasResearch = hasRecentResearch(database, ctx.SessionID)
+		}
 		if warn := checkYoloResearchGuard(event.ToolName, ctx.IsYoloMode, hasResearch); warn != "" {
 			return &HookResult{Decision: "block", Reason: warn}, nil
 		}
@@ -133,9 +137,13 @@ func PreToolUse(event *CloudEvent, database *sql.DB) (*HookResult, error) {
 		}
 
 		// Resolve branch from the target file's worktree, not the session CWD.
-		targetFile := extractFilePath(event.ToolInput)
-		cwdBranch := currentBranchIn(event.CWD)
-		branch := branchForFilePath(targetFile, cwdBranch)
+		// The worktree guards ignore everything but file writes, so other
+		// tools skip the git subprocesses entirely.
+		branch := ""
+		if writesFiles(event) {
+			targetFile := extractFilePath(event.ToolInput)
+			branch = branchForFilePath(targetFile, currentBranchIn(event.CWD))
+		}
 		if warn := checkYoloWorktreeGuard(event.ToolName, branch, ctx.IsYoloMode); warn != "" {
 			return &HookResult{Decision: "block", Reason: warn}, nil
 		}
@@ -148,11 +156,16 @@ func PreToolUse(event *CloudEvent, database *sql.DB) (*HookResult, error) {
 		if warn := checkYoloCodeHealthGuard(event, ctx.IsYoloMode); warn != "" {
 			debugLog(ctx.ProjectDir, "[htmlgraph] YOLO code health warning: %s", warn)
 		}
-		testRan := hasRecentTestRun(database, ctx.SessionID)
+		// Test and diff history only matter for git commit commands.
+		testRan, diffRan := true, true
+		if isGitCommit(event) {
+			testRan = hasRecentTestRun(database, ctx.SessionID)
+			diffRan = hasRecentDiffReview(database, ctx.SessionID)
+		}
 		if warn := checkYoloCommitGuard(event, ctx.IsYoloMode, testRan); warn != "" {
 			return &HookResult{Decision: "block", Reason: warn}, nil
 		}
-		if warn := checkYoloDiffReviewGuard(event, ctx.IsYoloMode, hasRecentDiffReview(database, ctx.SessionID)); warn != "" {
+		if warn := checkYoloDiffReviewGuard(event, ctx.IsYoloMode, diffRan); warn != "" {
 			return &HookResult{Decision: "block", Reason: warn}, nil
 		}
 		if warn := checkYoloUIValidationGuard(event, ctx.IsYoloMode, database, ctx.SessionID); warn != "" {
@@ -177,20 +190,20 @@ func PreToolUse(event *CloudEvent, database *sql.DB) (*HookResult, error) {
 // and returns an allow result. Used by the plan mode bypass and the normal
 // flow to avoid duplicating the event recording logic.
 func recordEventAndAllow(event *CloudEvent, ctx *toolUseContext, database *sql.DB) (*HookResult, error) {
-	inputSummary := SummariseInput(event.ToolName, event.ToolInput)
-
 	var toolInputStr string
 	if event.ToolInput != nil {
 		if b, err := json.Marshal(event.ToolInput); err == nil {
 			toolInputStr = string(b)
 		}
 	}
+	inputSummary := summariseInput(event.ToolName, event.ToolInput, toolInputStr)
 
+	now := time.Now().UTC()
 	ev := &models.AgentEvent{
 		EventID:       uuid.New().String(),
 		AgentID:       ctx.AgentID,
 		EventType:     models.EventToolCall,
-		Timestamp:     time.Now().UTC(),
+		Timestamp:     now,
 		ToolName:      event.ToolName,
 		InputSummary:  inputSummary,
 		ToolInput:     toolInputStr,
@@ -201,8 +214,8 @@ func recordEventAndAllow(event *CloudEvent, ctx *toolUseContext, database *sql.D
 		Status:        "started",
 		StepID:        event.ToolUseID,
 		Source:        "hook",
-		CreatedAt:     time.Now().UTC(),
-		UpdatedAt:     time.Now().UTC(),
+		CreatedAt:     now,
+		UpdatedAt:     now,
 	}
 
 	_ = db.InsertEvent(database, ev)
@@ -279,7 +292,9 @@ func isBashHtmlGraphWrite(event *CloudEvent) bool {
 		return false
 	}
 	cmd, _ := event.ToolInput["command"].(string)
-	if cmd == "" {
+	// Every branch of bashHtmlGraphWritePattern needs a literal ".htmlgraph/",
+	// so most commands are rejected here without running either regex.
+	if !containsHtmlgraphDir(cmd) {
 		return false
 	}
 	// Skip commands that are HtmlGraph CLI invocations — those are allowed.
@@ -336,6 +351,25 @@ func isBashFileWrite(event *CloudEvent) bool {
 	return bashFileWritePattern.MatchString(cmd)
 }
 
+// writesFiles reports whether event can modify files: a Write/Edit/MultiEdit
+// call or a Bash command matching bashFileWritePattern.
+func writesFiles(event *CloudEvent) bool {
+	switch event.ToolName {
+	case "Write", "Edit", "MultiEdit":
+		return true
+	}
+	return isBashFileWrite(event)
+}
+
+// isGitCommit reports whether event is a Bash git commit command.
+func isGitCommit(event *CloudEvent) bool {
+	if event.ToolName != "Bash" {
+		return false
+	}
+	cmd, _ := event.ToolInput["command"].(string)
+	return gitCommitPattern.MatchString(cmd)
+}
+
 // bashFileWritePattern matches Bash commands that write/modify files.
 // Intentionally conservative — matches known destructive patterns only.
 // The redirect branches use negative lookbehind for digits (to skip 2>/dev/null)
@@ -366,6 +400,13 @@ var bashFileWritePattern = regexp.MustCompile(
 
 // SummariseInput builds a short human-readable summary of tool input.
 func SummariseInput(toolName string, input map[string]any) string {
+	return summariseInput(toolName, input, "")
+}
+
+// summariseInput is SummariseInput for callers that already hold the input's
+// compact JSON, so the fallback summary reuses it instead of marshalling the
+// map again. An empty inputJSON is marshalled on demand.
+func summariseInput(toolName string, input map[string]any, inputJSON string) string {
 	if input == nil {
 		return toolName
 	}
@@ -378,18 +419,17 @@ func SummariseInput(toolName string, input map[string]any) string {
 	// For file tools, use the path.
 	for _, key := range []string{"path", "file_path", "command", "query", "prompt"} {
 		if v, ok := input[key].(string); ok && v != "" {
-			if len(v) > 120 {
-				v = v[:120] + "…"
-			}
+			v = truncateSummary(v, 120)
 			return v
 		}
 	}
 	// Fallback: compact JSON of first 200 chars.
-	b, _ := json.Marshal(input)
-	s := string(b)
-	if len(s) > 200 {
-		s = s[:200] + "…"
+	s := inputJSON
+	if s == "" {
+		b, _ := json.Marshal(input)
+		s = string(b)
 	}
+	s = truncateSummary(s, 200)
 	return s
 }
 
@@ -421,9 +461,7 @@ func summariseReadInput(input map[string]any) string {
 		}
 	}
 
-	if len(filePath) > 120 {
-		filePath = filePath[:120] + "…"
-	}
+	filePath = truncateSummary(filePath, 120)
 	return filePath
 }
 
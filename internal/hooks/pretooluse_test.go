@@ -262,3 +262,28 @@ func TestCheckBashCwdGuard(t *testing.T) {
 		})
 	}
 }
+
+func TestWritesFilesAndIsGitCommit(t *testing.T) {
+	tests := []struct {
+		tool   string
+		cmd    string
+		writes bool
+		commit bool
+	}{
+		{"Read", "", false, false},
+		{"Edit", "", true, false},
+		{"Bash", "ls -la", false, false},
+		{"Bash", "sed -i 's/a/b/' main.go", true, false},
+		{"Bash", "git commit -m 'x'", false, true},
+		{"Grep", "git commit", false, false},
+	}
+	for _, tt := range tests {
+		event := &CloudEvent{ToolName: tt.tool, ToolInput: map[string]any{"command": tt.cmd}}
+		if got := writesFiles(event); got != tt.writes {
+			t.Errorf("writesFiles(%s %q) = %v, want %v", tt.tool, tt.cmd, got, tt.writes)
+		}
+		if got := isGitCommit(event); got != tt.commit {
+			t.Errorf("isGitCommit(%s %q) = %v, want %v", tt.tool, tt.cmd, got, tt.commit)
+		}
+	}
+}
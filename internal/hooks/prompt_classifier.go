@@ -2,7 +2,9 @@ package hooks
 
 import (
 	"fmt"
+	"math"
 	"strings"
+	"sync"
 )
 
 // PromptIntent captures the classification of a user prompt.
@@ -67,51 +69,96 @@ var investigationKeywords = []string{
 	"why", "how come", "what causes",
 }
 
-// continuationKeywords signal "keep going" type prompts.
+// continuationKeywords signal "keep going" type prompts. matchesContinuation
+// tries them in order, so the acknowledgements that make up most short
+// prompts come first. Entries are prefix-matched, so a keyword that starts
+// with an earlier one (e.g. "okay" after "ok") would never be reached.
 var continuationKeywords = []string{
-	"continue", "resume", "proceed", "go on", "keep going",
-	"next", "where we left off", "from before", "last time",
-	"ok", "okay", "yes", "sure", "do it", "go ahead",
+	"ok", "yes", "continue", "go ahead", "proceed", "do it", "sure",
+	"next", "resume", "keep going", "go on",
+	"where we left off", "from before", "last time",
+}
+
+// Indices into promptKeywords().counts, in the order the lists are compiled.
+const (
+	kwImplementation = iota
+	kwInvestigation
+	kwBug
+	kwExploration
+	kwCodeChange
+	kwGit
+)
+
+// promptKeywords matches every intent keyword list in a single pass over the
+// prompt, so a pasted 100KB log costs one linear scan rather than one per
+// keyword. Built on first use so hooks that never classify a prompt skip it.
+var promptKeywords = sync.OnceValue(func() *keywordAutomaton {
+	return newKeywordAutomaton(
+		implementationKeywords, investigationKeywords, bugKeywords,
+		explorationKeywords, codeChangeKeywords, gitKeywords,
+	)
+})
+
+// promptKeywordCaps is the hit count past which each list can no longer change
+// the result: one hit sets a boolean intent flag, and the CIGS lists stop
+// mattering once their multiplier reaches the 1.0 confidence ceiling. Lets
+// the keyword scan of a long prompt stop early.
+var promptKeywordCaps = []int{
+	kwImplementation: 1,
+	kwInvestigation:  1,
+	kwBug:            1,
+	kwExploration:    saturatingHits(explorationConfidenceMultiplier),
+	kwCodeChange:     saturatingHits(codeChangeConfidenceMultiplier),
+	kwGit:            saturatingHits(gitConfidenceMultiplier),
+}
+
+// saturatingHits returns the smallest hit count n with n*multiplier >= 1.
+func saturatingHits(multiplier float64) int {
+	return int(math.Ceil(1 / multiplier))
 }
 
 // ClassifyPrompt analyses a user prompt and returns a PromptIntent
 // describing the user's likely intent. Uses fast keyword matching
 // (no regex) for hook-level performance.
 func ClassifyPrompt(prompt string) PromptIntent {
-	lower := strings.ToLower(strings.TrimSpace(prompt))
+	// Matching ignores ASCII case, so the prompt is scanned without making a
+	// lowercased copy of it.
+	text := strings.TrimSpace(prompt)
 	intent := PromptIntent{}
 
 	// Short prompts that are pure continuation signals.
-	if matchesContinuation(lower) {
+	if matchesContinuation(text) {
 		intent.IsContinuation = true
 		intent.Confidence = continuationConfidence
 		return intent
 	}
 
+	hits := promptKeywords().counts(text, promptKeywordCaps)
+
 	// Primary intent classification.
-	if countKeywordHits(lower, implementationKeywords) > 0 {
+	if hits[kwImplementation] > 0 {
 		intent.IsImplementation = true
 		intent.Confidence = max(intent.Confidence, implementationConfidence)
 	}
-	if countKeywordHits(lower, investigationKeywords) > 0 {
+	if hits[kwInvestigation] > 0 {
 		intent.IsInvestigation = true
 		intent.Confidence = max(intent.Confidence, investigationConfidence)
 	}
-	if countKeywordHits(lower, bugKeywords) > 0 {
+	if hits[kwBug] > 0 {
 		intent.IsBugReport = true
 		intent.Confidence = max(intent.Confidence, bugReportConfidence)
 	}
 
 	// CIGS delegation flags.
-	if n := countKeywordHits(lower, explorationKeywords); n > 0 {
+	if n := hits[kwExploration]; n > 0 {
 		intent.InvolvesExploration = true
 		intent.Confidence = max(intent.Confidence, min(1.0, float64(n)*explorationConfidenceMultiplier))
 	}
-	if n := countKeywordHits(lower, codeChangeKeywords); n > 0 {
+	if n := hits[kwCodeChange]; n > 0 {
 		intent.InvolvesCodeChanges = true
 		intent.Confidence = max(intent.Confidence, min(1.0, float64(n)*codeChangeConfidenceMultiplier))
 	}
-	if n := countKeywordHits(lower, gitKeywords); n > 0 {
+	if n := hits[kwGit]; n > 0 {
 		intent.InvolvesGit = true
 		intent.Confidence = max(intent.Confidence, min(1.0, float64(n)*gitConfidenceMultiplier))
 	}
@@ -241,26 +288,12 @@ func cigsImperatives(intent PromptIntent) string {
 
 // ---------- helpers ----------
 
-// countKeywordHits returns how many keywords from the list appear in text.
-func countKeywordHits(text string, keywords []string) int {
-	n := 0
-	for _, kw := range keywords {
-		if strings.Contains(text, kw) {
-			n++
-		}
-	}
-	return n
-}
-
 // matchesContinuation checks whether the prompt is a short continuation signal.
-// We only match when the keyword appears at or near the start of the prompt.
-func matchesContinuation(lower string) bool {
+// We only match when the keyword appears at the start of the prompt, which also
+// covers a prompt that is exactly the keyword. Case is ignored.
+func matchesContinuation(text string) bool {
 	for _, kw := range continuationKeywords {
-		if strings.HasPrefix(lower, kw) {
-			return true
-		}
-		// Also match if the entire prompt equals the keyword.
-		if lower == kw {
+		if len(text) >= len(kw) && strings.EqualFold(text[:len(kw)], kw) {
 			return true
 		}
 	}
@@ -1,6 +1,9 @@
 package hooks
 
-import "testing"
+import (
+	"strings"
+	"testing"
+)
 
 func TestClassifyPrompt_Implementation(t *testing.T) {
 	tests := []struct {
@@ -70,6 +73,7 @@ func TestClassifyPrompt_Continuation(t *testing.T) {
 	}{
 		{"continue", true},
 		{"ok", true},
+		{"okay, carry on", true},
 		{"yes", true},
 		{"go ahead", true},
 		{"proceed with the implementation", true},
@@ -84,6 +88,16 @@ func TestClassifyPrompt_Continuation(t *testing.T) {
 	}
 }
 
+func TestContinuationKeywords_NoShadowedPrefixes(t *testing.T) {
+	for i, kw := range continuationKeywords {
+		for _, earlier := range continuationKeywords[:i] {
+			if strings.HasPrefix(kw, earlier) {
+				t.Errorf("continuation keyword %q is unreachable behind %q", kw, earlier)
+			}
+		}
+	}
+}
+
 func TestClassifyPrompt_CIGS_Exploration(t *testing.T) {
 	intent := ClassifyPrompt("search for all error handling code and review it")
 	if !intent.InvolvesExploration {
@@ -105,6 +119,23 @@ func TestClassifyPrompt_CIGS_Git(t *testing.T) {
 	}
 }
 
+// Keywords match as substrings, so inflected forms still count. Word-token
+// matching would miss every case below.
+func TestClassifyPrompt_CIGS_MatchesInflectedForms(t *testing.T) {
+	intent := ClassifyPrompt("the parser fixes landed after the team refactored the lexer")
+	if !intent.InvolvesCodeChanges {
+		t.Error("expected InvolvesCodeChanges = true for fixes/refactored")
+	}
+	intent = ClassifyPrompt("the branch was committed and pushed yesterday")
+	if !intent.InvolvesGit {
+		t.Error("expected InvolvesGit = true for committed/pushed")
+	}
+	intent = ClassifyPrompt("the handler crashed twice overnight")
+	if !intent.IsBugReport {
+		t.Error("expected IsBugReport = true for crashed")
+	}
+}
+
 func TestClassifyPrompt_Confidence(t *testing.T) {
 	// A clear implementation request should have high confidence.
 	intent := ClassifyPrompt("implement a new feature for user authentication")
@@ -6,11 +6,13 @@
 package hooks
 
 import (
+	"bytes"
 	"encoding/json"
 	"fmt"
 	"io"
 	"os"
 	"path/filepath"
+	"unicode/utf8"
 
 	"github.com/shakestzd/htmlgraph/internal/agent"
 	"github.com/shakestzd/htmlgraph/internal/paths"
@@ -95,7 +97,40 @@ func ReadInput() (*CloudEvent, error) {
 
 // WriteResult encodes result as JSON to stdout.
 func WriteResult(result *HookResult) error {
-	return json.NewEncoder(os.Stdout).Encode(result)
+	return writeResult(os.Stdout, result)
+}
+
+// Pre-encoded forms of the two most common responses, written verbatim so the
+// fast-exit paths skip the JSON encoder.
+const (
+	continueJSON = "{\"continue\":true}\n"
+	emptyJSON    = "{}\n"
+)
+
+// writeResult encodes result into a buffer and hands it to w in one Write.
+// HTML escaping is off: AdditionalContext is markdown for the model, and
+// rewriting <, > and & as \u003c-style escapes only inflates the payload.
+func writeResult(w io.Writer, result *HookResult) error {
+	switch *result {
+	case HookResult{Continue: true}:
+		_, err := io.WriteString(w, continueJSON)
+		return err
+	case HookResult{}:
+		_, err := io.WriteString(w, emptyJSON)
+		return err
+	}
+	// Size the buffer for the string fields up front so a multi-KB
+	// AdditionalContext block is encoded without repeated regrowth.
+	var buf bytes.Buffer
+	buf.Grow(len(result.Decision) + len(result.Reason) + len(result.Message) +
+		len(result.AdditionalContext) + 96)
+	enc := json.NewEncoder(&buf)
+	enc.SetEscapeHTML(false)
+	if err := enc.Encode(result); err != nil {
+		return err
+	}
+	_, err := w.Write(buf.Bytes())
+	return err
 }
 
 // Allow writes an empty JSON object to allow the tool to proceed.
@@ -109,12 +144,13 @@ func Allow() error {
 
 // Continue writes a continue:true response (used by non-blocking hooks).
 func Continue() error {
-	return WriteResult(&HookResult{Continue: true})
+	_, err := io.WriteString(os.Stdout, continueJSON)
+	return err
 }
 
 // Empty writes an empty JSON object (hook has no opinion).
 func Empty() error {
-	_, err := fmt.Fprintln(os.Stdout, "{}")
+	_, err := io.WriteString(os.Stdout, emptyJSON)
 	return err
 }
 
@@ -137,6 +173,19 @@ func IsHtmlGraphProject(projectDir string) bool {
 	return err == nil
 }
 
+// truncateSummary caps s at maxLen bytes, appending "…" when it was cut. The
+// cut backs off to a rune boundary so summaries stay valid UTF-8.
+func truncateSummary(s string, maxLen int) string {
+	if len(s) <= maxLen {
+		return s
+	}
+	cut := maxLen
+	for cut > 0 && !utf8.RuneStart(s[cut]) {
+		cut--
+	}
+	return s[:cut] + "…"
+}
+
 // DBPath returns the canonical SQLite path for the given project directory.
 func DBPath(projectDir string) string {
 	return filepath.Join(projectDir, ".htmlgraph", "htmlgraph.db")
@@ -166,11 +215,26 @@ func EnvSessionID(eventSessionID string) string {
 	}
 	// Last resort: .active-session file.
 	cwd, _ := os.Getwd()
+	if activeSessionFallback.cwd == cwd && activeSessionFallback.sessionID != "" {
+		return activeSessionFallback.sessionID
+	}
 	projectDir := ResolveProjectDir(cwd, "")
 	if projectDir != "" {
 		if as := ReadActiveSession(projectDir); as != nil && as.SessionID != "" {
+			activeSessionFallback.cwd = cwd
+			activeSessionFallback.sessionID = as.SessionID
 			return as.SessionID
 		}
 	}
 	return ""
 }
+
+// activeSessionFallback remembers the session ID EnvSessionID found in
+// .active-session for a given working directory, so repeated calls in one
+// process skip the project-dir walk and file read. Only hits are cached: a
+// miss may be followed by SessionStart writing the file.
+// No sync needed — hook handlers run in a single goroutine.
+var activeSessionFallback struct {
+	cwd       string
+	sessionID string
+}
@@ -1,7 +1,10 @@
 package hooks
 
 import (
+	"bytes"
 	"encoding/json"
+	"os"
+	"path/filepath"
 	"testing"
 )
 
@@ -71,3 +74,80 @@ func TestCloudEvent_LegacyPayload(t *testing.T) {
 		t.Errorf("TaskData[subject] = %v, want %q", ev.TaskData["subject"], "Run tests")
 	}
 }
+
+func TestWriteResult_SingleLineWithoutHTMLEscaping(t *testing.T) {
+	var buf bytes.Buffer
+	result := &HookResult{AdditionalContext: "use <feature> && <bug>"}
+	if err := writeResult(&buf, result); err != nil {
+		t.Fatalf("writeResult: %v", err)
+	}
+	want := `{"additionalContext":"use <feature> && <bug>"}` + "\n"
+	if got := buf.String(); got != want {
+		t.Errorf("writeResult = %q, want %q", got, want)
+	}
+}
+
+func TestWriteResult_PreEncodedResponsesMatchEncoder(t *testing.T) {
+	for _, result := range []HookResult{{Continue: true}, {}} {
+		var got bytes.Buffer
+		if err := writeResult(&got, &result); err != nil {
+			t.Fatalf("writeResult: %v", err)
+		}
+		want, _ := json.Marshal(result)
+		if got.String() != string(want)+"\n" {
+			t.Errorf("writeResult(%+v) = %q, want %q", result, got.String(), string(want)+"\n")
+		}
+	}
+}
+
+func TestTruncateSummary(t *testing.T) {
+	tests := []struct {
+		in     string
+		maxLen int
+		want   string
+	}{
+		{"short", 10, "short"},
+		{"exactly10!", 10, "exactly10!"},
+		{"hello world", 5, "hello…"},
+		// "é" is two bytes; a cut at byte 2 would split it.
+		{"héllo", 2, "h…"},
+	}
+	for _, tt := range tests {
+		if got := truncateSummary(tt.in, tt.maxLen); got != tt.want {
+			t.Errorf("truncateSummary(%q, %d) = %q, want %q", tt.in, tt.maxLen, got, tt.want)
+		}
+	}
+}
+
+func TestEnvSessionID_CachesActiveSessionFallback(t *testing.T) {
+	projectDir := t.TempDir()
+	hgDir := filepath.Join(projectDir, ".htmlgraph")
+	if err := os.MkdirAll(hgDir, 0o755); err != nil {
+		t.Fatal(err)
+	}
+	activePath := filepath.Join(hgDir, ".active-session")
+	if err := os.WriteFile(activePath, []byte(`{"session_id":"sess-cached"}`), 0o644); err != nil {
+		t.Fatal(err)
+	}
+	t.Setenv("HTMLGRAPH_SESSION_ID", "")
+	t.Setenv("HTMLGRAPH_PROJECT_DIR", "")
+
+	orig, _ := os.Getwd()
+	if err := os.Chdir(projectDir); err != nil {
+		t.Fatal(err)
+	}
+	t.Cleanup(func() {
+		_ = os.Chdir(orig)
+		activeSessionFallback.cwd, activeSessionFallback.sessionID = "", ""
+	})
+
+	if got := EnvSessionID(""); got != "sess-cached" {
+		t.Fatalf("EnvSessionID = %q, want sess-cached", got)
+	}
+	if err := os.Remove(activePath); err != nil {
+		t.Fatal(err)
+	}
+	if got := EnvSessionID(""); got != "sess-cached" {
+		t.Errorf("second EnvSessionID = %q, want cached sess-cached", got)
+	}
+}
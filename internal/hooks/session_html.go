@@ -1,6 +1,7 @@
 package hooks
 
 import (
+	"bytes"
 	"encoding/json"
 	"fmt"
 	"html"
@@ -61,9 +62,16 @@ func CreateSessionHTML(projectDir string, s *models.Session) {
 		isSubagent = "true"
 	}
 
-	startedAt := s.CreatedAt.UTC().Format(time.RFC3339)
+	// Escape each value once; startedAt and the agent appear more than once.
+	startedAt := html.EscapeString(s.CreatedAt.UTC().Format(time.RFC3339))
+	agent := html.EscapeString(s.AgentAssigned)
+	sessionID := html.EscapeString(s.SessionID)
+	projectAttr := html.EscapeString(canonicalProjectDir)
+	startCommit := html.EscapeString(s.StartCommit)
 
-	var b strings.Builder
+	var b bytes.Buffer
+	b.Grow(sessionHTMLScaffoldSize + 3*len(startedAt) + 2*len(agent) +
+		len(sessionID) + len(projectAttr) + len(startCommit) + len(isSubagent))
 	b.WriteString(`<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -71,41 +79,41 @@ func CreateSessionHTML(projectDir string, s *models.Session) {
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <meta name="htmlgraph-version" content="1.0">
     <title>Session `)
-	b.WriteString(html.EscapeString(startedAt))
+	b.WriteString(startedAt)
 	b.WriteString(`</title>
     <link rel="stylesheet" href="../styles.css">
 </head>
 <body>
     <article id="`)
-	b.WriteString(html.EscapeString(s.SessionID))
+	b.WriteString(sessionID)
 	b.WriteString(`"
              data-type="session"
              data-status="active"
              data-agent="`)
-	b.WriteString(html.EscapeString(s.AgentAssigned))
+	b.WriteString(agent)
 	b.WriteString(`"
              data-project-dir="`)
-	b.WriteString(html.EscapeString(canonicalProjectDir))
+	b.WriteString(projectAttr)
 	b.WriteString(`"
              data-started-at="`)
-	b.WriteString(html.EscapeString(startedAt))
+	b.WriteString(startedAt)
 	b.WriteString(`"
              data-event-count="0"
              data-is-subagent="`)
 	b.WriteString(isSubagent)
 	b.WriteString(`"
              data-start-commit="`)
-	b.WriteString(html.EscapeString(s.StartCommit))
+	b.WriteString(startCommit)
 	b.WriteString(`">
 
         <header>
             <h1>Session `)
-	b.WriteString(html.EscapeString(startedAt))
+	b.WriteString(startedAt)
 	b.WriteString(`</h1>
             <div class="metadata">
                 <span class="badge status-active">Active</span>
                 <span class="badge">`)
-	b.WriteString(html.EscapeString(s.AgentAssigned))
+	b.WriteString(agent)
 	b.WriteString(`</span>
                 <span class="badge">0 events</span>
             </div>
@@ -124,15 +132,21 @@ func CreateSessionHTML(projectDir string, s *models.Session) {
 `)
 
 	htmlPath := filepath.Join(sessDir, s.SessionID+".html")
-	if err := os.WriteFile(htmlPath, []byte(b.String()), 0o644); err != nil {
+	if err := os.WriteFile(htmlPath, b.Bytes(), 0o644); err != nil {
 		debugLog(projectDir, "[session-html] write %s: %v", htmlPath, err)
 	}
 }
 
+// sessionHTMLScaffoldSize is the size of CreateSessionHTML's static markup,
+// rounded up, so the buffer is allocated once at its final size.
+const sessionHTMLScaffoldSize = 1 << 10
+
 // AppendEventToSessionHTML appends a <li> element to the session's HTML
-// activity log. It opens the file with an exclusive flock, reads, modifies,
-// and rewrites — preventing lost updates from concurrent hook invocations.
-// Errors are silently logged (non-critical path).
+// activity log. It opens the file with an exclusive flock, finds the closing
+// </ol> near the end of the file, and rewrites the file from there on —
+// preventing lost updates from concurrent hook invocations without reading or
+// rewriting the events already logged. Errors are silently logged
+// (non-critical path).
 func AppendEventToSessionHTML(projectDir, sessionID string, ev SessionEvent) {
 	htmlPath := filepath.Join(projectDir, ".htmlgraph", "sessions", sessionID+".html")
 
@@ -150,15 +164,28 @@ func AppendEventToSessionHTML(projectDir, sessionID string, ev SessionEvent) {
 	}
 	defer syscall.Flock(int(f.Fd()), syscall.LOCK_UN) //nolint:errcheck
 
-	data, err := io.ReadAll(f)
+	info, err := f.Stat()
 	if err != nil {
-		debugLog(projectDir, "[session-html] read %s: %v", htmlPath, err)
+		debugLog(projectDir, "[session-html] stat %s: %v", htmlPath, err)
 		return
 	}
 
-	content := string(data)
-	marker := "</ol>"
-	idx := strings.LastIndex(content, marker)
+	// Only the closing markup after </ol> moves, and it sits at the end of the
+	// file. Read the tail first and fall back to the whole file if the marker
+	// is further back than that.
+	marker := []byte("</ol>")
+	tailStart := max(info.Size()-sessionHTMLTailSize, 0)
+	tail, err := io.ReadAll(io.NewSectionReader(f, tailStart, info.Size()-tailStart))
+	idx := bytes.LastIndex(tail, marker)
+	if err == nil && idx == -1 && tailStart > 0 {
+		tailStart = 0
+		tail, err = io.ReadAll(io.NewSectionReader(f, 0, info.Size()))
+		idx = bytes.LastIndex(tail, marker)
+	}
+	if err != nil {
+		debugLog(projectDir, "[session-html] read %s: %v", htmlPath, err)
+		return
+	}
 	if idx == -1 {
 		debugLog(projectDir, "[session-html] no </ol> marker in %s", htmlPath)
 		return
@@ -169,7 +196,8 @@ func AppendEventToSessionHTML(projectDir, sessionID string, ev SessionEvent) {
 		successStr = "false"
 	}
 
-	var li strings.Builder
+	var li bytes.Buffer
+	li.Grow(256 + len(ev.Summary) + len(tail) - idx)
 	li.WriteString(`                <li data-ts="`)
 	li.WriteString(ev.Timestamp.UTC().Format(time.RFC3339))
 	li.WriteString(`" data-tool="`)
@@ -198,28 +226,30 @@ func AppendEventToSessionHTML(projectDir, sessionID string, ev SessionEvent) {
 	li.WriteString(html.EscapeString(ev.Summary))
 	li.WriteString("</li>\n")
 
-	// Insert the <li> just before </ol>.
-	newContent := content[:idx] + li.String() + "            " + content[idx:]
-
-	// Truncate and rewrite in place (we already hold the lock).
-	if err := f.Truncate(0); err != nil {
-		debugLog(projectDir, "[session-html] truncate %s: %v", htmlPath, err)
-		return
-	}
-	if _, err := f.Seek(0, 0); err != nil {
-		debugLog(projectDir, "[session-html] seek %s: %v", htmlPath, err)
-		return
-	}
-	if _, err := f.Write([]byte(newContent)); err != nil {
+	// Insert the <li> just before </ol>: everything in front of the marker
+	// stays put, so write the <li> and the shifted tail at the marker's offset
+	// (we already hold the lock). The file only grows, so nothing is left over
+	// to truncate.
+	li.WriteString("            ")
+	li.Write(tail[idx:])
+	if _, err := f.WriteAt(li.Bytes(), tailStart+int64(idx)); err != nil {
 		debugLog(projectDir, "[session-html] write %s: %v", htmlPath, err)
 	}
 }
 
-// articleAttrRe matches data attributes on the <article> tag for replacement.
-var articleStatusRe = regexp.MustCompile(`data-status="[^"]*"`)
-var articleEventCountRe = regexp.MustCompile(`data-event-count="[^"]*"`)
-var badgeStatusRe = regexp.MustCompile(`<span class="badge status-[^"]*">[^<]*</span>`)
-var badgeEventsRe = regexp.MustCompile(`<span class="badge">\d+ events?</span>`)
+// sessionHTMLTailSize is how much of a session file AppendEventToSessionHTML
+// reads looking for the closing </ol>. The markup after it is well under
+// this, so the fallback to a full read only triggers on hand-edited files.
+const sessionHTMLTailSize = 4 << 10
+
+// finalizeRe matches every fragment FinalizeSessionHTML rewrites: the
+// <article> status and event-count attributes and the matching header badges.
+// The alternatives start with distinct literals and never overlap, so one pass
+// gives the same result as one ReplaceAll per fragment.
+var finalizeRe = regexp.MustCompile(`data-status="[^"]*"` +
+	`|data-event-count="[^"]*"` +
+	`|<span class="badge status-[^"]*">[^<]*</span>` +
+	`|<span class="badge">\d+ events?</span>`)
 
 // FinalizeSessionHTML updates the session HTML file with completion data:
 // sets data-status, adds data-ended-at, and updates data-event-count.
@@ -247,39 +277,44 @@ func FinalizeSessionHTML(projectDir, sessionID, endedAt, status string, eventCou
 		return
 	}
 
-	content := string(data)
-
-	// Update data-status.
-	content = articleStatusRe.ReplaceAllString(content,
-		fmt.Sprintf(`data-status="%s"`, html.EscapeString(status)))
+	statusAttr := fmt.Sprintf(`data-status="%s"`, html.EscapeString(status))
+	countAttr := fmt.Sprintf(`data-event-count="%d"`, eventCount)
+	statusTitle := strings.ToUpper(status[:1]) + status[1:]
+	statusBadge := fmt.Sprintf(`<span class="badge status-%s">%s</span>`,
+		html.EscapeString(status), html.EscapeString(statusTitle))
+	evtWord := "events"
+	if eventCount == 1 {
+		evtWord = "event"
+	}
+	eventsBadge := fmt.Sprintf(`<span class="badge">%d %s</span>`, eventCount, evtWord)
+
+	// Update data-status, data-event-count and both badges in one scan.
+	content := finalizeRe.ReplaceAllStringFunc(string(data), func(m string) string {
+		switch {
+		case strings.HasPrefix(m, "data-status="):
+			return statusAttr
+		case strings.HasPrefix(m, "data-event-count="):
+			return countAttr
+		case strings.HasPrefix(m, `<span class="badge status-`):
+			return statusBadge
+		default:
+			return eventsBadge
+		}
+	})
 
 	// Add data-ended-at after data-status on the article tag.
-	// Find the article's data-status and insert data-ended-at after it.
-	endedAtAttr := fmt.Sprintf(`data-ended-at="%s"`, html.EscapeString(endedAt))
 	if !strings.Contains(content, "data-ended-at=") {
-		// Insert after data-status in the article tag.
-		statusAttr := fmt.Sprintf(`data-status="%s"`, html.EscapeString(status))
+		endedAtAttr := fmt.Sprintf(`data-ended-at="%s"`, html.EscapeString(endedAt))
 		content = strings.Replace(content, statusAttr,
 			statusAttr+"\n             "+endedAtAttr, 1)
 	}
 
-	// Update data-event-count.
-	content = articleEventCountRe.ReplaceAllString(content,
-		fmt.Sprintf(`data-event-count="%d"`, eventCount))
-
-	// Update badge status text.
-	statusTitle := strings.ToUpper(status[:1]) + status[1:]
-	content = badgeStatusRe.ReplaceAllString(content,
-		fmt.Sprintf(`<span class="badge status-%s">%s</span>`,
-			html.EscapeString(status), html.EscapeString(statusTitle)))
-
-	// Update badge event count text.
-	evtWord := "events"
-	if eventCount == 1 {
-		evtWord = "event"
+	// A repeated SessionEnd with no new events (e.g. after a resume) yields
+	// the same bytes. Skip the rewrite so the file's mtime stays put and the
+	// next incremental reindex does not re-read it.
+	if content == string(data) {
+		return
 	}
-	content = badgeEventsRe.ReplaceAllString(content,
-		fmt.Sprintf(`<span class="badge">%d %s</span>`, eventCount, evtWord))
 
 	if err := f.Truncate(0); err != nil {
 		debugLog(projectDir, "[session-html] finalize truncate %s: %v", htmlPath, err)
@@ -364,7 +399,7 @@ func RenderIngestedSessionHTML(htmlgraphDir, sessionID, sessionSourceDir string,
 			Success:   true,
 			EventID:   ingest.EventID(sessionID, tc.ToolUseID, tc.ToolName, i),
 			FeatureID: tc.FeatureID,
-			Summary:   SummariseInput(tc.ToolName, inputMap),
+			Summary:   summariseInput(tc.ToolName, inputMap, tc.InputJSON),
 		})
 	}
 
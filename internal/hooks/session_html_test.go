@@ -1,6 +1,7 @@
 package hooks
 
 import (
+	"fmt"
 	"os"
 	"path/filepath"
 	"strings"
@@ -302,6 +303,115 @@ func TestFinalizeSessionHTML(t *testing.T) {
 	}
 }
 
+func TestFinalizeSessionHTML_UnchangedSkipsRewrite(t *testing.T) {
+	projectDir := t.TempDir()
+	s := &models.Session{
+		SessionID:     "sess-finalize-002",
+		AgentAssigned: "claude-code",
+		Status:        "active",
+		CreatedAt:     time.Now().UTC(),
+	}
+	CreateSessionHTML(projectDir, s)
+	FinalizeSessionHTML(projectDir, s.SessionID, "2026-04-08T15:00:00Z", "completed", 0)
+
+	htmlPath := filepath.Join(projectDir, ".htmlgraph", "sessions", s.SessionID+".html")
+	old := time.Now().Add(-time.Hour).Truncate(time.Second)
+	if err := os.Chtimes(htmlPath, old, old); err != nil {
+		t.Fatal(err)
+	}
+	FinalizeSessionHTML(projectDir, s.SessionID, "2026-04-08T16:00:00Z", "completed", 0)
+
+	info, err := os.Stat(htmlPath)
+	if err != nil {
+		t.Fatal(err)
+	}
+	if !info.ModTime().Equal(old) {
+		t.Errorf("mtime changed to %v; an identical finalize should not rewrite the file", info.ModTime())
+	}
+}
+
+func TestAppendEventToSessionHTML_LargeFile(t *testing.T) {
+	projectDir := t.TempDir()
+	s := &models.Session{
+		SessionID:     "sess-append-large",
+		AgentAssigned: "claude-code",
+		CreatedAt:     time.Now().UTC(),
+	}
+	CreateSessionHTML(projectDir, s)
+	htmlPath := filepath.Join(projectDir, ".htmlgraph", "sessions", s.SessionID+".html")
+	before, err := os.ReadFile(htmlPath)
+	if err != nil {
+		t.Fatal(err)
+	}
+
+	// Enough events that the file outgrows the tail AppendEventToSessionHTML reads.
+	const n = 60
+	for i := 0; i < n; i++ {
+		AppendEventToSessionHTML(projectDir, s.SessionID, SessionEvent{
+			Timestamp: time.Now().UTC(),
+			ToolName:  "Bash",
+			Success:   true,
+			EventID:   fmt.Sprintf("evt-large-%03d", i),
+			Summary:   strings.Repeat("x", 80),
+		})
+	}
+
+	data, err := os.ReadFile(htmlPath)
+	if err != nil {
+		t.Fatal(err)
+	}
+	if len(data) <= sessionHTMLTailSize {
+		t.Fatalf("file is %d bytes; test needs more than %d", len(data), sessionHTMLTailSize)
+	}
+	content := string(data)
+	if c := strings.Count(content, "<li "); c != n {
+		t.Errorf("expected %d <li> elements, got %d", n, c)
+	}
+	first := strings.Index(content, `data-event-id="evt-large-000"`)
+	last := strings.Index(content, fmt.Sprintf(`data-event-id="evt-large-%03d"`, n-1))
+	if first == -1 || last == -1 || first > last {
+		t.Error("events should appear in append order")
+	}
+	olClose := strings.LastIndex(string(before), "</ol>")
+	if !strings.HasSuffix(content, string(before[olClose:])) {
+		t.Error("markup after </ol> should be unchanged")
+	}
+}
+
+func TestAppendEventToSessionHTML_MarkerOutsideTail(t *testing.T) {
+	projectDir := t.TempDir()
+	sessDir := filepath.Join(projectDir, ".htmlgraph", "sessions")
+	if err := os.MkdirAll(sessDir, 0o755); err != nil {
+		t.Fatal(err)
+	}
+	htmlPath := filepath.Join(sessDir, "sess-far-marker.html")
+	trailer := "<!-- " + strings.Repeat("y", sessionHTMLTailSize) + " -->\n"
+	if err := os.WriteFile(htmlPath, []byte("<ol reversed>\n</ol>\n"+trailer), 0o644); err != nil {
+		t.Fatal(err)
+	}
+
+	AppendEventToSessionHTML(projectDir, "sess-far-marker", SessionEvent{
+		Timestamp: time.Now().UTC(),
+		ToolName:  "Read",
+		Success:   true,
+		EventID:   "evt-far-001",
+		Summary:   "found by the full read",
+	})
+
+	data, err := os.ReadFile(htmlPath)
+	if err != nil {
+		t.Fatal(err)
+	}
+	content := string(data)
+	li := strings.Index(content, `data-event-id="evt-far-001"`)
+	if li == -1 || li > strings.Index(content, "</ol>") {
+		t.Errorf("<li> should be inserted before </ol>:\n%.200s", content)
+	}
+	if !strings.HasSuffix(content, "</ol>\n"+trailer) {
+		t.Error("markup after </ol> should be unchanged")
+	}
+}
+
 func TestMissingSessionHTMLDoesNotError(t *testing.T) {
 	projectDir := t.TempDir()
 	if err := os.MkdirAll(filepath.Join(projectDir, ".htmlgraph"), 0o755); err != nil {
@@ -158,10 +158,7 @@ func SessionStart(event *CloudEvent, database *sql.DB, projectDir string) (*Hook
 	if err := runSessionTransaction(database, s, inp); err != nil {
 		debugLog(projectDir, "[session-start] transaction failed (session=%s): %v", shortID, err)
 	}
-	LogTimed(projectDir, "session-start", map[string]string{
-		"phase":   "db-tx",
-		"session": shortID,
-	}, txStart, "transaction complete")
+	RecordPhase("db-tx", txStart)
 
 	// Write canonical session HTML file (non-critical, errors silently logged).
 	CreateSessionHTML(projectDir, s)
@@ -64,9 +64,13 @@ func sweepOrphans(database *sql.DB, projectDir string, orphans []db.OrphanEvent)
 		return 0
 	}
 
+	// One clock read for the whole batch; each orphan is then a plain
+	// timestamp comparison against the cutoff.
+	hardCutoff := time.Now().Add(-OrphanHardCutoff)
+
 	var appended int
 	for _, o := range orphans {
-		if time.Since(o.CreatedAt) > OrphanHardCutoff {
+		if o.CreatedAt.Before(hardCutoff) {
 			debugLog(projectDir, "[sweep] orphan %s is older than 24h — sweeping anyway",
 				o.EventID)
 		}
@@ -28,29 +28,28 @@ func SubagentStart(event *CloudEvent, database *sql.DB) (*HookResult, error) {
 		agentType = "general-purpose"
 	}
 
-	// Link delegation to the most recent UserQuery in this session.
-	parentEventID, _ := db.LatestEventByTool(database, sessionID, "UserQuery")
-
+	now := time.Now().UTC()
 	ev := &models.AgentEvent{
-		EventID:       eventID,
-		AgentID:       event.AgentID,
-		EventType:     models.EventTaskDelegation,
-		Timestamp:     time.Now().UTC(),
-		ToolName:      "Task",
-		InputSummary:  fmt.Sprintf("Subagent started: type=%s id=%s", agentType, event.AgentID),
-		SessionID:     sessionID,
-		FeatureID:     featureID,
-		ParentEventID: parentEventID,
-		SubagentType:  agentType,
-		Status:        "started",
-		Source:        "hook",
-		CreatedAt:     time.Now().UTC(),
-		UpdatedAt:     time.Now().UTC(),
+		EventID:      eventID,
+		AgentID:      event.AgentID,
+		EventType:    models.EventTaskDelegation,
+		Timestamp:    now,
+		ToolName:     "Task",
+		InputSummary: fmt.Sprintf("Subagent started: type=%s id=%s", agentType, event.AgentID),
+		SessionID:    sessionID,
+		FeatureID:    featureID,
+		SubagentType: agentType,
+		Status:       "started",
+		Source:       "hook",
+		CreatedAt:    now,
+		UpdatedAt:    now,
 	}
 
-	if err := db.InsertEvent(database, ev); err != nil {
-		debugLog(projectDir, "[error] handler=subagent-start session=%s: insert event: %v", sessionID[:minSessionLen(sessionID)], err)
-	}
+	// Best-effort: the insert commits on the write queue while the env var
+	// and hint files below are written.
+	enqueueWrite(database, projectDir, "subagent-start", func(tx *sql.Tx) error {
+		return insertDelegationTx(tx, ev)
+	})
 
 	// Write traceparent so the subagent's session-start can claim it.
 	writeTraceparent(sessionID, eventID)
@@ -61,6 +60,19 @@ func SubagentStart(event *CloudEvent, database *sql.DB) (*HookResult, error) {
 	return &HookResult{Continue: true}, nil
 }
 
+// insertDelegationTx links the delegation to the most recent UserQuery and
+// inserts it within tx, so the parent lookups and the insert (plus its
+// total_events trigger) share one commit instead of paying a journal sync each.
+func insertDelegationTx(tx *sql.Tx, ev *models.AgentEvent) error {
+	// Link delegation to the most recent UserQuery in this session.
+	ev.ParentEventID, _ = db.LatestEventByTool(tx, ev.SessionID, "UserQuery")
+
+	if err := db.InsertEventTx(tx, ev); err != nil {
+		return fmt.Errorf("insert delegation %s: %w", ev.EventID, err)
+	}
+	return nil
+}
+
 // SubagentStop handles the SubagentStop Claude Code hook event.
 // It marks the task_delegation for this specific agent as completed and
 // stores the last assistant message as the output summary.
@@ -70,31 +82,16 @@ func SubagentStop(event *CloudEvent, database *sql.DB) (*HookResult, error) {
 		return &HookResult{Continue: true}, nil
 	}
 
-	outputSummary := event.LastAssistantMessage
-	if len(outputSummary) > outputSummaryMaxLen {
-		outputSummary = outputSummary[:outputSummaryMaxLen] + "…"
-	}
-
-	// Prefer agent_id-scoped lookup to avoid matching the wrong delegation
-	// in concurrent multi-agent scenarios.
-	var eventID string
-	if event.AgentID != "" {
-		eventID, _ = db.FindStartedDelegationByAgent(database, sessionID, event.AgentID)
-	}
+	outputSummary := truncateSummary(event.LastAssistantMessage, outputSummaryMaxLen)
 
-	// Fallback: most recent started delegation in this session.
-	if eventID == "" {
-		var err error
-		eventID, err = db.FindStartedDelegation(database, sessionID)
-		if err != nil {
-			return &HookResult{Continue: true}, nil
-		}
-	}
-
-	if err := db.UpdateEventFields(database, eventID, "completed", outputSummary); err != nil {
-		projectDir := ResolveProjectDir(event.CWD, event.SessionID)
-		debugLog(projectDir, "[error] handler=subagent-stop session=%s: update event fields: %v", sessionID[:minSessionLen(sessionID)], err)
-	}
+	// Find and complete the delegation in one statement inside the batched
+	// write. The agent_id-scoped match is preferred to avoid completing the
+	// wrong delegation in concurrent multi-agent scenarios.
+	agentID := event.AgentID
+	enqueueWrite(database, ResolveProjectDir(event.CWD, event.SessionID), "subagent-stop", func(tx *sql.Tx) error {
+		_, err := db.CompleteStartedDelegation(tx, sessionID, agentID, outputSummary)
+		return err
+	})
 
 	// Clean up per-subagent hint file written by SubagentStart.
 	if event.AgentID != "" {
@@ -7,6 +7,7 @@ import (
 	"os"
 	"os/exec"
 	"path/filepath"
+	"strings"
 	"time"
 
 	"github.com/shakestzd/htmlgraph/internal/paths"
@@ -47,9 +48,15 @@ func runTaskCompletionGate(projectDir string) taskCompletionGateResult {
 	ctx, cancel := context.WithTimeout(context.Background(), taskCompletionGateTimeout)
 	defer cancel()
 
-	cmd := exec.CommandContext(ctx, "sh", "-c", testCmd)
+	// The canonical test commands are plain argv lists, so run them directly
+	// instead of through a shell, and keep only the head of their output.
+	argv := strings.Fields(testCmd)
+	out := &headBuffer{limit: taskCompletionGateOutputLimit}
+	cmd := exec.CommandContext(ctx, argv[0], argv[1:]...)
 	cmd.Dir = projectDir
-	out, err := cmd.CombinedOutput()
+	cmd.Stdout = out
+	cmd.Stderr = out
+	err := cmd.Run()
 
 	if ctx.Err() == context.DeadlineExceeded {
 		return taskCompletionGateResult{
@@ -62,10 +69,28 @@ func runTaskCompletionGate(projectDir string) taskCompletionGateResult {
 	return taskCompletionGateResult{
 		Passed:   err == nil,
 		GateName: testCmd,
-		Output:   string(out),
+		Output:   string(out.buf),
 	}
 }
 
+// taskCompletionGateOutputLimit caps how much test output the gate keeps.
+// Only pass/fail decides the gate; a full test log is never needed in memory.
+const taskCompletionGateOutputLimit = 4 << 10
+
+// headBuffer keeps the first limit bytes written to it and discards the rest.
+// Writes always report success so the child never sees a broken pipe.
+type headBuffer struct {
+	buf   []byte
+	limit int
+}
+
+func (h *headBuffer) Write(p []byte) (int, error) {
+	if room := h.limit - len(h.buf); room > 0 {
+		h.buf = append(h.buf, p[:min(room, len(p))]...)
+	}
+	return len(p), nil
+}
+
 // taskCompletionConfig represents the relevant fields from .htmlgraph/config.json.
 type taskCompletionConfig struct {
 	BlockOnQualityFailure bool `json:"block_task_completion_on_quality_failure"`
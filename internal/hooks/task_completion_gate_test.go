@@ -135,3 +135,15 @@ func TestTaskCompleted_FlagOn_BlocksOnFailure(t *testing.T) {
 	// Reset cache so subsequent tests are not affected.
 	featureIDCache = featureIDCacheEntry{}
 }
+
+func TestHeadBuffer_KeepsOnlyTheHead(t *testing.T) {
+	h := &headBuffer{limit: 5}
+	for _, chunk := range []string{"abc", "defg", "hij"} {
+		if n, err := h.Write([]byte(chunk)); n != len(chunk) || err != nil {
+			t.Fatalf("Write(%q) = %d, %v; want full write", chunk, n, err)
+		}
+	}
+	if got := string(h.buf); got != "abcde" {
+		t.Errorf("buf = %q, want %q", got, "abcde")
+	}
+}
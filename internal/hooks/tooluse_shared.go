@@ -104,14 +104,10 @@ func resolveToolUseContext(event *CloudEvent, database *sql.DB) *toolUseContext
 
 	projectDir := ResolveProjectDir(event.CWD, event.SessionID)
 	hgDir := filepath.Join(projectDir, ".htmlgraph")
-	yolo := isYoloFromEvent(event, hgDir)
+	yolo := isYoloFromEvent(event, database)
 	parentEventID := resolveParentEventID(database, sessionID, agentID, isSubagent)
 
-	LogTimed(projectDir, "pretooluse", map[string]string{
-		"phase":   "resolve-context",
-		"session": sessionID[:minSessionLen(sessionID)],
-		"tool":    event.ToolName,
-	}, start, "context resolved")
+	RecordPhase("resolve-context", start)
 
 	return &toolUseContext{
 		SessionID:        sessionID,
@@ -20,19 +20,20 @@ func TrackEvent(toolName string, event *CloudEvent, database *sql.DB) (*HookResu
 
 	featureID := cachedGetActiveFeatureID(database, sessionID)
 
+	now := time.Now().UTC()
 	ev := &models.AgentEvent{
 		EventID:      uuid.New().String(),
 		AgentID:      resolveEventAgentID(event),
 		EventType:    models.EventCheckPoint,
-		Timestamp:    time.Now().UTC(),
+		Timestamp:    now,
 		ToolName:     toolName,
 		InputSummary: fmt.Sprintf("%s event recorded", toolName),
 		SessionID:    sessionID,
 		FeatureID:    featureID,
 		Status:       "recorded",
 		Source:       "hook",
-		CreatedAt:    time.Now().UTC(),
-		UpdatedAt:    time.Now().UTC(),
+		CreatedAt:    now,
+		UpdatedAt:    now,
 	}
 
 	_ = db.InsertEvent(database, ev) // Non-fatal
@@ -27,13 +27,11 @@ func UserPrompt(event *CloudEvent, database *sql.DB) (*HookResult, error) {
 
 	featureID := cachedGetActiveFeatureID(database, sessionID)
 
-	promptSummary := sanitizePrompt(event.Prompt)
+	promptSummary := sanitizePrompt(event.Prompt, promptSummaryMaxLen)
 	if promptSummary == "" {
 		return &HookResult{Continue: true}, nil
 	}
-	if len(promptSummary) > promptSummaryMaxLen {
-		promptSummary = promptSummary[:promptSummaryMaxLen] + "…"
-	}
+	promptSummary = truncateSummary(promptSummary, promptSummaryMaxLen)
 
 	// Dedup: skip if identical UserQuery was recorded in last 5 seconds.
 	recentCount, _ := db.CountRecentDuplicates(database, sessionID, "UserQuery", promptSummary, 5)
@@ -41,39 +39,51 @@ func UserPrompt(event *CloudEvent, database *sql.DB) (*HookResult, error) {
 		return &HookResult{Continue: true}, nil
 	}
 
+	now := time.Now().UTC()
 	ev := &models.AgentEvent{
 		EventID:      uuid.New().String(),
 		AgentID:      resolveEventAgentID(event),
 		EventType:    models.EventToolCall,
-		Timestamp:    time.Now().UTC(),
+		Timestamp:    now,
 		ToolName:     "UserQuery",
 		InputSummary: promptSummary,
 		SessionID:    sessionID,
 		FeatureID:    featureID,
 		Status:       "recorded",
 		Source:       "hook",
-		CreatedAt:    time.Now().UTC(),
-		UpdatedAt:    time.Now().UTC(),
+		CreatedAt:    now,
+		UpdatedAt:    now,
 	}
 
-	if err := db.InsertEvent(database, ev); err != nil {
-		debugLog(ResolveProjectDir(event.CWD, event.SessionID), "[error] handler=user-prompt session=%s: insert event: %v", sessionID[:minSessionLen(sessionID)], err)
+	// Record the UserQuery and update the session's last_user_query fields.
+	if err := runUserQueryTransaction(database, ev, event.Prompt); err != nil {
+		debugLog(ResolveProjectDir(event.CWD, event.SessionID), "[error] handler=user-prompt session=%s: record user query: %v", sessionID[:minSessionLen(sessionID)], err)
 	}
 
-	// Update session last_user_query fields.
-	updateLastQuery(database, sessionID, event.Prompt)
-
 	// Classify the prompt intent for CIGS guidance.
 	intent := ClassifyPrompt(event.Prompt)
 
-	// Look up active work item type for intent-specific directives.
-	activeWorkType := getActiveWorkItemType(database, featureID)
+	// A continuation ("ok", "go ahead") never gets an intent directive or CIGS
+	// lines, so with no open work items to list there is nothing to inject:
+	// answer directly without reading the active work item.
+	open := listOpenWorkItems(database)
+	if intent.IsContinuation && len(open) == 0 {
+		return &HookResult{Continue: true}, nil
+	}
+
+	// Read the active work item once; its type drives the implementation and
+	// bug-report directives and its details feed the attribution block. When
+	// neither will use it, skip the query.
+	active := activeFeature{id: featureID}
+	if len(open) > 0 || intent.IsImplementation || intent.IsBugReport {
+		active = loadActiveFeature(database, featureID)
+	}
 
 	// Build attribution block (open work items listing).
-	attributionBlock := buildAttributionGuidance(database, sessionID, featureID)
+	attributionBlock := buildAttributionGuidance(database, open, active)
 
 	// Combine classification guidance with attribution.
-	guidance := GenerateGuidance(intent, featureID, activeWorkType, attributionBlock)
+	guidance := GenerateGuidance(intent, featureID, active.itemType, attributionBlock)
 
 	result := &HookResult{}
 	if guidance != "" {
@@ -103,20 +113,37 @@ func ensureSessionExists(database *sql.DB, sessionID string, event *CloudEvent)
 		sessionID, now, ResolveProjectDir(event.CWD, event.SessionID))
 }
 
-// updateLastQuery refreshes last_user_query_at and last_user_query on the session.
-func updateLastQuery(database *sql.DB, sessionID, prompt string) {
-	summary := prompt
-	if len(summary) > sessionQueryMaxLen {
-		summary = summary[:sessionQueryMaxLen] + "…"
+// runUserQueryTransaction inserts the UserQuery event and refreshes the
+// session's last-query fields in a single SQLite transaction, so recording a
+// prompt pays one journal sync instead of one per statement.
+func runUserQueryTransaction(database *sql.DB, ev *models.AgentEvent, prompt string) error {
+	tx, err := database.Begin()
+	if err != nil {
+		return err
 	}
-	now := time.Now().UTC().Format(time.RFC3339)
-	_, _ = database.Exec(`
+	defer tx.Rollback() //nolint:errcheck
+
+	if err := db.InsertEventTx(tx, ev); err != nil {
+		return err
+	}
+	if err := updateLastQueryTx(tx, ev.SessionID, prompt, ev.Timestamp); err != nil {
+		return err
+	}
+	return tx.Commit()
+}
+
+// updateLastQueryTx refreshes last_user_query_at and last_user_query on the
+// session within tx.
+func updateLastQueryTx(tx *sql.Tx, sessionID, prompt string, now time.Time) error {
+	summary := truncateSummary(prompt, sessionQueryMaxLen)
+	_, err := tx.Exec(`
 		UPDATE sessions
 		SET last_user_query_at = ?,
 		    last_user_query = ?
 		WHERE session_id = ?`,
-		now, summary, sessionID,
+		now.UTC().Format(time.RFC3339), summary, sessionID,
 	)
+	return err
 }
 
 // compactCLIRef is a per-turn CLI quick-reference injected into CIGS guidance.
@@ -126,13 +153,12 @@ const compactCLIRef = `**htmlgraph CLI** — feature|bug|spike|track|plan [creat
 
 // buildAttributionGuidance returns a compact CIGS attribution block listing
 // open work items so Claude can call htmlgraph feature start for the right item.
-func buildAttributionGuidance(database *sql.DB, sessionID, activeFeatureID string) string {
-	open := listOpenWorkItems(database)
+func buildAttributionGuidance(database *sql.DB, open []workItemRow, active activeFeature) string {
 	if len(open) == 0 {
 		return ""
 	}
 
-	activeContext := buildActiveFeatureContext(database, activeFeatureID)
+	activeContext := buildActiveFeatureContext(database, active)
 
 	lines := []string{
 		"## Work Item Attribution (CIGS)",
@@ -147,46 +173,74 @@ func buildAttributionGuidance(database *sql.DB, sessionID, activeFeatureID strin
 
 	lines = append(lines, "**Open work items** — run `htmlgraph feature start <id>`:")
 	for _, item := range open {
-		if item.id == activeFeatureID {
+		if item.id == active.id {
 			continue // already shown in active context above
 		}
 		lines = append(lines, fmt.Sprintf("  `%s` — %s [%s]", item.id, item.title, item.status))
 	}
 	lines = append(lines, "", compactCLIRef)
-	return joinLines(lines)
+	return strings.Join(lines, "\n")
 }
 
-// buildActiveFeatureContext returns a rich context block for the active feature.
-// Returns empty string if no active feature or feature not found.
-func buildActiveFeatureContext(database *sql.DB, featureID string) string {
+// activeFeature is the features row for the session's active work item.
+// UserPrompt reads it once and shares it between the intent directive (which
+// only needs the type) and the attribution block (which needs the rest).
+type activeFeature struct {
+	id             string
+	found          bool
+	itemType       string
+	title          string
+	description    string
+	trackID        string
+	stepsTotal     int
+	stepsCompleted int
+}
+
+// loadActiveFeature reads the active work item's row. found is false when
+// featureID is empty or the lookup fails.
+func loadActiveFeature(database *sql.DB, featureID string) activeFeature {
+	f := activeFeature{id: featureID}
 	if featureID == "" {
-		return ""
+		return f
 	}
-
-	var title, description, status, trackID sql.NullString
-	var stepsTotal, stepsCompleted int
+	var itemType, title, description, trackID sql.NullString
 	err := database.QueryRow(`
-		SELECT title, description, status, track_id, steps_total, steps_completed
+		SELECT type, title, description, track_id, steps_total, steps_completed
 		FROM features WHERE id = ?`, featureID,
-	).Scan(&title, &description, &status, &trackID, &stepsTotal, &stepsCompleted)
+	).Scan(&itemType, &title, &description, &trackID, &f.stepsTotal, &f.stepsCompleted)
 	if err != nil {
-		return "**ACTIVE**: " + featureID
+		return f
+	}
+	f.found = true
+	f.itemType = itemType.String
+	f.title = title.String
+	f.description = description.String
+	f.trackID = trackID.String
+	return f
+}
+
+// buildActiveFeatureContext returns a rich context block for the active feature.
+// Returns empty string if no active feature or feature not found.
+func buildActiveFeatureContext(database *sql.DB, f activeFeature) string {
+	if f.id == "" {
+		return ""
+	}
+	if !f.found {
+		return "**ACTIVE**: " + f.id
 	}
+	featureID := f.id
 
 	lines := []string{
-		fmt.Sprintf("**ACTIVE**: %s — %s", featureID, title.String),
+		fmt.Sprintf("**ACTIVE**: %s — %s", featureID, f.title),
 	}
 
-	if description.Valid && description.String != "" {
-		desc := description.String
-		if len(desc) > activeDescMaxLen {
-			desc = desc[:activeDescMaxLen] + "…"
-		}
+	if f.description != "" {
+		desc := truncateSummary(f.description, activeDescMaxLen)
 		lines = append(lines, fmt.Sprintf("  Description: %s", desc))
 	}
 
-	if stepsTotal > 0 {
-		lines = append(lines, fmt.Sprintf("  Steps: %d/%d complete", stepsCompleted, stepsTotal))
+	if f.stepsTotal > 0 {
+		lines = append(lines, fmt.Sprintf("  Steps: %d/%d complete", f.stepsCompleted, f.stepsTotal))
 	} else {
 		lines = append(lines, "  Steps: none defined — add with `htmlgraph feature add-step`")
 	}
@@ -204,8 +258,8 @@ func buildActiveFeatureContext(database *sql.DB, featureID string) string {
 		lines = append(lines, fmt.Sprintf("  Blocked by: %s", strings.Join(parts, ", ")))
 	}
 
-	if trackID.Valid && trackID.String != "" {
-		if trackInfo := queryTrackProgress(database, trackID.String); trackInfo != "" {
+	if f.trackID != "" {
+		if trackInfo := queryTrackProgress(database, f.trackID); trackInfo != "" {
 			lines = append(lines, fmt.Sprintf("  Track: %s", trackInfo))
 		}
 	}
@@ -308,19 +362,6 @@ func listOpenWorkItems(database *sql.DB) []workItemRow {
 	return items
 }
 
-// getActiveWorkItemType returns the type ("feature", "bug", "spike") of the
-// active work item, or "" if no active item or lookup fails.
-func getActiveWorkItemType(database *sql.DB, featureID string) string {
-	if featureID == "" {
-		return ""
-	}
-	var itemType sql.NullString
-	_ = database.QueryRow(
-		`SELECT type FROM features WHERE id = ?`, featureID,
-	).Scan(&itemType)
-	return itemType.String
-}
-
 func activeFeatureOrNone(id string) string {
 	if id == "" {
 		return "none"
@@ -328,27 +369,71 @@ func activeFeatureOrNone(id string) string {
 	return id
 }
 
-// sanitizePrompt strips XML notification/reminder blocks from prompt text.
-func sanitizePrompt(s string) string {
-	for _, tag := range []string{"task-notification", "system-reminder", "command-message", "local-command-caveat"} {
-		open := "<" + tag + ">"
-		close := "</" + tag + ">"
-		for {
-			i := strings.Index(s, open)
-			if i == -1 {
-				break
-			}
-			j := strings.Index(s[i:], close)
-			if j == -1 {
-				s = s[:i]
-				break
-			}
-			s = s[:i] + s[i+j+len(close):]
+// promptNoiseTags are the XML notification/reminder blocks sanitizePrompt
+// strips, spelled out once instead of concatenated on every prompt.
+var promptNoiseTags = [...]struct{ open, close string }{
+	{"<task-notification>", "</task-notification>"},
+	{"<system-reminder>", "</system-reminder>"},
+	{"<command-message>", "</command-message>"},
+	{"<local-command-caveat>", "</local-command-caveat>"},
+}
+
+// stripNoiseBlocks removes every promptNoiseTags block from s in a single
+// left-to-right pass: each '<' is checked against all open tags at once, a
+// match skips past its close tag, and an unclosed block drops the rest of s.
+// Kept text is copied once, rather than rescanning the prompt per tag and
+// re-concatenating it per removed block. Where blocks of different tags
+// overlap, the one that opens first wins.
+func stripNoiseBlocks(s string) string {
+	if strings.IndexByte(s, '<') == -1 {
+		return s
+	}
+	var b strings.Builder
+	b.Grow(len(s))
+	for {
+		i := strings.IndexByte(s, '<')
+		if i == -1 {
+			break
+		}
+		closeTag := noiseCloseTag(s[i:])
+		if closeTag == "" {
+			b.WriteString(s[:i+1])
+			s = s[i+1:]
+			continue
+		}
+		b.WriteString(s[:i])
+		j := strings.Index(s[i:], closeTag)
+		if j == -1 {
+			return b.String()
+		}
+		s = s[i+j+len(closeTag):]
+	}
+	b.WriteString(s)
+	return b.String()
+}
+
+// noiseCloseTag returns the close tag for the noise block s starts with, or
+// "" if s does not start with one of promptNoiseTags.
+func noiseCloseTag(s string) string {
+	for _, tag := range promptNoiseTags {
+		if strings.HasPrefix(s, tag.open) {
+			return tag.close
 		}
 	}
+	return ""
+}
+
+// sanitizePrompt strips XML notification/reminder blocks from prompt text.
+// Line cleaning stops once more than maxLen bytes have been kept: callers only
+// store a truncated summary, so a pasted 200KB log is not split and re-joined
+// in full to keep its first few hundred bytes.
+func sanitizePrompt(s string, maxLen int) string {
+	s = stripNoiseBlocks(s)
 	// Strip lines that are just notification artifacts
-	var cleaned []string
-	for _, line := range strings.Split(s, "\n") {
+	var cleaned strings.Builder
+	for s != "" && cleaned.Len() <= maxLen {
+		line, rest, _ := strings.Cut(s, "\n")
+		s = rest
 		trimmed := strings.TrimSpace(line)
 		if trimmed == "" {
 			continue
@@ -359,18 +444,10 @@ func sanitizePrompt(s string) string {
 		if strings.HasPrefix(trimmed, "Read the output file to retrieve") {
 			continue
 		}
-		cleaned = append(cleaned, trimmed)
-	}
-	return strings.TrimSpace(strings.Join(cleaned, "\n"))
-}
-
-func joinLines(lines []string) string {
-	result := ""
-	for i, l := range lines {
-		result += l
-		if i < len(lines)-1 {
-			result += "\n"
+		if cleaned.Len() > 0 {
+			cleaned.WriteByte('\n')
 		}
+		cleaned.WriteString(trimmed)
 	}
-	return result
+	return cleaned.String()
 }
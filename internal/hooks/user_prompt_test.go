@@ -124,6 +124,42 @@ func TestUserPrompt_InsertsUserQuery(t *testing.T) {
 	if count != 1 {
 		t.Errorf("expected 1 UserQuery event, got %d", count)
 	}
+
+	// The same transaction refreshes the session's last-query fields.
+	var lastQuery sql.NullString
+	if err := td.DB.QueryRow(
+		`SELECT last_user_query FROM sessions WHERE session_id = 'test-sess'`,
+	).Scan(&lastQuery); err != nil {
+		t.Fatalf("query session: %v", err)
+	}
+	if lastQuery.String != "implement a new API endpoint" {
+		t.Errorf("last_user_query = %q, want the prompt", lastQuery.String)
+	}
+}
+
+func TestUserPrompt_ContinuationWithoutOpenItems_ReturnsDirectly(t *testing.T) {
+	td := setupTestDB(t)
+	td.addFeature("feat-done0001", "feature", "Shipped", "done")
+	td.setActiveFeature("test-sess", "feat-done0001")
+	t.Setenv("HTMLGRAPH_SESSION_ID", "test-sess")
+
+	result, err := UserPrompt(&CloudEvent{SessionID: "test-sess", Prompt: "ok"}, td.DB)
+	if err != nil {
+		t.Fatalf("UserPrompt: %v", err)
+	}
+	if !result.Continue || result.AdditionalContext != "" {
+		t.Errorf("expected bare continue for a continuation with no open items, got %+v", result)
+	}
+
+	var count int
+	if err := td.DB.QueryRow(
+		`SELECT COUNT(*) FROM agent_events WHERE session_id = 'test-sess' AND tool_name = 'UserQuery'`,
+	).Scan(&count); err != nil {
+		t.Fatalf("query: %v", err)
+	}
+	if count != 1 {
+		t.Errorf("expected the prompt to still be recorded, got %d UserQuery events", count)
+	}
 }
 
 func TestUserPrompt_WithOpenItems_ReturnsAttribution(t *testing.T) {
@@ -237,23 +273,51 @@ func TestCompactCLIRef_MentionsTrackRequirement(t *testing.T) {
 	}
 }
 
-func TestGetActiveWorkItemType(t *testing.T) {
+func TestLoadActiveFeature_ItemType(t *testing.T) {
 	td := setupTestDB(t)
 	defer td.DB.Close()
 
 	td.addFeature("feat-001", "feature", "Auth", "in-progress")
 	td.addFeature("spk-001", "spike", "Research", "in-progress")
 
-	if got := getActiveWorkItemType(td.DB, "feat-001"); got != "feature" {
+	if got := loadActiveFeature(td.DB, "feat-001").itemType; got != "feature" {
 		t.Errorf("expected 'feature', got %q", got)
 	}
-	if got := getActiveWorkItemType(td.DB, "spk-001"); got != "spike" {
+	if got := loadActiveFeature(td.DB, "spk-001").itemType; got != "spike" {
 		t.Errorf("expected 'spike', got %q", got)
 	}
-	if got := getActiveWorkItemType(td.DB, "nonexistent"); got != "" {
+	if got := loadActiveFeature(td.DB, "nonexistent").itemType; got != "" {
 		t.Errorf("expected empty for nonexistent, got %q", got)
 	}
-	if got := getActiveWorkItemType(td.DB, ""); got != "" {
+	if got := loadActiveFeature(td.DB, "").itemType; got != "" {
 		t.Errorf("expected empty for empty ID, got %q", got)
 	}
 }
+
+func TestSanitizePrompt_StopsAfterMaxLen(t *testing.T) {
+	long := strings.Repeat("line of pasted log output\n", 10000)
+	got := sanitizePrompt("<system-reminder>x</system-reminder>\n"+long, promptSummaryMaxLen)
+	if len(got) <= promptSummaryMaxLen || len(got) > promptSummaryMaxLen+len("line of pasted log output\n") {
+		t.Errorf("sanitized length = %d, want just over %d", len(got), promptSummaryMaxLen)
+	}
+	want := truncateSummary(strings.TrimSpace(strings.ReplaceAll(long, "\n\n", "\n")), promptSummaryMaxLen)
+	if truncateSummary(got, promptSummaryMaxLen) != want {
+		t.Errorf("truncated summary differs from sanitizing the full prompt")
+	}
+}
+
+func TestStripNoiseBlocks(t *testing.T) {
+	cases := []struct{ in, want string }{
+		{"plain prompt", "plain prompt"},
+		{"a < b and <b>bold</b>", "a < b and <b>bold</b>"},
+		{"<system-reminder>x</system-reminder>fix it", "fix it"},
+		{"one<task-notification>n</task-notification> two <command-message>m</command-message>three", "one two three"},
+		{"keep <system-reminder>a</system-reminder> mid <system-reminder>b</system-reminder> end", "keep  mid  end"},
+		{"head <local-command-caveat>never closed", "head "},
+	}
+	for _, c := range cases {
+		if got := stripNoiseBlocks(c.in); got != c.want {
+			t.Errorf("stripNoiseBlocks(%q) = %q, want %q", c.in, got, c.want)
+		}
+	}
+}
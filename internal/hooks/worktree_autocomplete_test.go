@@ -69,8 +69,8 @@ func TestExtractMergeBranch(t *testing.T) {
 	}
 }
 
-// TestWorkItemBranchRe verifies the regex that identifies direct work item branches.
-func TestWorkItemBranchRe(t *testing.T) {
+// TestIsWorkItemBranch verifies the check that identifies direct work item branches.
+func TestIsWorkItemBranch(t *testing.T) {
 	tests := []struct {
 		branch string
 		want   bool
@@ -81,18 +81,20 @@ func TestWorkItemBranchRe(t *testing.T) {
 		{"trk-abc12345", false}, // track, not direct work item
 		{"main", false},
 		{"feature/my-feature", false},
-		{"feat-abc", false}, // too short
+		{"feat-abc", false},        // too short
+		{"feat-aabbccddee", false}, // too long
+		{"feat-AABBCCDD", false},   // uppercase hex
 	}
 	for _, tt := range tests {
-		got := workItemBranchRe.MatchString(tt.branch)
+		got := isWorkItemBranch(tt.branch)
 		if got != tt.want {
-			t.Errorf("workItemBranchRe.MatchString(%q) = %v, want %v", tt.branch, got, tt.want)
+			t.Errorf("isWorkItemBranch(%q) = %v, want %v", tt.branch, got, tt.want)
 		}
 	}
 }
 
-// TestTrackBranchRe verifies the regex that identifies track branches.
-func TestTrackBranchRe(t *testing.T) {
+// TestIsTrackBranch verifies the check that identifies track branches.
+func TestIsTrackBranch(t *testing.T) {
 	tests := []struct {
 		branch string
 		want   bool
@@ -104,9 +106,9 @@ func TestTrackBranchRe(t *testing.T) {
 		{"trk-abc", false}, // too short
 	}
 	for _, tt := range tests {
-		got := trackBranchRe.MatchString(tt.branch)
+		got := isTrackBranch(tt.branch)
 		if got != tt.want {
-			t.Errorf("trackBranchRe.MatchString(%q) = %v, want %v", tt.branch, got, tt.want)
+			t.Errorf("isTrackBranch(%q) = %v, want %v", tt.branch, got, tt.want)
 		}
 	}
 }
@@ -0,0 +1,134 @@
+package hooks
+
+import (
+	"context"
+	"database/sql"
+
+	"github.com/shakestzd/htmlgraph/internal/db"
+)
+
+const (
+	// writeQueueCapacity bounds the number of pending best-effort writes.
+	writeQueueCapacity = 1024
+	// writeQueueBatchSize is the maximum number of writes committed per transaction.
+	writeQueueBatchSize = 64
+)
+
+// queuedWrite is a single best-effort tracking write. op runs inside the
+// batch transaction; failures are logged to debug.log and never surface to
+// the hook caller.
+type queuedWrite struct {
+	handler    string
+	projectDir string
+	op         func(tx *sql.Tx) error
+}
+
+// writeQueue moves best-effort tracking writes off the handler's critical
+// path. A single background goroutine drains the channel and commits up to
+// writeQueueBatchSize writes per transaction on a dedicated connection, so the
+// handler can keep resolving env vars and hint files while SQLite syncs.
+type writeQueue struct {
+	database *sql.DB
+	writes   chan queuedWrite
+	done     chan struct{}
+}
+
+// pendingWrites is the queue for the current hook invocation. Each hook
+// process handles exactly one CloudEvent against one database, so a single
+// queue is enough; enqueueWrite and FlushWrites are only called from the
+// handler goroutine.
+var pendingWrites *writeQueue
+
+// enqueueWrite schedules op to run in a batched transaction against database.
+// The write is only guaranteed to be durable after FlushWrites returns.
+func enqueueWrite(database *sql.DB, projectDir, handler string, op func(tx *sql.Tx) error) {
+	if pendingWrites != nil && pendingWrites.database != database {
+		FlushWrites()
+	}
+	if pendingWrites == nil {
+		pendingWrites = newWriteQueue(database)
+	}
+	pendingWrites.writes <- queuedWrite{handler: handler, projectDir: projectDir, op: op}
+}
+
+// FlushWrites drains all queued writes and waits for them to commit.
+// Callers must invoke it before closing the database handed to the handler.
+// Safe to call when nothing was queued.
+func FlushWrites() {
+	if pendingWrites == nil {
+		return
+	}
+	close(pendingWrites.writes)
+	<-pendingWrites.done
+	pendingWrites = nil
+}
+
+func newWriteQueue(database *sql.DB) *writeQueue {
+	q := &writeQueue{
+		database: database,
+		writes:   make(chan queuedWrite, writeQueueCapacity),
+		done:     make(chan struct{}),
+	}
+	go q.run()
+	return q
+}
+
+// run is the writer goroutine: it blocks for the first write of a batch, then
+// greedily collects whatever else is already queued before committing.
+func (q *writeQueue) run() {
+	defer close(q.done)
+
+	ctx := context.Background()
+	conn, err := q.database.Conn(ctx)
+	if err != nil {
+		for w := range q.writes {
+			debugLog(w.projectDir, "[error] handler=%s: write queue connection: %v", w.handler, err)
+		}
+		return
+	}
+	defer conn.Close()
+
+	// PRAGMAs applied by db.Open only reach the first pooled connection; the
+	// writer may get a fresh one, so make sure it waits on a busy database
+	// instead of failing immediately.
+	conn.ExecContext(ctx, "PRAGMA busy_timeout = "+db.Pragmas["busy_timeout"]) //nolint:errcheck
+
+	for first := range q.writes {
+		batch := []queuedWrite{first}
+	collect:
+		for len(batch) < writeQueueBatchSize {
+			select {
+			case w, ok := <-q.writes:
+				if !ok {
+					break collect
+				}
+				batch = append(batch, w)
+			default:
+				break collect
+			}
+		}
+		commitWriteBatch(ctx, conn, batch)
+	}
+}
+
+// commitWriteBatch runs every write in batch inside one transaction. A failing
+// write is logged and skipped; the remaining writes still commit.
+func commitWriteBatch(ctx context.Context, conn *sql.Conn, batch []queuedWrite) {
+	tx, err := conn.BeginTx(ctx, nil)
+	if err != nil {
+		for _, w := range batch {
+			debugLog(w.projectDir, "[error] handler=%s: write queue begin: %v", w.handler, err)
+		}
+		return
+	}
+	defer tx.Rollback() //nolint:errcheck
+
+	for _, w := range batch {
+		if err := w.op(tx); err != nil {
+			debugLog(w.projectDir, "[error] handler=%s: queued write: %v", w.handler, err)
+		}
+	}
+	if err := tx.Commit(); err != nil {
+		debugLog(batch[0].projectDir, "[error] handler=%s: write queue commit: %v", batch[0].handler, err)
+	}
+}
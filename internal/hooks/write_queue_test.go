@@ -0,0 +1,71 @@
+package hooks
+
+import (
+	"database/sql"
+	"errors"
+	"testing"
+)
+
+func TestWriteQueue_FlushCommitsAllWrites(t *testing.T) {
+	database, projectDir := setupLifecycleDB(t)
+	if _, err := database.Exec(`CREATE TABLE wq_probe (n INTEGER)`); err != nil {
+		t.Fatalf("create probe table: %v", err)
+	}
+
+	const total = writeQueueBatchSize*2 + 3
+	for i := 0; i < total; i++ {
+		n := i
+		enqueueWrite(database, projectDir, "test", func(tx *sql.Tx) error {
+			_, err := tx.Exec(`INSERT INTO wq_probe (n) VALUES (?)`, n)
+			return err
+		})
+	}
+	FlushWrites()
+
+	var count int
+	if err := database.QueryRow(`SELECT COUNT(*) FROM wq_probe`).Scan(&count); err != nil {
+		t.Fatalf("count: %v", err)
+	}
+	if count != total {
+		t.Errorf("committed rows = %d, want %d", count, total)
+	}
+	if pendingWrites != nil {
+		t.Error("expected pendingWrites to be reset after FlushWrites")
+	}
+}
+
+func TestWriteQueue_FailedWriteDoesNotDropBatch(t *testing.T) {
+	database, projectDir := setupLifecycleDB(t)
+	if _, err := database.Exec(`CREATE TABLE wq_probe (n INTEGER)`); err != nil {
+		t.Fatalf("create probe table: %v", err)
+	}
+
+	enqueueWrite(database, projectDir, "test", func(tx *sql.Tx) error {
+		_, err := tx.Exec(`INSERT INTO wq_probe (n) VALUES (1)`)
+		return err
+	})
+	enqueueWrite(database, projectDir, "test", func(tx *sql.Tx) error {
+		return errors.New("boom")
+	})
+	enqueueWrite(database, projectDir, "test", func(tx *sql.Tx) error {
+		_, err := tx.Exec(`INSERT INTO wq_probe (n) VALUES (2)`)
+		return err
+	})
+	FlushWrites()
+
+	var count int
+	if err := database.QueryRow(`SELECT COUNT(*) FROM wq_probe`).Scan(&count); err != nil {
+		t.Fatalf("count: %v", err)
+	}
+	if count != 2 {
+		t.Errorf("committed rows = %d, want 2", count)
+	}
+}
+
+func TestFlushWrites_NoopWhenEmpty(t *testing.T) {
+	pendingWrites = nil
+	FlushWrites() // must not block or panic
+	if pendingWrites != nil {
+		t.Errorf("pendingWrites = %v, want nil", pendingWrites)
+	}
+}
@@ -22,7 +22,7 @@ var mergeInProgressFn = isMergeInProgress
 
 // isYoloFromEvent checks the CloudEvent permission_mode field first (live
 // state from Claude Code), falling back to a SQLite DB lookup.
-func isYoloFromEvent(event *CloudEvent, htmlgraphDir string) bool {
+func isYoloFromEvent(event *CloudEvent, database *sql.DB) bool {
 	if event.PermissionMode == "bypassPermissions" {
 		return true
 	}
@@ -32,25 +32,19 @@ func isYoloFromEvent(event *CloudEvent, htmlgraphDir string) bool {
 	}
 	// Fallback: check DB for session's last known permission_mode.
 	// This is populated by the ConfigChange hook handler.
-	return isYoloFromDB(htmlgraphDir, event.SessionID)
+	return isYoloFromDB(database, event.SessionID)
 }
 
 // isYoloFromDB looks up the session's permission_mode from the sessions.metadata
 // JSON column. This is populated by the ConfigChange hook when the user toggles
-// permission mode in Claude Code.
-func isYoloFromDB(htmlgraphDir, sessionID string) bool {
-	if sessionID == "" {
+// permission mode in Claude Code. It reuses the hook's open handle rather than
+// opening a second connection to the same file.
+func isYoloFromDB(database *sql.DB, sessionID string) bool {
+	if sessionID == "" || database == nil {
 		return false
 	}
-	dbPath := filepath.Join(htmlgraphDir, "htmlgraph.db")
-	// Use lightweight read-only open — no pragmas, no migrations.
-	database, err := sql.Open("sqlite", dbPath+"?mode=ro&_busy_timeout=5000")
-	if err != nil {
-		return false
-	}
-	defer database.Close()
 	var mode sql.NullString
-	err = database.QueryRow(
+	err := database.QueryRow(
 		"SELECT json_extract(metadata, '$.permission_mode') FROM sessions WHERE session_id = ?",
 		sessionID,
 	).Scan(&mode)
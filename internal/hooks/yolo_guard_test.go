@@ -56,27 +56,32 @@ func TestIsYoloFromDB(t *testing.T) {
 	if err != nil {
 		t.Fatalf("insert default session: %v", err)
 	}
-	database.Close()
+	defer database.Close()
 
 	// YOLO session → true.
-	if !isYoloFromDB(hgDir, "yolo-sess") {
+	if !isYoloFromDB(database, "yolo-sess") {
 		t.Error("expected isYoloFromDB=true for bypassPermissions session")
 	}
 
 	// Non-YOLO session → false.
-	if isYoloFromDB(hgDir, "default-sess") {
+	if isYoloFromDB(database, "default-sess") {
 		t.Error("expected isYoloFromDB=false for default permission mode session")
 	}
 
 	// Unknown session → false.
-	if isYoloFromDB(hgDir, "missing-sess") {
+	if isYoloFromDB(database, "missing-sess") {
 		t.Error("expected isYoloFromDB=false for missing session")
 	}
 
 	// Empty session ID → false.
-	if isYoloFromDB(hgDir, "") {
+	if isYoloFromDB(database, "") {
 		t.Error("expected isYoloFromDB=false for empty session ID")
 	}
+
+	// No database handle → false.
+	if isYoloFromDB(nil, "yolo-sess") {
+		t.Error("expected isYoloFromDB=false without a database")
+	}
 }
 
 func TestIsYoloFromEvent(t *testing.T) {
@@ -86,19 +91,19 @@ func TestIsYoloFromEvent(t *testing.T) {
 
 	// bypassPermissions → yolo regardless of DB state.
 	event := &CloudEvent{PermissionMode: "bypassPermissions", SessionID: "any-sess"}
-	if !isYoloFromEvent(event, hgDir) {
+	if !isYoloFromEvent(event, nil) {
 		t.Error("expected yolo when permission_mode=bypassPermissions")
 	}
 
 	// Non-empty, non-bypass mode → not yolo regardless of DB state.
 	event = &CloudEvent{PermissionMode: "default", SessionID: "any-sess"}
-	if isYoloFromEvent(event, hgDir) {
+	if isYoloFromEvent(event, nil) {
 		t.Error("expected non-yolo when permission_mode=default")
 	}
 
 	// Empty permission_mode + no DB → not yolo.
 	event = &CloudEvent{PermissionMode: "", SessionID: "no-db-sess"}
-	if isYoloFromEvent(event, hgDir) {
+	if isYoloFromEvent(event, nil) {
 		t.Error("expected non-yolo with no permission_mode and no DB")
 	}
 
@@ -108,6 +113,7 @@ func TestIsYoloFromEvent(t *testing.T) {
 	if err != nil {
 		t.Fatalf("db.Open: %v", err)
 	}
+	defer database.Close()
 	_, err = database.Exec(
 		`INSERT INTO sessions (session_id, agent_assigned, status, created_at, metadata)
 		 VALUES (?, ?, ?, datetime('now'), json_object('permission_mode', 'bypassPermissions'))`,
@@ -116,18 +122,13 @@ func TestIsYoloFromEvent(t *testing.T) {
 	if err != nil {
 		t.Fatalf("insert session: %v", err)
 	}
-	database.Close()
 
 	event = &CloudEvent{PermissionMode: "", SessionID: "yolo-event-sess"}
-	if !isYoloFromEvent(event, hgDir) {
+	if !isYoloFromEvent(event, database) {
 		t.Error("expected yolo from DB fallback when permission_mode is empty and DB has bypassPermissions")
 	}
 
 	// Empty permission_mode + DB with default mode → not yolo.
-	database, err = db.Open(dbPath)
-	if err != nil {
-		t.Fatalf("db.Open: %v", err)
-	}
 	_, err = database.Exec(
 		`INSERT INTO sessions (session_id, agent_assigned, status, created_at, metadata)
 		 VALUES (?, ?, ?, datetime('now'), json_object('permission_mode', 'default'))`,
@@ -136,10 +137,9 @@ func TestIsYoloFromEvent(t *testing.T) {
 	if err != nil {
 		t.Fatalf("insert default session: %v", err)
 	}
-	database.Close()
 
 	event = &CloudEvent{PermissionMode: "", SessionID: "default-event-sess"}
-	if isYoloFromEvent(event, hgDir) {
+	if isYoloFromEvent(event, database) {
 		t.Error("expected non-yolo from DB fallback for default permission mode")
 	}
 }
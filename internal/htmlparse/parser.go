@@ -213,26 +213,50 @@ func attrOr(sel *goquery.Selection, name, fallback string) string {
 	return fallback
 }
 
-// parseTime attempts to parse an ISO-8601 timestamp.
+// timeLayouts are the ISO-8601 layouts parseTime tries, in order of likelihood.
+var timeLayouts = []string{
+	time.RFC3339Nano,
+	time.RFC3339,
+	"2006-01-02T15:04:05.999999",
+	"2006-01-02T15:04:05",
+	"2006-01-02",
+}
+
+// parseTime attempts to parse an ISO-8601 timestamp. The layout is first
+// guessed from the shape of s, so the usual case costs one time.Parse; the
+// full timeLayouts list is only walked when that guess fails.
 func parseTime(s string) time.Time {
 	if s == "" {
 		return time.Time{}
 	}
-	// Normalise "Z" suffix for Go parsing.
-	s = strings.Replace(s, "Z", "+00:00", 1)
-
-	// Try layouts in order of likelihood.
-	layouts := []string{
-		time.RFC3339Nano,
-		time.RFC3339,
-		"2006-01-02T15:04:05.999999",
-		"2006-01-02T15:04:05",
-		"2006-01-02",
+	if t, err := time.Parse(guessLayout(s), s); err == nil {
+		return t
 	}
-	for _, layout := range layouts {
+	for _, layout := range timeLayouts {
 		if t, err := time.Parse(layout, s); err == nil {
 			return t
 		}
 	}
 	return time.Time{}
 }
+
+// guessLayout picks the layout s should match: date-only, zoned (RFC 3339
+// with "Z" or a ±hh:mm offset) or timezone-naive. time.Parse accepts an
+// optional fractional second after the seconds field for every layout.
+func guessLayout(s string) string {
+	n := len(s)
+	switch {
+	case n == len("2006-01-02"):
+		return "2006-01-02"
+	case s[n-1] == 'Z', hasZoneOffset(s):
+		return time.RFC3339
+	default:
+		return "2006-01-02T15:04:05"
+	}
+}
+
+// hasZoneOffset reports whether s ends in a ±hh:mm offset.
+func hasZoneOffset(s string) bool {
+	n := len(s)
+	return n > 6 && (s[n-6] == '+' || s[n-6] == '-') && s[n-3] == ':'
+}
@@ -4,6 +4,7 @@ import (
 	"os"
 	"path/filepath"
 	"testing"
+	"time"
 
 	"github.com/shakestzd/htmlgraph/internal/htmlparse"
 	"github.com/shakestzd/htmlgraph/internal/models"
@@ -144,6 +145,28 @@ func TestParseMinimalHTML(t *testing.T) {
 	assertString(t, "Title", node.Title, "Critical Bug")
 }
 
+func TestParseTimestampFormats(t *testing.T) {
+	want := time.Date(2026, 3, 26, 12, 53, 54, 0, time.UTC)
+	cases := map[string]time.Time{
+		"2026-03-26T12:53:54Z":        want,
+		"2026-03-26T12:53:54.000000Z": want,
+		"2026-03-26T14:53:54+02:00":   want,
+		"2026-03-26T12:53:54.000000":  want,
+		"2026-03-26T12:53:54":         want,
+		"2026-03-26":                  time.Date(2026, 3, 26, 0, 0, 0, 0, time.UTC),
+		"not-a-timestamp":             {},
+	}
+	for created, wantTime := range cases {
+		node, err := htmlparse.ParseString(`<article id="feat-1" data-created="` + created + `"></article>`)
+		if err != nil {
+			t.Fatalf("ParseString: %v", err)
+		}
+		if !node.CreatedAt.Equal(wantTime) {
+			t.Errorf("data-created=%q: got %v, want %v", created, node.CreatedAt, wantTime)
+		}
+	}
+}
+
 func TestParseNoArticle(t *testing.T) {
 	html := `<html><body><p>no article here</p></body></html>`
 	_, err := htmlparse.ParseString(html)
@@ -109,11 +109,27 @@ func resolveGeminiSlugFilter(projectFilter string, projectsMap map[string]string
 		return ""
 	}
 	// Check if projectFilter is an absolute path matching a known project.
+	if slug, ok := projectsMap[projectFilter]; ok {
+		return slug
+	}
+	// Fall back to a case-insensitive match, then to the nearest project
+	// under projectFilter. Map order is random, so pick the shortest matching
+	// path (ties broken lexically) to keep the result stable across runs.
+	prefix := strings.ToLower(projectFilter) + "/"
+	best, bestSlug := "", ""
 	for path, slug := range projectsMap {
-		if strings.EqualFold(path, projectFilter) ||
-			strings.HasPrefix(strings.ToLower(path), strings.ToLower(projectFilter)+"/") {
+		if strings.EqualFold(path, projectFilter) {
 			return slug
 		}
+		if !strings.HasPrefix(strings.ToLower(path), prefix) {
+			continue
+		}
+		if best == "" || len(path) < len(best) || (len(path) == len(best) && path < best) {
+			best, bestSlug = path, slug
+		}
+	}
+	if best != "" {
+		return bestSlug
 	}
 	// Treat projectFilter as a direct slug name.
 	return projectFilter
@@ -104,7 +104,7 @@ func parseGemini(r io.Reader) (*ParseResult, error) {
 		SessionID: session.SessionID,
 	}
 
-	modelCounts := map[string]int{}
+	var modelUse modelTally
 	ordinal := 0
 
 	for _, m := range session.Messages {
@@ -131,20 +131,13 @@ func parseGemini(r io.Reader) (*ParseResult, error) {
 			}
 			result.ToolCalls = append(result.ToolCalls, tools...)
 			if msg.Model != "" {
-				modelCounts[msg.Model]++
+				modelUse.add(msg.Model)
 			}
 			ordinal++
 		}
 	}
 
-	// Determine most-used model.
-	maxCount := 0
-	for m, c := range modelCounts {
-		if c > maxCount {
-			result.Model = m
-			maxCount = c
-		}
-	}
+	result.Model = modelUse.top
 
 	return result, nil
 }
@@ -259,10 +252,7 @@ func parseGeminiTimestamp(ts string) time.Time {
 	if ts == "" {
 		return time.Time{}
 	}
-	t, err := time.Parse(time.RFC3339Nano, ts)
-	if err != nil {
-		t, _ = time.Parse("2006-01-02T15:04:05.000Z", ts)
-	}
+	t, _ := time.Parse(time.RFC3339Nano, ts)
 	return t
 }
 
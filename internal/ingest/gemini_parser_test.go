@@ -291,3 +291,32 @@ func TestIsGeminiSessionFile(t *testing.T) {
 		})
 	}
 }
+
+func TestResolveGeminiSlugFilter(t *testing.T) {
+	projects := map[string]string{
+		"/home/u/app":         "app",
+		"/home/u/app/web":     "app-web",
+		"/home/u/Tools":       "tools",
+		"/home/u/lib/b":       "lib-b",
+		"/home/u/lib/a":       "lib-a",
+		"/home/u/lib/a/inner": "lib-a-inner",
+	}
+	tests := []struct {
+		filter string
+		want   string
+	}{
+		{"", ""},
+		{"/home/u/app", "app"},     // exact match beats the nested project
+		{"/home/u/tools", "tools"}, // case-insensitive match
+		{"/home/u/lib", "lib-a"},   // nearest nested project, ties broken lexically
+		{"my-slug", "my-slug"},     // unknown filter is treated as a slug
+		{"/home/u/app/web", "app-web"},
+	}
+	for _, tt := range tests {
+		for i := 0; i < 10; i++ { // map order varies between iterations
+			if got := resolveGeminiSlugFilter(tt.filter, projects); got != tt.want {
+				t.Fatalf("resolveGeminiSlugFilter(%q) = %q, want %q", tt.filter, got, tt.want)
+			}
+		}
+	}
+}
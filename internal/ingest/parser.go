@@ -4,6 +4,7 @@ package ingest
 
 import (
 	"bufio"
+	"bytes"
 	"crypto/sha256"
 	"fmt"
 	"io"
@@ -83,32 +84,64 @@ func ParseFileFrom(path string, offset int64) (*ParseResult, error) {
 	return result, nil
 }
 
+// parsedTypeTokens are the quoted "type" values parse acts on. A line that
+// contains none of them can be dropped without decoding any JSON.
+var parsedTypeTokens = [][]byte{
+	[]byte(`"user"`),
+	[]byte(`"assistant"`),
+	[]byte(`"custom-title"`),
+}
+
+// mayHaveParsedType is a cheap substring prefilter run before gjson. It can
+// return false positives (the token appearing in content), never false
+// negatives, so the real type check still happens afterwards.
+func mayHaveParsedType(raw []byte) bool {
+	for _, tok := range parsedTypeTokens {
+		if bytes.Contains(raw, tok) {
+			return true
+		}
+	}
+	return false
+}
+
 func parse(r io.Reader) (*ParseResult, error) {
 	scanner := bufio.NewScanner(r)
 	scanner.Buffer(make([]byte, 0, 1024*1024), 10*1024*1024) // 10 MB max line
 
 	result := &ParseResult{}
 	ordinal := 0
-	modelCounts := map[string]int{}
+	var modelUse modelTally
 
 	for scanner.Scan() {
-		line := scanner.Text()
-		if len(line) == 0 {
+		// Work on the scanner's buffer directly: most lines (snapshots,
+		// progress, system) are dropped, so only lines we keep are copied
+		// into a string.
+		raw := scanner.Bytes()
+		if len(raw) == 0 {
 			continue
 		}
 
-		lineType := gjson.Get(line, "type").String()
-		sessionID := gjson.Get(line, "sessionId").String()
-		if result.SessionID == "" && sessionID != "" {
-			result.SessionID = sessionID
+		if result.SessionID == "" {
+			result.SessionID = gjson.GetBytes(raw, "sessionId").String()
+		}
+
+		if !mayHaveParsedType(raw) {
+			continue
 		}
 
+		lineType := gjson.GetBytes(raw, "type").String()
 		switch lineType {
 		case "custom-title":
-			result.Title = gjson.Get(line, "customTitle").String()
+			result.Title = gjson.GetBytes(raw, "customTitle").String()
 			continue
-		case "file-history-snapshot", "queue-operation", "system":
+		case "user", "assistant":
+		default:
+			// file-history-snapshot, queue-operation, system, progress, …
 			continue
+		}
+		line := string(raw)
+
+		switch lineType {
 		case "user":
 			if gjson.Get(line, "isMeta").Bool() || gjson.Get(line, "isCompactSummary").Bool() {
 				continue
@@ -136,24 +169,35 @@ func parse(r io.Reader) (*ParseResult, error) {
 			result.ToolCalls = append(result.ToolCalls, tools...)
 
 			if msg.Model != "" {
-				modelCounts[msg.Model]++
+				modelUse.add(msg.Model)
 			}
 			ordinal++
 		}
 	}
 
-	// Determine most-used model.
-	maxCount := 0
-	for m, c := range modelCounts {
-		if c > maxCount {
-			result.Model = m
-			maxCount = c
-		}
-	}
+	result.Model = modelUse.top
 
 	return result, scanner.Err()
 }
 
+// modelTally counts assistant messages per model and keeps the leader up to
+// date as it goes, so the most-used model needs no second pass over the
+// counts. On a tie the model that reached the count first wins.
+type modelTally struct {
+	counts map[string]int
+	top    string
+}
+
+func (t *modelTally) add(model string) {
+	if t.counts == nil {
+		t.counts = make(map[string]int)
+	}
+	t.counts[model]++
+	if t.counts[model] > t.counts[t.top] {
+		t.top = model
+	}
+}
+
 func parseUserMessage(line string, ordinal int) *models.Message {
 	content := extractContent(line)
 	if content == "" {
@@ -282,10 +326,12 @@ func parseTimestamp(line string) time.Time {
 	if ts == "" {
 		ts = gjson.Get(line, "snapshot.timestamp").String()
 	}
-	t, err := time.Parse(time.RFC3339Nano, ts)
-	if err != nil {
-		t, _ = time.Parse("2006-01-02T15:04:05.000Z", ts)
+	if ts == "" {
+		return time.Time{}
 	}
+	// RFC3339Nano already accepts the millisecond "…05.000Z" form, so one
+	// parse covers every transcript timestamp.
+	t, _ := time.Parse(time.RFC3339Nano, ts)
 	return t
 }
 
@@ -3,6 +3,7 @@ package ingest
 import (
 	"strings"
 	"testing"
+	"time"
 )
 
 func TestParse_UserAndAssistant(t *testing.T) {
@@ -116,6 +117,81 @@ func TestParse_FiltersMetaAndSystem(t *testing.T) {
 	}
 }
 
+func TestParse_PrefilteredLinesStillSetSessionID(t *testing.T) {
+	jsonl := strings.Join([]string{
+		`{"type":"file-history-snapshot","messageId":"m1","sessionId":"sess-5"}`,
+		`{"type":"progress","data":{"message":{"role":"user"}},"sessionId":"sess-5"}`,
+		`{"type":"user","uuid":"u1","message":{"role":"user","content":"after the noise"},"timestamp":"2026-03-27T20:00:00.000Z"}`,
+	}, "\n")
+
+	result, err := parse(strings.NewReader(jsonl))
+	if err != nil {
+		t.Fatalf("parse error: %v", err)
+	}
+
+	if result.SessionID != "sess-5" {
+		t.Errorf("session ID = %q, want sess-5 (from a prefiltered line)", result.SessionID)
+	}
+	if len(result.Messages) != 1 {
+		t.Fatalf("got %d messages, want 1", len(result.Messages))
+	}
+	if result.Messages[0].SessionID != "sess-5" {
+		t.Errorf("msg.SessionID = %q, want sess-5", result.Messages[0].SessionID)
+	}
+}
+
+func TestMayHaveParsedType(t *testing.T) {
+	tests := []struct {
+		line string
+		want bool
+	}{
+		{`{"type":"user"}`, true},
+		{`{"type": "assistant"}`, true},
+		{`{"type":"custom-title","customTitle":"x"}`, true},
+		{`{"type":"file-history-snapshot","messageId":"m1"}`, false},
+		{`{"type":"system","subtype":"stop_hook_summary"}`, false},
+		{`{"type":"queue-operation","content":"user prompt"}`, false},
+	}
+	for _, tt := range tests {
+		if got := mayHaveParsedType([]byte(tt.line)); got != tt.want {
+			t.Errorf("mayHaveParsedType(%s) = %v, want %v", tt.line, got, tt.want)
+		}
+	}
+}
+
+func TestParseTimestamp(t *testing.T) {
+	want := time.Date(2026, 3, 10, 15, 36, 8, 258_000_000, time.UTC)
+	tests := []struct {
+		line string
+		want time.Time
+	}{
+		{`{"timestamp":"2026-03-10T15:36:08.258Z"}`, want},
+		{`{"snapshot":{"timestamp":"2026-03-10T15:36:08.258Z"}}`, want},
+		{`{"timestamp":"2026-03-10T17:36:08.258+02:00"}`, want},
+		{`{"type":"user"}`, time.Time{}},
+		{`{"timestamp":"yesterday"}`, time.Time{}},
+	}
+	for _, tt := range tests {
+		if got := parseTimestamp(tt.line); !got.Equal(tt.want) {
+			t.Errorf("parseTimestamp(%s) = %v, want %v", tt.line, got, tt.want)
+		}
+	}
+}
+
+func TestModelTally_TopIsFirstToReachMax(t *testing.T) {
+	var tally modelTally
+	for _, m := range []string{"sonnet", "opus", "opus", "sonnet", "haiku"} {
+		tally.add(m)
+	}
+	if tally.top != "opus" {
+		t.Errorf("top = %q, want %q (first model to reach 2)", tally.top, "opus")
+	}
+	tally.add("sonnet")
+	if tally.top != "sonnet" {
+		t.Errorf("top = %q, want %q after it pulls ahead", tally.top, "sonnet")
+	}
+}
+
 func TestParse_ThinkingBlock(t *testing.T) {
 	jsonl := `{"type":"assistant","uuid":"a1","message":{"model":"claude-opus-4-6","role":"assistant","content":[{"type":"thinking","thinking":"let me reason..."},{"type":"text","text":"Here is my answer."}],"usage":{"output_tokens":10}},"timestamp":"2026-03-27T20:00:00.000Z","sessionId":"sess-4"}`
 
@@ -160,12 +160,14 @@ func walkUpForHtmlgraph(start string, maxLevels int) string {
 // ResolveViaGitCommonDir detects when dir is inside a git linked worktree and
 // returns the main repository root (i.e. the parent of the shared .git dir).
 //
-// When running in a linked worktree, `git rev-parse --git-common-dir` returns
-// something like `../../.git` or an absolute path — its parent directory is the
-// main repo root.  When running in the main worktree the command returns the
-// literal string `.git`, which means we are NOT in a linked worktree; in that
-// case the function returns "" so the caller falls through to its normal
-// walk-up logic.
+// The lookup is a pure filesystem walk, with no git subprocess. In a linked
+// worktree the nearest `.git` is a file containing `gitdir: <path>`, and that
+// per-worktree git dir holds a `commondir` file pointing at the shared .git
+// directory — its parent is the main repo root. When the nearest `.git` is a
+// directory we are in the main worktree (or a plain repo): at its top level
+// the function returns "" so the caller falls through to its normal walk-up
+// logic, and from a subdirectory it returns the repo root, matching what
+// `git rev-parse --git-common-dir` (`../../.git`) resolved to.
 //
 // The function also verifies that the resolved main repo root contains a
 // `.htmlgraph/` directory before returning it, so callers can use the return
@@ -182,24 +184,25 @@ func ResolveViaGitCommonDir(dir string) string {
 		}
 	}
 
-	cmd := exec.Command("git", "-C", dir, "rev-parse", "--git-common-dir")
-	out, err := cmd.Output()
-	if err != nil {
-		return "" // not a git repo, or git not installed
-	}
-
-	gitCommonDir := strings.TrimSpace(string(out))
-	if gitCommonDir == "" || gitCommonDir == ".git" {
-		// ".git" means we are in the main worktree, not a linked worktree.
-		// Let the caller's normal walk-up handle it.
-		return ""
+	dotGit, info, ok := nearestDotGit(dir)
+	if !ok {
+		return "" // not a git repo
 	}
 
-	// For linked worktrees the path may be relative (e.g. "../../.git").
-	if !filepath.IsAbs(gitCommonDir) {
-		gitCommonDir = filepath.Join(dir, gitCommonDir)
+	var gitCommonDir string
+	if info.IsDir() {
+		// Main worktree. git reports a bare ".git" only at its top level;
+		// let the caller's normal walk-up handle that case.
+		if filepath.Dir(dotGit) == filepath.Clean(dir) {
+			return ""
+		}
+		gitCommonDir = dotGit
+	} else {
+		gitCommonDir = readGitCommonDir(dotGit)
+		if gitCommonDir == "" {
+			return ""
+		}
 	}
-	gitCommonDir = filepath.Clean(gitCommonDir)
 
 	mainRepoRoot := filepath.Dir(gitCommonDir)
 
@@ -210,6 +213,55 @@ func ResolveViaGitCommonDir(dir string) string {
 	return ""
 }
 
+// nearestDotGit walks up from dir and returns the path and info of the first
+// `.git` entry found. ok is false when no ancestor contains one.
+func nearestDotGit(dir string) (path string, info os.FileInfo, ok bool) {
+	for {
+		path = filepath.Join(dir, ".git")
+		if info, err := os.Stat(path); err == nil {
+			return path, info, true
+		}
+		parent := filepath.Dir(dir)
+		if parent == dir {
+			return "", nil, false
+		}
+		dir = parent
+	}
+}
+
+// readGitCommonDir resolves the shared git directory for a `.git` file, the
+// same way `git rev-parse --git-common-dir` does: follow its `gitdir:` line,
+// then that directory's `commondir` file when present. Relative paths are
+// resolved against the directory holding the file that names them.
+func readGitCommonDir(dotGitFile string) string {
+	b, err := os.ReadFile(dotGitFile)
+	if err != nil {
+		return ""
+	}
+	gitDir, found := strings.CutPrefix(strings.TrimSpace(string(b)), "gitdir:")
+	if !found {
+		return ""
+	}
+	gitDir = strings.TrimSpace(gitDir)
+	if gitDir == "" {
+		return ""
+	}
+	if !filepath.IsAbs(gitDir) {
+		gitDir = filepath.Join(filepath.Dir(dotGitFile), gitDir)
+	}
+
+	b, err = os.ReadFile(filepath.Join(gitDir, "commondir"))
+	if err != nil {
+		// No commondir (e.g. a submodule): the git dir is its own common dir.
+		return filepath.Clean(gitDir)
+	}
+	commonDir := strings.TrimSpace(string(b))
+	if !filepath.IsAbs(commonDir) {
+		commonDir = filepath.Join(gitDir, commonDir)
+	}
+	return filepath.Clean(commonDir)
+}
+
 // GetGitRemoteURL returns the remote origin URL for the given directory by
 // running `git -C <dir> remote get-url origin`.  It returns an empty string
 // on any error (not a git repo, no origin remote, git not installed, etc.).
@@ -37,6 +37,25 @@ func TestResolveViaGitCommonDir_MainWorktree(t *testing.T) {
 	_ = result
 }
 
+// TestResolveViaGitCommonDir_MainWorktreeSubdir verifies that a subdirectory
+// of a main checkout resolves to the repo root (git reports "../../.git"
+// there), while the top level itself still returns "".
+func TestResolveViaGitCommonDir_MainWorktreeSubdir(t *testing.T) {
+	root := t.TempDir()
+	for _, d := range []string{".git", ".htmlgraph", filepath.Join("a", "b")} {
+		if err := os.MkdirAll(filepath.Join(root, d), 0o755); err != nil {
+			t.Fatal(err)
+		}
+	}
+
+	if got := paths.ResolveViaGitCommonDir(filepath.Join(root, "a", "b")); got != root {
+		t.Errorf("from subdir: got %q, want %q", got, root)
+	}
+	if got := paths.ResolveViaGitCommonDir(root); got != "" {
+		t.Errorf("from repo root: got %q, want \"\"", got)
+	}
+}
+
 // TestResolveViaGitCommonDir_EmptyDir verifies that an empty dir argument
 // falls back to os.Getwd() without panicking.
 func TestResolveViaGitCommonDir_EmptyDir(t *testing.T) {
@@ -66,6 +85,79 @@ func TestResolveViaGitCommonDir_NoHtmlgraph(t *testing.T) {
 	}
 }
 
+// TestResolveViaGitCommonDir_LinkedWorktree verifies that a linked worktree
+// (whose .git is a file) resolves to the main repo root when that root has a
+// .htmlgraph directory.
+func TestResolveViaGitCommonDir_LinkedWorktree(t *testing.T) {
+	mainRoot := t.TempDir()
+	if err := runGit(mainRoot, "init"); err != nil {
+		t.Skipf("git init failed: %v", err)
+	}
+	if err := runGit(mainRoot, "-c", "user.email=t@example.com", "-c", "user.name=t",
+		"commit", "--allow-empty", "-m", "init"); err != nil {
+		t.Skipf("git commit failed: %v", err)
+	}
+	worktree := filepath.Join(t.TempDir(), "wt")
+	if err := runGit(mainRoot, "worktree", "add", worktree); err != nil {
+		t.Skipf("git worktree add failed: %v", err)
+	}
+	if err := os.MkdirAll(filepath.Join(mainRoot, ".htmlgraph"), 0o755); err != nil {
+		t.Fatal(err)
+	}
+
+	subDir := filepath.Join(worktree, "pkg")
+	if err := os.MkdirAll(subDir, 0o755); err != nil {
+		t.Fatal(err)
+	}
+
+	want, _ := filepath.EvalSymlinks(mainRoot)
+	for _, dir := range []string{worktree, subDir} {
+		got, _ := filepath.EvalSymlinks(paths.ResolveViaGitCommonDir(dir))
+		if got != want {
+			t.Errorf("ResolveViaGitCommonDir(%q) = %q, want %q", dir, got, want)
+		}
+	}
+
+	// The main worktree itself is never redirected.
+	if got := paths.ResolveViaGitCommonDir(mainRoot); got != "" {
+		t.Errorf("ResolveViaGitCommonDir(main) = %q, want empty", got)
+	}
+}
+
+// TestResolveViaGitCommonDir_GitdirFile verifies the git-free lookup on a
+// hand-built linked-worktree layout: a relative `gitdir:` in the worktree's
+// .git file and a relative `commondir` in the per-worktree git dir.
+func TestResolveViaGitCommonDir_GitdirFile(t *testing.T) {
+	root := t.TempDir()
+	mainRoot := filepath.Join(root, "main")
+	wtGitDir := filepath.Join(mainRoot, ".git", "worktrees", "wt")
+	worktree := filepath.Join(root, "wt")
+	for _, d := range []string{wtGitDir, filepath.Join(mainRoot, ".htmlgraph"), worktree} {
+		if err := os.MkdirAll(d, 0o755); err != nil {
+			t.Fatal(err)
+		}
+	}
+	if err := os.WriteFile(filepath.Join(wtGitDir, "commondir"), []byte("../..\n"), 0o644); err != nil {
+		t.Fatal(err)
+	}
+	gitdirLine := "gitdir: ../main/.git/worktrees/wt\n"
+	if err := os.WriteFile(filepath.Join(worktree, ".git"), []byte(gitdirLine), 0o644); err != nil {
+		t.Fatal(err)
+	}
+
+	if got := paths.ResolveViaGitCommonDir(worktree); got != mainRoot {
+		t.Errorf("ResolveViaGitCommonDir(worktree) = %q, want %q", got, mainRoot)
+	}
+
+	// A .git file without the gitdir: prefix is ignored.
+	if err := os.WriteFile(filepath.Join(worktree, ".git"), []byte("garbage"), 0o644); err != nil {
+		t.Fatal(err)
+	}
+	if got := paths.ResolveViaGitCommonDir(worktree); got != "" {
+		t.Errorf("ResolveViaGitCommonDir(malformed) = %q, want empty", got)
+	}
+}
+
 // TestGetGitRemoteURL_EmptyDir verifies that an empty dir returns "".
 func TestGetGitRemoteURL_EmptyDir(t *testing.T) {
 	result := paths.GetGitRemoteURL("")
@@ -1,6 +1,9 @@
 package plantmpl
 
-import "fmt"
+import (
+	"fmt"
+	"strings"
+)
 
 // BuildFromTopic creates a PlanPage for a new plan created from a
 // free-text topic title. This is the plan-first workflow where no
@@ -41,15 +44,7 @@ func (p *PlanPage) SectionsJSON() string {
 	for _, sc := range p.Slices {
 		sections = append(sections, fmt.Sprintf(`"slice-%d"`, sc.Num))
 	}
-	result := "["
-	for i, s := range sections {
-		if i > 0 {
-			result += ","
-		}
-		result += s
-	}
-	result += "]"
-	return result
+	return "[" + strings.Join(sections, ",") + "]"
 }
 
 // SliceCount returns the number of slices in the plan.
@@ -3,6 +3,7 @@ package plantmpl
 import (
 	"html/template"
 	"io"
+	"sync"
 )
 
 // DependencyGraph renders the interactive dependency graph zone showing
@@ -20,11 +21,13 @@ type GraphNode struct {
 	Files  int
 }
 
-var depGraphTmpl = template.Must(
-	template.ParseFS(templateFS, "templates/dependency_graph.gohtml"),
-)
+var depGraphTmpl = sync.OnceValue(func() *template.Template {
+	return template.Must(
+		template.ParseFS(templateFS, "templates/dependency_graph.gohtml"),
+	)
+})
 
 // Render writes the dependency graph zone HTML to w.
 func (g *DependencyGraph) Render(w io.Writer) error {
-	return depGraphTmpl.Execute(w, g)
+	return depGraphTmpl().Execute(w, g)
 }
@@ -3,11 +3,14 @@ package plantmpl
 import (
 	"html/template"
 	"io"
+	"sync"
 )
 
-var outlineTmpl = template.Must(
-	template.ParseFS(templateFS, "templates/outline_section.gohtml"),
-)
+var outlineTmpl = sync.OnceValue(func() *template.Template {
+	return template.Must(
+		template.ParseFS(templateFS, "templates/outline_section.gohtml"),
+	)
+})
 
 // OutlineSection renders the plan outline zone containing
 // the high-level implementation plan narrative.
@@ -17,5 +20,5 @@ type OutlineSection struct {
 
 // Render writes the outline section HTML.
 func (o *OutlineSection) Render(w io.Writer) error {
-	return outlineTmpl.Execute(w, o)
+	return outlineTmpl().Execute(w, o)
 }
@@ -13,9 +13,14 @@ import (
 	"embed"
 	"html/template"
 	"io"
+	"sync"
 	texttemplate "text/template"
 )
 
+// Templates are parsed on first use (sync.OnceValue) rather than at package
+// init, so commands that never render a plan — every hook invocation links
+// this package — don't pay for parsing them at startup.
+//
 //go:embed templates/*
 var templateFS embed.FS
 
@@ -49,12 +54,14 @@ func renderSlices(cards []SliceCard) template.HTML {
 //     (including JS comment markers used by runtime HTML patching)
 //   - All dynamic values inserted at the page level are either
 //     pre-rendered template.HTML or known-safe format (SectionsJSON)
-var planPageTmpl = texttemplate.Must(
-	texttemplate.New("plan_page.gohtml").Funcs(texttemplate.FuncMap{
-		"renderZone":   renderZone,
-		"renderSlices": renderSlices,
-	}).ParseFS(templateFS, "templates/plan_page.gohtml"),
-)
+var planPageTmpl = sync.OnceValue(func() *texttemplate.Template {
+	return texttemplate.Must(
+		texttemplate.New("plan_page.gohtml").Funcs(texttemplate.FuncMap{
+			"renderZone":   renderZone,
+			"renderSlices": renderSlices,
+		}).ParseFS(templateFS, "templates/plan_page.gohtml"),
+	)
+})
 
 // Component is anything that can render itself into a plan zone.
 type Component interface {
@@ -138,5 +145,5 @@ func (p *PlanPage) Render(w io.Writer) error {
 	if p.Status == "" {
 		p.Status = "draft"
 	}
-	return planPageTmpl.Execute(w, p)
+	return planPageTmpl().Execute(w, p)
 }
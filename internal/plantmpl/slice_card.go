@@ -3,11 +3,14 @@ package plantmpl
 import (
 	"html/template"
 	"io"
+	"sync"
 )
 
-var sliceCardTmpl = template.Must(
-	template.ParseFS(templateFS, "templates/slice_card.gohtml"),
-)
+var sliceCardTmpl = sync.OnceValue(func() *template.Template {
+	return template.Must(
+		template.ParseFS(templateFS, "templates/slice_card.gohtml"),
+	)
+})
 
 // SliceCard renders a single implementation slice with its metadata,
 // dependencies, and approval status.
@@ -35,7 +38,7 @@ func (sc *SliceCard) HasStructuredContent() bool {
 
 // Render writes the slice card HTML.
 func (sc *SliceCard) Render(w io.Writer) error {
-	return sliceCardTmpl.Execute(w, sc)
+	return sliceCardTmpl().Execute(w, sc)
 }
 
 // EffortClass returns the CSS class for the effort badge.
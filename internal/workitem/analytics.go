@@ -43,11 +43,7 @@ func FindBottlenecks(projectDir string) ([]Bottleneck, error) {
 	if err != nil {
 		return nil, fmt.Errorf("find bottlenecks: %w", err)
 	}
-
-	stale := staleBottlenecks(nodes)
-	overloaded := overloadedTrackBottlenecks(nodes)
-
-	return append(stale, overloaded...), nil
+	return (&Analysis{nodes: nodes}).Bottlenecks(), nil
 }
 
 // RecommendNextWork returns up to 5 suggested todo items, ordered by track
@@ -57,11 +53,49 @@ func RecommendNextWork(projectDir string) ([]Recommendation, error) {
 	if err != nil {
 		return nil, fmt.Errorf("recommend next work: %w", err)
 	}
+	return (&Analysis{nodes: nodes}).Recommendations(), nil
+}
+
+// GetParallelWork returns groups of todo items in the same track that can
+// be worked on simultaneously (no cross-item blocking edges).
+func GetParallelWork(projectDir string) ([]ParallelSet, error) {
+	nodes, err := loadAllNodes(projectDir)
+	if err != nil {
+		return nil, fmt.Errorf("get parallel work: %w", err)
+	}
+	return (&Analysis{nodes: nodes}).ParallelWork(), nil
+}
+
+// Analysis answers the FindBottlenecks, RecommendNextWork and GetParallelWork
+// questions from one load of a project's work items, for callers that need
+// more than one of them and would otherwise reparse every HTML file per call.
+type Analysis struct {
+	nodes []*models.Node
+}
+
+// Analyze loads the feature, bug, spike, and track nodes of projectDir once.
+func Analyze(projectDir string) (*Analysis, error) {
+	nodes, err := loadAllNodes(projectDir)
+	if err != nil {
+		return nil, fmt.Errorf("analyze work items: %w", err)
+	}
+	return &Analysis{nodes: nodes}, nil
+}
+
+// Bottlenecks is FindBottlenecks over the loaded nodes.
+func (a *Analysis) Bottlenecks() []Bottleneck {
+	stale := staleBottlenecks(a.nodes)
+	overloaded := overloadedTrackBottlenecks(a.nodes)
 
-	trackPriority := buildTrackPriorityMap(nodes)
+	return append(stale, overloaded...)
+}
+
+// Recommendations is RecommendNextWork over the loaded nodes.
+func (a *Analysis) Recommendations() []Recommendation {
+	trackPriority := buildTrackPriorityMap(a.nodes)
 	var recs []Recommendation
 
-	for _, n := range nodes {
+	for _, n := range a.nodes {
 		if n.Status != models.StatusTodo || n.Type == "track" {
 			continue
 		}
@@ -80,18 +114,12 @@ func RecommendNextWork(projectDir string) ([]Recommendation, error) {
 	if len(recs) > 5 {
 		recs = recs[:5]
 	}
-	return recs, nil
+	return recs
 }
 
-// GetParallelWork returns groups of todo items in the same track that can
-// be worked on simultaneously (no cross-item blocking edges).
-func GetParallelWork(projectDir string) ([]ParallelSet, error) {
-	nodes, err := loadAllNodes(projectDir)
-	if err != nil {
-		return nil, fmt.Errorf("get parallel work: %w", err)
-	}
-
-	byTrack := groupTodosByTrack(nodes)
+// ParallelWork is GetParallelWork over the loaded nodes.
+func (a *Analysis) ParallelWork() []ParallelSet {
+	byTrack := groupTodosByTrack(a.nodes)
 	var sets []ParallelSet
 
 	for trackID, items := range byTrack {
@@ -104,7 +132,7 @@ func GetParallelWork(projectDir string) ([]ParallelSet, error) {
 	sort.Slice(sets, func(i, j int) bool {
 		return sets[i].TrackID < sets[j].TrackID
 	})
-	return sets, nil
+	return sets
 }
 
 // ---------------------------------------------------------------------------
@@ -134,16 +162,14 @@ const staleThreshold = 72 * time.Hour // 3 days
 
 func staleBottlenecks(nodes []*models.Node) []Bottleneck {
 	now := time.Now().UTC()
+	cutoff := now.Add(-staleThreshold)
 	var out []Bottleneck
 
 	for _, n := range nodes {
-		if n.Status != models.StatusInProgress {
+		if n.Status != models.StatusInProgress || n.UpdatedAt.After(cutoff) {
 			continue
 		}
 		age := now.Sub(n.UpdatedAt)
-		if age < staleThreshold {
-			continue
-		}
 		out = append(out, Bottleneck{
 			ItemID:   n.ID,
 			Title:    n.Title,
@@ -234,17 +260,27 @@ func recommendationReason(n *models.Node, trackPriority map[string]int) string {
 	return "next available todo"
 }
 
+// sortRecommendations orders recs by track priority, then item priority, both
+// descending. The two integer keys are resolved once per item up front so the
+// comparator does no map lookups or string switches.
 func sortRecommendations(recs []Recommendation, trackPriority map[string]int) {
-	sort.Slice(recs, func(i, j int) bool {
-		ti := trackPriority[recs[i].TrackID]
-		tj := trackPriority[recs[j].TrackID]
-		if ti != tj {
-			return ti > tj
+	type keyed struct {
+		rec          Recommendation
+		track, items int
+	}
+	ks := make([]keyed, len(recs))
+	for i, r := range recs {
+		ks[i] = keyed{r, trackPriority[r.TrackID], priorityScore(models.Priority(r.Priority))}
+	}
+	sort.Slice(ks, func(i, j int) bool {
+		if ks[i].track != ks[j].track {
+			return ks[i].track > ks[j].track
 		}
-		pi := priorityScore(models.Priority(recs[i].Priority))
-		pj := priorityScore(models.Priority(recs[j].Priority))
-		return pi > pj
+		return ks[i].items > ks[j].items
 	})
+	for i := range ks {
+		recs[i] = ks[i].rec
+	}
 }
 
 func groupTodosByTrack(nodes []*models.Node) map[string][]*models.Node {
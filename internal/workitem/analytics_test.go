@@ -239,6 +239,40 @@ func TestGetParallelWork_NoTrackItemsExcluded(t *testing.T) {
 	}
 }
 
+// ---------------------------------------------------------------------------
+// Analyze
+// ---------------------------------------------------------------------------
+
+func TestAnalyze_MatchesPerReportFunctions(t *testing.T) {
+	p := newTestProject(t)
+	trackID := "trk-analyze"
+	_, _ = p.Features.Create("Feature A", workitem.FeatWithTrack(trackID))
+	_, _ = p.Features.Create("Feature B", workitem.FeatWithTrack(trackID))
+
+	a, err := workitem.Analyze(p.ProjectDir)
+	if err != nil {
+		t.Fatalf("Analyze: %v", err)
+	}
+	recs, err := workitem.RecommendNextWork(p.ProjectDir)
+	if err != nil {
+		t.Fatalf("RecommendNextWork: %v", err)
+	}
+	sets, err := workitem.GetParallelWork(p.ProjectDir)
+	if err != nil {
+		t.Fatalf("GetParallelWork: %v", err)
+	}
+
+	if got := a.Recommendations(); len(got) != len(recs) {
+		t.Errorf("Recommendations() = %d items, RecommendNextWork = %d", len(got), len(recs))
+	}
+	if got := a.ParallelWork(); len(got) != len(sets) || len(got) != 1 || got[0].TrackID != trackID {
+		t.Errorf("ParallelWork() = %+v, GetParallelWork = %+v", got, sets)
+	}
+	if got := a.Bottlenecks(); len(got) != 0 {
+		t.Errorf("Bottlenecks() = %d, want 0 for fresh todo items", len(got))
+	}
+}
+
 // ---------------------------------------------------------------------------
 // velocityBuckets (package-internal helper tested via exported behaviour)
 // ---------------------------------------------------------------------------
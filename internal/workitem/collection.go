@@ -1,13 +1,14 @@
 package workitem
 
 import (
+	"crypto/rand"
 	"fmt"
 	"os"
 	"path/filepath"
+	"sort"
 	"strings"
 	"time"
 
-	"github.com/google/uuid"
 	"github.com/shakestzd/htmlgraph/internal/graph"
 	"github.com/shakestzd/htmlgraph/internal/htmlparse"
 	"github.com/shakestzd/htmlgraph/internal/models"
@@ -15,6 +16,14 @@ import (
 	dbpkg "github.com/shakestzd/htmlgraph/internal/db"
 )
 
+// NewClaimID returns a fresh claim ID of the form clm-{hex8}, drawn directly
+// from crypto/rand rather than truncating a formatted UUID.
+func NewClaimID() string {
+	b := make([]byte, 4)
+	_, _ = rand.Read(b)
+	return fmt.Sprintf("clm-%x", b)
+}
+
 // FilterFunc is a predicate applied to nodes during queries.
 type FilterFunc func(*models.Node) bool
 
@@ -175,15 +184,16 @@ func (c *Collection) Complete(id string) (*models.Node, error) {
 	if err != nil {
 		return nil, err
 	}
+	now := time.Now().UTC()
 	for i := range node.Steps {
 		if !node.Steps[i].Completed {
 			node.Steps[i].Completed = true
 			node.Steps[i].Agent = c.base.Agent
-			node.Steps[i].Timestamp = time.Now().UTC()
+			node.Steps[i].Timestamp = now
 		}
 	}
 	node.Status = models.StatusDone
-	node.UpdatedAt = time.Now().UTC()
+	node.UpdatedAt = now
 	if _, err := c.writeNode(node); err != nil {
 		return nil, err
 	}
@@ -202,25 +212,37 @@ func (c *Collection) Complete(id string) (*models.Node, error) {
 // It also dual-writes to graph_edges in SQLite when a DB connection is available.
 // HTML is canonical; SQLite errors are non-fatal.
 func (c *Collection) AddEdge(id string, e models.Edge) (*models.Node, error) {
+	return c.AddEdges(id, e)
+}
+
+// AddEdges is AddEdge for several edges on the same node: the node is read and
+// written once however many edges are appended. Callers wiring many edges onto
+// one node (a track's contains edges, say) should collect them and call this
+// once rather than rewriting the file per edge.
+func (c *Collection) AddEdges(id string, edges ...models.Edge) (*models.Node, error) {
 	node, err := c.Get(id)
 	if err != nil {
 		return nil, fmt.Errorf("add edge %s: %w", id, err)
 	}
-	node.AddEdge(e)
+	for _, e := range edges {
+		node.AddEdge(e)
+	}
 	if _, err := c.writeNode(node); err != nil {
 		return nil, fmt.Errorf("add edge %s: %w", id, err)
 	}
 
 	// Dual-write to SQLite read index.
 	if c.base.DB != nil {
-		edgeID := fmt.Sprintf("%s-%s-%s", id, string(e.Relationship), e.TargetID)
-		_ = dbpkg.InsertEdge(
-			c.base.DB,
-			edgeID, id, c.nodeType,
-			e.TargetID, inferNodeType(e.TargetID),
-			string(e.Relationship),
-			e.Properties,
-		)
+		for _, e := range edges {
+			edgeID := fmt.Sprintf("%s-%s-%s", id, string(e.Relationship), e.TargetID)
+			_ = dbpkg.InsertEdge(
+				c.base.DB,
+				edgeID, id, c.nodeType,
+				e.TargetID, inferNodeType(e.TargetID),
+				string(e.Relationship),
+				e.Properties,
+			)
+		}
 	}
 
 	return node, nil
@@ -334,7 +356,7 @@ func (c *Collection) AtomicClaim(id, sessionID string) error {
 	// SQLite-first: use atomic claim if DB is available.
 	if c.base.DB != nil {
 		claim := &models.Claim{
-			ClaimID:          "clm-" + uuid.NewString()[:8],
+			ClaimID:          NewClaimID(),
 			WorkItemID:       id,
 			OwnerSessionID:   sessionID,
 			OwnerAgent:       c.base.Agent,
@@ -383,14 +405,15 @@ func (c *Collection) AddTaskStep(id, taskID, subject string) error {
 		stepDesc = "Task " + taskID
 	}
 
+	now := time.Now().UTC()
 	node.Steps = append(node.Steps, models.Step{
 		StepID:      "task-" + taskID,
 		Description: stepDesc,
 		Completed:   false,
 		Agent:       c.base.Agent,
-		Timestamp:   time.Now().UTC(),
+		Timestamp:   now,
 	})
-	node.UpdatedAt = time.Now().UTC()
+	node.UpdatedAt = now
 
 	if _, err := c.writeNode(node); err != nil {
 		return fmt.Errorf("add task step %s: write: %w", id, err)
@@ -413,12 +436,13 @@ func (c *Collection) CompleteTaskStep(id, taskID string) error {
 	}
 
 	stepID := "task-" + taskID
+	now := time.Now().UTC()
 	modified := false
 	for i := range node.Steps {
 		if node.Steps[i].StepID == stepID && !node.Steps[i].Completed {
 			node.Steps[i].Completed = true
 			node.Steps[i].Agent = c.base.Agent
-			node.Steps[i].Timestamp = time.Now().UTC()
+			node.Steps[i].Timestamp = now
 			modified = true
 			break
 		}
@@ -427,7 +451,7 @@ func (c *Collection) CompleteTaskStep(id, taskID string) error {
 		return nil
 	}
 
-	node.UpdatedAt = time.Now().UTC()
+	node.UpdatedAt = now
 	if _, err := c.writeNode(node); err != nil {
 		return fmt.Errorf("complete task step %s: write: %w", id, err)
 	}
@@ -450,6 +474,28 @@ func countSteps(steps []models.Step) (total, completed int) {
 	return total, completed
 }
 
+// newestFirst returns the limit most recently created nodes, newest first.
+// The common limit of 1 is a single pass over nodes; larger limits sort.
+func newestFirst(nodes []*models.Node, limit int) []*models.Node {
+	if limit == 1 && len(nodes) > 1 {
+		latest := nodes[0]
+		for _, n := range nodes[1:] {
+			if n.CreatedAt.After(latest.CreatedAt) {
+				latest = n
+			}
+		}
+		return []*models.Node{latest}
+	}
+
+	sort.Slice(nodes, func(i, j int) bool {
+		return nodes[i].CreatedAt.After(nodes[j].CreatedAt)
+	})
+	if len(nodes) > limit {
+		nodes = nodes[:limit]
+	}
+	return nodes
+}
+
 // Unclaim removes the claim metadata without changing the node's status.
 // Unlike Release, Unclaim only clears ClaimedAt and ClaimedBySession
 // but preserves AgentAssigned.
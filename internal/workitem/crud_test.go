@@ -185,6 +185,9 @@ func TestFeatureStartComplete(t *testing.T) {
 		if !step.Completed {
 			t.Errorf("step %d not completed after Complete", i)
 		}
+		if !step.Timestamp.Equal(done.UpdatedAt) {
+			t.Errorf("step %d timestamp %v, want node UpdatedAt %v", i, step.Timestamp, done.UpdatedAt)
+		}
 	}
 }
 
@@ -142,11 +142,12 @@ func (e *EditBuilder) Save() error {
 	}
 
 	// Append any pending notes to the content
+	now := time.Now().UTC()
 	if len(e.pendingNotes) > 0 {
-		e.applyNotes()
+		e.applyNotes(now)
 	}
 
-	e.node.UpdatedAt = time.Now().UTC()
+	e.node.UpdatedAt = now
 
 	if _, err := e.collection.writeNode(e.node); err != nil {
 		return fmt.Errorf("edit save: %w", err)
@@ -154,8 +155,8 @@ func (e *EditBuilder) Save() error {
 	return nil
 }
 
-// applyNotes appends all pending notes to the node's content.
-func (e *EditBuilder) applyNotes() {
+// applyNotes appends all pending notes to the node's content, stamped with now.
+func (e *EditBuilder) applyNotes(now time.Time) {
 	var b strings.Builder
 	if e.node.Content != "" {
 		// Wrap existing plain-text content in <p> so it survives
@@ -166,11 +167,11 @@ func (e *EditBuilder) applyNotes() {
 		}
 		b.WriteString(content)
 	}
-	now := time.Now().UTC().Format("2006-01-02 15:04")
+	stamp := now.Format("2006-01-02 15:04")
 	agent := e.collection.base.Agent
 	for _, note := range e.pendingNotes {
 		b.WriteString(fmt.Sprintf(
-			"\n<p><strong>[%s %s]</strong> %s</p>", now, agent, note,
+			"\n<p><strong>[%s %s]</strong> %s</p>", stamp, agent, note,
 		))
 	}
 	e.node.Content = b.String()
@@ -187,7 +188,7 @@ func (c *Collection) AddNote(id, note string) error {
 		return fmt.Errorf("add note %s/%s: %w", c.collectionName, id, err)
 	}
 
-	now := time.Now().UTC().Format("2006-01-02 15:04")
+	now := time.Now().UTC()
 	agent := c.base.Agent
 
 	var b strings.Builder
@@ -201,10 +202,10 @@ func (c *Collection) AddNote(id, note string) error {
 		b.WriteString(content)
 	}
 	b.WriteString(fmt.Sprintf(
-		"\n<p><strong>[%s %s]</strong> %s</p>", now, agent, note,
+		"\n<p><strong>[%s %s]</strong> %s</p>", now.Format("2006-01-02 15:04"), agent, note,
 	))
 	node.Content = b.String()
-	node.UpdatedAt = time.Now().UTC()
+	node.UpdatedAt = now
 
 	if _, err := c.writeNode(node); err != nil {
 		return fmt.Errorf("add note %s/%s: %w", c.collectionName, id, err)
@@ -375,6 +375,31 @@ func TestCollectionAddEdge(t *testing.T) {
 	}
 }
 
+func TestCollectionAddEdges(t *testing.T) {
+	p := newTestProject(t)
+	feat, _ := p.Features.Create("Edge Source")
+	a, _ := p.Features.Create("Target A")
+	b, _ := p.Features.Create("Target B")
+
+	_, err := p.Features.AddEdges(feat.ID,
+		models.Edge{TargetID: a.ID, Relationship: models.RelBlocks, Title: a.Title},
+		models.Edge{TargetID: b.ID, Relationship: models.RelBlocks, Title: b.Title},
+		models.Edge{TargetID: a.ID, Relationship: models.RelRelatesTo, Title: a.Title},
+	)
+	if err != nil {
+		t.Fatalf("AddEdges: %v", err)
+	}
+
+	reread, _ := p.Features.Get(feat.ID)
+	blocks := reread.Edges[string(models.RelBlocks)]
+	if len(blocks) != 2 || blocks[0].TargetID != a.ID || blocks[1].TargetID != b.ID {
+		t.Errorf("blocks edges = %+v, want [%s %s] in order", blocks, a.ID, b.ID)
+	}
+	if len(reread.Edges[string(models.RelRelatesTo)]) != 1 {
+		t.Error("relates_to edge not persisted to disk")
+	}
+}
+
 func TestCollectionRemoveEdge(t *testing.T) {
 	p := newTestProject(t)
 	feat, _ := p.Features.Create("Edge Source")
@@ -55,3 +55,14 @@ func TestGenerateID_AllPrefixes(t *testing.T) {
 		}
 	}
 }
+
+func TestNewClaimID_Format(t *testing.T) {
+	id := NewClaimID()
+	matched, _ := regexp.MatchString(`^clm-[0-9a-f]{8}$`, id)
+	if !matched {
+		t.Errorf("NewClaimID() = %q, want clm-{hex8}", id)
+	}
+	if other := NewClaimID(); other == id {
+		t.Errorf("NewClaimID produced identical IDs: %s", id)
+	}
+}
@@ -3,13 +3,14 @@ package workitem
 import (
 	"bytes"
 	"crypto/rand"
-	"crypto/sha256"
 	"embed"
+	"encoding/hex"
 	"fmt"
 	"html/template"
 	"os"
 	"path/filepath"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/shakestzd/htmlgraph/internal/models"
@@ -38,7 +39,9 @@ var prefixes = map[string]string{
 //
 // Format: {prefix}-{hex8} (e.g., feat-a1b2c3d4)
 //
-// The hash combines: title + UTC timestamp (nanosecond) + 4 random bytes.
+// The suffix is 4 bytes drawn directly from crypto/rand. Hashing them with the
+// title and a timestamp only to keep 4 bytes of the digest added no entropy,
+// so title no longer contributes to the ID.
 func GenerateID(nodeType, title string) string {
 	prefix, ok := prefixes[nodeType]
 	if !ok && len(nodeType) >= 4 {
@@ -47,14 +50,9 @@ func GenerateID(nodeType, title string) string {
 		prefix = nodeType
 	}
 
-	ts := time.Now().UTC().Format(time.RFC3339Nano)
-	entropy := make([]byte, 4)
-	_, _ = rand.Read(entropy) // crypto/rand never errors on supported platforms
-
-	content := append([]byte(fmt.Sprintf("%s:%s", title, ts)), entropy...)
-	hash := sha256.Sum256(content)
-
-	return fmt.Sprintf("%s-%x", prefix, hash[:4])
+	var entropy [4]byte
+	_, _ = rand.Read(entropy[:]) // crypto/rand never errors on supported platforms
+	return prefix + "-" + hex.EncodeToString(entropy[:])
 }
 
 // --- HTML writing ------------------------------------------------------------
@@ -62,9 +60,11 @@ func GenerateID(nodeType, title string) string {
 //go:embed templates/node.gohtml
 var templateFS embed.FS
 
-var nodeTmpl = template.Must(
-	template.ParseFS(templateFS, "templates/node.gohtml"),
-)
+var nodeTmpl = sync.OnceValue(func() *template.Template {
+	return template.Must(
+		template.ParseFS(templateFS, "templates/node.gohtml"),
+	)
+})
 
 // WriteNodeHTML serialises a Node to the canonical HtmlGraph HTML format and
 // writes it to the collection directory.  The output MUST be parseable by
@@ -82,23 +82,30 @@ func WriteNodeHTML(dir string, node *models.Node) (string, error) {
 		return "", fmt.Errorf("render %s: %w", node.ID, err)
 	}
 
-	if err := os.WriteFile(path, []byte(html), 0o644); err != nil {
+	if err := os.WriteFile(path, html, 0o644); err != nil {
 		return "", fmt.Errorf("write %s: %w", path, err)
 	}
 	return path, nil
 }
 
 // renderNodeHTML produces the full HTML document for a node using
-// html/template with an embedded .gohtml template.
-func renderNodeHTML(n *models.Node) (string, error) {
+// html/template with an embedded .gohtml template. The buffer is sized up
+// front for the scaffold plus content and handed to the caller as-is, so the
+// document is never copied into a string and back before it is written.
+func renderNodeHTML(n *models.Node) ([]byte, error) {
 	data := newNodeTemplateData(n)
 	var buf bytes.Buffer
-	if err := nodeTmpl.ExecuteTemplate(&buf, "node.gohtml", data); err != nil {
-		return "", err
+	buf.Grow(nodeHTMLScaffoldSize + len(n.Content))
+	if err := nodeTmpl().ExecuteTemplate(&buf, "node.gohtml", data); err != nil {
+		return nil, err
 	}
-	return buf.String(), nil
+	return buf.Bytes(), nil
 }
 
+// nodeHTMLScaffoldSize approximates the rendered size of node.gohtml without
+// its content section: head, metadata, steps and edges for a typical node.
+const nodeHTMLScaffoldSize = 4 << 10
+
 // nodeTemplateData holds all pre-computed values for the node template.
 // Fields that contain trusted HTML use template.HTML to bypass auto-escaping.
 type nodeTemplateData struct {
@@ -0,0 +1,38 @@
+package workitem
+
+import (
+	"testing"
+	"time"
+
+	"github.com/shakestzd/htmlgraph/internal/models"
+)
+
+func TestNewestFirst(t *testing.T) {
+	base := time.Date(2026, 1, 1, 0, 0, 0, 0, time.UTC)
+	mk := func() []*models.Node {
+		return []*models.Node{
+			{ID: "a", CreatedAt: base.Add(1 * time.Hour)},
+			{ID: "b", CreatedAt: base.Add(3 * time.Hour)},
+			{ID: "c", CreatedAt: base.Add(2 * time.Hour)},
+		}
+	}
+
+	if got := newestFirst(mk(), 1); len(got) != 1 || got[0].ID != "b" {
+		t.Errorf("limit 1: got %v, want [b]", nodeIDs(got))
+	}
+	got := newestFirst(mk(), 2)
+	if len(got) != 2 || got[0].ID != "b" || got[1].ID != "c" {
+		t.Errorf("limit 2: got %v, want [b c]", nodeIDs(got))
+	}
+	if got := newestFirst(nil, 1); len(got) != 0 {
+		t.Errorf("empty input: got %v, want none", nodeIDs(got))
+	}
+}
+
+func nodeIDs(nodes []*models.Node) []string {
+	out := make([]string, len(nodes))
+	for i, n := range nodes {
+		out[i] = n.ID
+	}
+	return out
+}
@@ -126,24 +126,33 @@ func (pc *PlanCollection) writeNode(node *models.Node) (string, error) {
 
 // AddEdge overrides Collection.AddEdge for plans to preserve CRISPI HTML.
 func (pc *PlanCollection) AddEdge(id string, e models.Edge) (*models.Node, error) {
+	return pc.AddEdges(id, e)
+}
+
+// AddEdges overrides Collection.AddEdges for plans to preserve CRISPI HTML.
+func (pc *PlanCollection) AddEdges(id string, edges ...models.Edge) (*models.Node, error) {
 	node, err := pc.Get(id)
 	if err != nil {
 		return nil, fmt.Errorf("add edge %s: %w", id, err)
 	}
-	node.AddEdge(e)
+	for _, e := range edges {
+		node.AddEdge(e)
+	}
 	if _, err := pc.writeNode(node); err != nil {
 		return nil, fmt.Errorf("add edge %s: %w", id, err)
 	}
 
 	if pc.base.DB != nil {
-		edgeID := fmt.Sprintf("%s-%s-%s", id, string(e.Relationship), e.TargetID)
-		_ = dbpkg.InsertEdge(
-			pc.base.DB,
-			edgeID, id, "plan",
-			e.TargetID, inferNodeType(e.TargetID),
-			string(e.Relationship),
-			e.Properties,
-		)
+		for _, e := range edges {
+			edgeID := fmt.Sprintf("%s-%s-%s", id, string(e.Relationship), e.TargetID)
+			_ = dbpkg.InsertEdge(
+				pc.base.DB,
+				edgeID, id, "plan",
+				e.TargetID, inferNodeType(e.TargetID),
+				string(e.Relationship),
+				e.Properties,
+			)
+		}
 	}
 
 	return node, nil
@@ -173,15 +182,16 @@ func (pc *PlanCollection) Complete(id string) (*models.Node, error) {
 	if err != nil {
 		return nil, err
 	}
+	now := time.Now().UTC()
 	for i := range node.Steps {
 		if !node.Steps[i].Completed {
 			node.Steps[i].Completed = true
 			node.Steps[i].Agent = pc.base.Agent
-			node.Steps[i].Timestamp = time.Now().UTC()
+			node.Steps[i].Timestamp = now
 		}
 	}
 	node.Status = models.StatusDone
-	node.UpdatedAt = time.Now().UTC()
+	node.UpdatedAt = now
 	if _, err := pc.writeNode(node); err != nil {
 		return nil, err
 	}
@@ -5,7 +5,6 @@ import (
 	"os"
 	"path/filepath"
 	"regexp"
-	"sort"
 	"strings"
 	"time"
 
@@ -34,14 +33,7 @@ func (sc *SessionCollection) GetLatest(limit int) ([]*models.Node, error) {
 		return nil, fmt.Errorf("list sessions: %w", err)
 	}
 
-	sort.Slice(nodes, func(i, j int) bool {
-		return nodes[i].CreatedAt.After(nodes[j].CreatedAt)
-	})
-
-	if len(nodes) > limit {
-		nodes = nodes[:limit]
-	}
-	return nodes, nil
+	return newestFirst(nodes, limit), nil
 }
 
 // Handoff marks a session as handed off with continuity notes.
@@ -100,6 +92,40 @@ func (sc *SessionCollection) sessionHTMLPath(sessionID string) (string, error) {
 	return "", fmt.Errorf("session HTML not found for %s in %s", sessionID, dir)
 }
 
+// articleOpenTagRe matches the opening <article ...> tag of a session HTML file.
+var articleOpenTagRe = regexp.MustCompile(`(<article[^>]*)>`)
+
+// dataAttrPattern holds the compiled removal and extraction patterns for a
+// single data-* attribute.
+type dataAttrPattern struct {
+	remove  *regexp.Regexp
+	extract *regexp.Regexp
+}
+
+func compileDataAttrPattern(attr string) dataAttrPattern {
+	quoted := regexp.QuoteMeta(attr)
+	return dataAttrPattern{
+		remove:  regexp.MustCompile(` ` + quoted + `="[^"]*"`),
+		extract: regexp.MustCompile(quoted + `="([^"]*)"`),
+	}
+}
+
+// handoffAttrPatterns precompiles the patterns for the attributes Handoff
+// reads and writes, so repeated handoffs don't recompile them per call.
+var handoffAttrPatterns = map[string]dataAttrPattern{
+	"data-handoff-notes": compileDataAttrPattern("data-handoff-notes"),
+	"data-handoff-at":    compileDataAttrPattern("data-handoff-at"),
+}
+
+// dataAttrPatternFor returns the precompiled patterns for attr, compiling
+// them on demand for attributes outside handoffAttrPatterns.
+func dataAttrPatternFor(attr string) dataAttrPattern {
+	if p, ok := handoffAttrPatterns[attr]; ok {
+		return p
+	}
+	return compileDataAttrPattern(attr)
+}
+
 // injectHandoffAttrs adds or replaces data-handoff-notes and data-handoff-at
 // attributes on the <article> element in session HTML.
 func injectHandoffAttrs(html, notes, timestamp string) string {
@@ -114,23 +140,20 @@ func injectHandoffAttrs(html, notes, timestamp string) string {
 	)
 
 	// Append new attributes before the closing `>` of the <article> opening tag.
-	re := regexp.MustCompile(`(<article[^>]*)>`)
-	return re.ReplaceAllStringFunc(html, func(m string) string {
+	return articleOpenTagRe.ReplaceAllStringFunc(html, func(m string) string {
 		return m[:len(m)-1] + inject + ">"
 	})
 }
 
 // removeDataAttr strips a single data-* attribute (with its value) from HTML.
 func removeDataAttr(html, attr string) string {
-	re := regexp.MustCompile(` ` + regexp.QuoteMeta(attr) + `="[^"]*"`)
-	return re.ReplaceAllString(html, "")
+	return dataAttrPatternFor(attr).remove.ReplaceAllString(html, "")
 }
 
 // extractDataAttr reads the value of a data-* attribute from HTML.
 // Returns "" if the attribute is absent.
 func extractDataAttr(html, attr string) string {
-	re := regexp.MustCompile(regexp.QuoteMeta(attr) + `="([^"]*)"`)
-	m := re.FindStringSubmatch(html)
+	m := dataAttrPatternFor(attr).extract.FindStringSubmatch(html)
 	if len(m) < 2 {
 		return ""
 	}
@@ -2,7 +2,6 @@ package workitem
 
 import (
 	"fmt"
-	"sort"
 	"time"
 
 	dbpkg "github.com/shakestzd/htmlgraph/internal/db"
@@ -183,13 +182,5 @@ func (sc *SpikeCollection) GetLatest(agent string, limit int) ([]*models.Node, e
 		nodes = filtered
 	}
 
-	// Sort by created time descending
-	sort.Slice(nodes, func(i, j int) bool {
-		return nodes[i].CreatedAt.After(nodes[j].CreatedAt)
-	})
-
-	if len(nodes) > limit {
-		nodes = nodes[:limit]
-	}
-	return nodes, nil
+	return newestFirst(nodes, limit), nil
 }
@@ -190,7 +190,10 @@ if [ -n "${PATH_BINARY}" ]; then
     _real_path="$(cd "$(dirname "${PATH_BINARY}")" && pwd)/$(basename "${PATH_BINARY}")"
     _self_path="${SCRIPT_DIR}/$(basename "$0")"
 
-    if [ "${_real_path}" != "${_self_path}" ]; then
+    # When the PATH binary is the cached install itself, skip the
+    # "htmlgraph version" probe (a full fork+exec on every hook) and let the
+    # fast path below compare the version file instead.
+    if [ "${_real_path}" != "${_self_path}" ] && [ "${_real_path}" != "${BINARY}" ]; then
         # Check version matches expected
         _path_ver="$("${PATH_BINARY}" version 2>/dev/null | grep -o '[0-9][0-9]*\.[0-9][0-9]*\.[0-9][0-9]*' | head -1 || true)"
         if [ "${_path_ver}" = "${EXPECTED_VERSION}" ]; then
@@ -201,7 +204,9 @@ fi
 
 # Fast path: binary exists and version matches.
 if [ -x "${BINARY}" ] && [ -f "${VERSION_FILE}" ]; then
-    CACHED_VERSION="$(cat "${VERSION_FILE}" 2>/dev/null || echo "")"
+    # read is a shell builtin — no subshell or cat fork on the hot path.
+    CACHED_VERSION=""
+    IFS= read -r CACHED_VERSION < "${VERSION_FILE}" 2>/dev/null || true
     if [ "${CACHED_VERSION}" = "${EXPECTED_VERSION}" ]; then
         exec "${BINARY}" "$@"
     fi